@@ -0,0 +1,115 @@
+# benchmarks/bench_coldstart.py (콜드 스타트 import/초기화 시간 측정)
+"""새 Python 프로세스에서 lambda_function import 시간과 AWS 클라이언트 초기화 시간 측정
+
+매 실행마다 새 인터프리터를 띄워 Lambda 콜드 스타트와 같은 조건(모듈 캐시 없음)에서 측정하고 중앙값을 출력합니다.
+--ref로 git 리비전을 지정하면 해당 리비전의 lambda_function.py도 같은 방법으로 측정하여 비교합니다.
+
+사용법:
+    python benchmarks/bench_coldstart.py                    # 현재 코드 측정
+    python benchmarks/bench_coldstart.py --ref HEAD~1       # 이전 리비전과 비교
+    python benchmarks/bench_coldstart.py --runs 20 --top 10 # 반복 횟수, import 시간 상위 모듈 출력
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# lambda_function 모듈 로딩에 필요한 필수 환경 변수 (AWS 호출은 하지 않음)
+BENCH_ENV = {
+    'SLACK_WEBHOOK': 'https://hooks.slack.com/benchmark',
+    'AWS_REGION': 'ap-northeast-2',
+    'AWS_DEFAULT_REGION': 'ap-northeast-2',
+    'DYNAMODB_TABLE': 'ProcessedNews',
+    'BEDROCK_MODEL_ID': 'anthropic.claude-3-haiku-20240307-v1:0',
+}
+
+# 새 뉴스가 없는 실행에서는 필요 없는 무거운 의존성
+HEAVY_MODULES = ('feedparser', 'bs4', 'lxml.etree')
+
+# 자식 프로세스에서 실행하는 측정 코드
+CHILD_CODE = '''
+import json, sys, time
+start = time.perf_counter()
+import lambda_function
+imported = time.perf_counter()
+lambda_function.initialize_aws_clients()
+initialized = time.perf_counter()
+print(json.dumps({
+    'import_ms': (imported - start) * 1000,
+    'init_ms': (initialized - imported) * 1000,
+    'modules': [name for name in sys.argv[1:] if name in sys.modules],
+}))
+'''
+
+
+def run_child(directory, extra_args=()):
+    """새 인터프리터에서 측정 코드 실행"""
+    env = dict(os.environ, **BENCH_ENV)
+    result = subprocess.run(
+        [sys.executable, *extra_args, '-c', CHILD_CODE, *HEAVY_MODULES],
+        cwd=directory, env=env, capture_output=True, text=True, check=True
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1]), result.stderr
+
+
+def measure(directory, runs):
+    """runs회 측정 후 import/초기화 시간 중앙값과 로드된 무거운 모듈 반환"""
+    samples = [run_child(directory)[0] for _ in range(runs)]
+    return {
+        'import_ms': statistics.median(sample['import_ms'] for sample in samples),
+        'init_ms': statistics.median(sample['init_ms'] for sample in samples),
+        'modules': samples[-1]['modules'],
+    }
+
+
+def top_imports(directory, count):
+    """python -X importtime 결과에서 누적 import 시간 상위 최상위 모듈 반환"""
+    _, stderr = run_child(directory, ('-X', 'importtime'))
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or '|' not in line:
+            continue
+        _, cumulative, name = [part.strip() for part in line[len('import time:'):].split('|')]
+        if cumulative.isdigit() and not name.startswith(' ') and '.' not in name:
+            entries.append((int(cumulative) / 1000, name))
+    return sorted(entries, reverse=True)[:count]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=10, help='측정 반복 횟수 (중앙값 사용)')
+    parser.add_argument('--ref', help='비교할 git 리비전 (예: HEAD~1, main)')
+    parser.add_argument('--top', type=int, default=0, help='import 시간 상위 모듈 출력 개수')
+    args = parser.parse_args()
+
+    targets = [('current', REPO_ROOT)]
+    with tempfile.TemporaryDirectory() as tmpdir:
+        if args.ref:
+            source = subprocess.run(
+                ['git', 'show', f'{args.ref}:lambda_function.py'],
+                cwd=REPO_ROOT, capture_output=True, text=True, check=True
+            ).stdout
+            with open(os.path.join(tmpdir, 'lambda_function.py'), 'w', encoding='utf-8') as fh:
+                fh.write(source)
+            targets.append((args.ref, tmpdir))
+
+        print(f"{'target':<16}{'import(ms)':>12}{'init(ms)':>10}{'total(ms)':>11}  heavy modules loaded")
+        for name, directory in targets:
+            result = measure(directory, args.runs)
+            total = result['import_ms'] + result['init_ms']
+            print(f"{name[:15]:<16}{result['import_ms']:>12.1f}{result['init_ms']:>10.1f}{total:>11.1f}  "
+                  f"{', '.join(result['modules']) or '-'}")
+
+        for name, directory in targets if args.top else ():
+            print(f"\n[{name}] import 시간 상위 모듈 (누적 ms)")
+            for cumulative_ms, module in top_imports(directory, args.top):
+                print(f"  {module:<24}{cumulative_ms:>8.1f}")
+
+
+if __name__ == '__main__':
+    main()
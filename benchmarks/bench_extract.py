@@ -0,0 +1,96 @@
+# benchmarks/bench_extract.py (본문 추출 엔진 벤치마크)
+"""본문 추출 엔진별 페이지당 CPU 시간과 최대 메모리 사용량 비교
+
+사용법:
+    python benchmarks/bench_extract.py                  # 합성 AWS What's New 페이지로 측정
+    python benchmarks/bench_extract.py page1.html ...   # 저장한 실제 페이지로 측정
+    python benchmarks/bench_extract.py --iterations 50
+"""
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+# lambda_function 모듈 로딩에 필요한 필수 환경 변수 (측정에는 사용되지 않음)
+for key, value in {
+    'SLACK_WEBHOOK': 'https://hooks.slack.com/benchmark',
+    'AWS_REGION': 'ap-northeast-2',
+    'DYNAMODB_TABLE': 'ProcessedNews',
+    'BEDROCK_MODEL_ID': 'anthropic.claude-3-haiku-20240307-v1:0',
+}.items():
+    os.environ.setdefault(key, value)
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import lambda_function  # noqa: E402
+
+
+def build_sample_page(paragraphs=200):
+    """AWS What's New 페이지 구조를 흉내 낸 합성 HTML 생성"""
+    navigation = ''.join(
+        f'<li><a href="/products/{i}/">Product category {i}</a></li>' for i in range(300)
+    )
+    body = ''.join(
+        f'<p>Amazon Example Service now supports feature {i}. '
+        f'This update helps customers build faster and reduce cost in every AWS Region.</p>'
+        for i in range(paragraphs)
+    )
+    footer = ''.join(f'<a href="/legal/{i}/">Footer link {i}</a>' for i in range(500))
+    return (
+        '<!DOCTYPE html><html lang="en"><head><meta charset="utf-8">'
+        '<title>Amazon Example Service announces new feature</title>'
+        '<script>window.dataLayer = [];</script><style>body { margin: 0; }</style></head>'
+        f'<body><header><nav><ul>{navigation}</ul></nav></header>'
+        '<main><div class="content"><h1>Amazon Example Service announces new feature</h1>'
+        f'<p>Posted On: Jan 1, 2024</p>{body}</div></main>'
+        f'<footer>{footer}</footer></body></html>'
+    ).encode('utf-8')
+
+
+def measure(extract, content, iterations):
+    """페이지당 평균 CPU 시간(ms)과 최대 메모리(KB) 측정"""
+    extract(content)  # 워밍업
+
+    start = time.process_time()
+    for _ in range(iterations):
+        extract(content)
+    cpu_ms = (time.process_time() - start) * 1000 / iterations
+
+    tracemalloc.start()
+    extract(content)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return cpu_ms, peak / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('pages', nargs='*', help='측정할 HTML 파일 경로')
+    parser.add_argument('--iterations', type=int, default=20, help='페이지당 반복 횟수')
+    args = parser.parse_args()
+
+    if args.pages:
+        pages = []
+        for path in args.pages:
+            with open(path, 'rb') as fh:
+                pages.append((os.path.basename(path), fh.read()))
+    else:
+        pages = [('synthetic', build_sample_page())]
+
+    backends = {
+        'bs4': lambda_function.extract_text_with_bs4,
+        'lxml': lambda_function.extract_text_with_lxml,
+    }
+
+    print(f"{'page':<24}{'backend':<10}{'size(KB)':>10}{'cpu(ms)':>10}{'peak(KB)':>10}")
+    for name, content in pages:
+        reference = backends['bs4'](content)[:lambda_function.CONTENT_MAX_LENGTH]
+        for backend, extract in backends.items():
+            cpu_ms, peak_kb = measure(extract, content, args.iterations)
+            same = extract(content)[:lambda_function.CONTENT_MAX_LENGTH] == reference
+            print(f"{name[:23]:<24}{backend:<10}{len(content) / 1024:>10.1f}{cpu_ms:>10.2f}{peak_kb:>10.1f}"
+                  f"{'' if same else '  (결과가 bs4와 다름)'}")
+
+
+if __name__ == '__main__':
+    main()
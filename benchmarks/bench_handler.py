@@ -0,0 +1,432 @@
+# benchmarks/bench_handler.py (lambda_handler 전체 흐름 부하 시뮬레이션)
+"""로컬 가짜 서비스로 lambda_handler 전체 흐름을 실행하여 시나리오별 성능 측정
+
+RSS 피드/뉴스 페이지/Slack Webhook은 로컬 HTTP 서버가, Bedrock과 DynamoDB는 메모리 내 가짜 구현이 대신합니다.
+시나리오마다 실행 시간, 처리량(Slack 전송 뉴스/초), 최대 메모리, API 호출 수를 출력하며,
+전송/미룸 수가 기대와 다른 시나리오(deadline 외 시나리오에서 미룬 뉴스 발생 등)가 있으면 실패로 종료합니다.
+
+사용법:
+    python benchmarks/bench_handler.py                              # 모든 시나리오 실행
+    python benchmarks/bench_handler.py --scenario throttled         # 특정 시나리오만 실행
+    python benchmarks/bench_handler.py --items 100 --pages-dir saved_pages/
+    python benchmarks/bench_handler.py --json results.json          # 결과를 JSON으로 저장 (배포 전 비교용)
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import random
+import sys
+import threading
+import time
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# lambda_function 모듈 로딩에 필요한 필수 환경 변수 (Slack/Bedrock/DynamoDB는 가짜 구현으로 대체)
+for key, value in {
+    'SLACK_WEBHOOK': 'https://hooks.slack.com/benchmark',
+    'AWS_REGION': 'ap-northeast-2',
+    'DYNAMODB_TABLE': 'ProcessedNews',
+    'BEDROCK_MODEL_ID': 'anthropic.claude-3-haiku-20240307-v1:0',
+    'METRICS_ENABLED': 'false',
+}.items():
+    os.environ.setdefault(key, value)
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import lambda_function  # noqa: E402
+from bench_extract import build_sample_page  # noqa: E402
+from botocore.exceptions import ClientError  # noqa: E402
+
+# 시나리오별 설정 (기본값은 DEFAULT_SCENARIO)
+DEFAULT_SCENARIO = {
+    'items': 50,
+    'page_latency': 0.02,
+    'slow_ratio': 0.0,
+    'slow_latency': 1.5,
+    'bedrock_latency': 0.2,
+    'throttle_rate': 0.0,
+    'slack_429_rate': 0.0,
+    'batch_size': 1,
+    'streaming': False,
+    'execution_mode': 'thread',
+    'rpm': 0,
+    'tpm': 0,
+    'timeout': 300,
+    'expect_deferred': False,
+}
+SCENARIOS = {
+    'baseline': {},
+    'slow-pages': {'slow_ratio': 0.2},
+    'throttled': {'throttle_rate': 0.3},
+    'batched': {'batch_size': lambda_function.BEDROCK_BATCH_SIZE_MAX},
+    'streaming': {'streaming': True},
+    'async': {'execution_mode': 'async'},
+    'deadline': {'bedrock_latency': 1.0, 'timeout': 35, 'expect_deferred': True},
+}
+
+FAKE_SUMMARY = (
+    "🎉 Amazon Example Service 신규 기능 출시\n🗓 2024년 1월 1일\n\n"
+    "Amazon Example Service가 새로운 기능을 지원합니다. 더 빠르고 저렴하게 워크로드를 구축할 수 있습니다.\n\n"
+    "✨ 주요 특징\n1️⃣ 성능 향상\n- 처리 속도가 빨라집니다\n2️⃣ 비용 절감\n- 사용한 만큼만 비용을 냅니다\n\n"
+    "🔗 자세히 보기: https://aws.amazon.com/"
+)
+
+
+class Counter:
+    """스레드 안전 호출 횟수 집계"""
+
+    def __init__(self):
+        self.counts = {}
+        self.lock = threading.Lock()
+
+    def add(self, name, value=1):
+        with self.lock:
+            self.counts[name] = self.counts.get(name, 0) + value
+
+
+class FakeServer:
+    """합성 RSS 피드, 뉴스 페이지, Slack Webhook을 제공하는 로컬 HTTP 서버"""
+
+    def __init__(self, scenario, pages, counter, rng):
+        self.scenario = scenario
+        self.pages = pages
+        self.counter = counter
+        self.rng = rng
+        self.rng_lock = threading.Lock()
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), self._handler_class())
+        self.base_url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def chance(self, rate):
+        with self.rng_lock:
+            return self.rng.random() < rate
+
+    def feed_xml(self):
+        now = datetime.now(timezone.utc)
+        entries = ''.join(
+            f"<item><title>Amazon Example Service feature {i}</title>"
+            f"<link>{self.base_url}/news/{i}/</link>"
+            f"<pubDate>{format_datetime(now - timedelta(minutes=i))}</pubDate></item>"
+            for i in range(self.scenario['items'])
+        )
+        return (
+            '<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel>'
+            f"<title>AWS What's New (benchmark)</title>{entries}</channel></rss>"
+        ).encode('utf-8')
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                pass
+
+            def _reply(self, status, body=b'', content_type='text/plain', headers=None):
+                self.send_response(status)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_GET(self):
+                if self.path == '/feed.xml':
+                    server.counter.add('feed_get')
+                    self._reply(200, server.feed_xml(), 'application/rss+xml')
+                elif self.path.startswith('/news/'):
+                    server.counter.add('page_get')
+                    slow = server.chance(server.scenario['slow_ratio'])
+                    time.sleep(server.scenario['slow_latency'] if slow else server.scenario['page_latency'])
+                    index = int(self.path.strip('/').split('/')[-1])
+                    self._reply(200, server.pages[index % len(server.pages)], 'text/html; charset=utf-8')
+                else:
+                    self._reply(404)
+
+            def do_POST(self):
+                self.rfile.read(int(self.headers.get('Content-Length', 0)))
+                if self.path != '/slack':
+                    self._reply(404)
+                elif server.chance(server.scenario['slack_429_rate']):
+                    server.counter.add('slack_429')
+                    self._reply(429, b'rate_limited', headers={'Retry-After': '1'})
+                else:
+                    server.counter.add('slack_post')
+                    self._reply(200, b'ok')
+
+        return Handler
+
+
+class FakeStream:
+    """invoke_model_with_response_stream 응답 body (이벤트 반복, close 지원)"""
+
+    def __init__(self, events):
+        self.events = events
+        self.closed = False
+
+    def __iter__(self):
+        for event in self.events:
+            if self.closed:
+                return
+            yield event
+
+    def close(self):
+        self.closed = True
+
+
+class FakeBedrockRuntime:
+    """지연 시간과 스로틀링 비율을 설정할 수 있는 Bedrock Runtime 가짜 구현"""
+
+    def __init__(self, scenario, counter, rng):
+        self.scenario = scenario
+        self.counter = counter
+        self.rng = rng
+        self.lock = threading.Lock()
+
+    def _call(self, body):
+        self.counter.add('bedrock_invoke')
+        with self.lock:
+            throttled = self.rng.random() < self.scenario['throttle_rate']
+        if throttled:
+            self.counter.add('bedrock_throttle')
+            raise ClientError({'Error': {'Code': 'ThrottlingException', 'Message': 'Rate exceeded'}}, 'InvokeModel')
+        time.sleep(self.scenario['bedrock_latency'])
+
+        prompt = json.loads(body)['messages'][0]['content']
+        count = prompt.count('[뉴스 ')
+        if count:
+            text = json.dumps([{'id': i, 'summary': FAKE_SUMMARY} for i in range(1, count + 1)], ensure_ascii=False)
+        else:
+            text = FAKE_SUMMARY
+        usage = {'input_tokens': lambda_function.estimate_tokens(prompt), 'output_tokens': lambda_function.estimate_tokens(text)}
+        return text, usage
+
+    def invoke_model(self, modelId, body, contentType):
+        text, usage = self._call(body)
+        payload = {'content': [{'type': 'text', 'text': text}], 'usage': usage}
+        return {'body': io.BytesIO(json.dumps(payload).encode('utf-8'))}
+
+    def invoke_model_with_response_stream(self, modelId, body, contentType):
+        text, usage = self._call(body)
+
+        def event(payload):
+            return {'chunk': {'bytes': json.dumps(payload).encode('utf-8')}}
+
+        events = [event({'type': 'message_start', 'message': {'usage': {'input_tokens': usage['input_tokens']}}})]
+        events += [
+            event({'type': 'content_block_delta', 'delta': {'type': 'text_delta', 'text': text[start:start + 40]}})
+            for start in range(0, len(text), 40)
+        ]
+        events.append(event({'type': 'message_delta', 'usage': {'output_tokens': usage['output_tokens']}}))
+        events.append(event({'type': 'message_stop'}))
+        return {'body': FakeStream(events)}
+
+
+class InMemoryTable:
+    """DynamoDB Table 리소스 가짜 구현 (get_item/put_item/scan)"""
+
+    def __init__(self, counter):
+        self.items = {}
+        self.counter = counter
+        self.lock = threading.Lock()
+
+    def get_item(self, Key, ConsistentRead=False, **kwargs):
+        self.counter.add('dynamodb_get_item')
+        with self.lock:
+            item = self.items.get(Key['id'])
+        return {'Item': dict(item)} if item else {}
+
+    def put_item(self, Item):
+        self.counter.add('dynamodb_put_item')
+        with self.lock:
+            self.items[Item['id']] = dict(Item)
+        return {}
+
+    def scan(self, Limit=None, **kwargs):
+        self.counter.add('dynamodb_scan')
+        with self.lock:
+            return {'Count': min(len(self.items), Limit or len(self.items))}
+
+
+class InMemoryDynamoDB:
+    """DynamoDB 서비스 리소스 가짜 구현 (Table/batch_get_item/batch_write_item)"""
+
+    def __init__(self, counter):
+        self.counter = counter
+        self.table = InMemoryTable(counter)
+
+    def Table(self, name):
+        return self.table
+
+    def batch_get_item(self, RequestItems):
+        self.counter.add('dynamodb_batch_get')
+        responses = {}
+        for name, request in RequestItems.items():
+            with self.table.lock:
+                responses[name] = [
+                    {'id': key['id']} for key in request['Keys'] if key['id'] in self.table.items
+                ]
+        return {'Responses': responses, 'UnprocessedKeys': {}}
+
+    def batch_write_item(self, RequestItems):
+        self.counter.add('dynamodb_batch_write')
+        for requests in RequestItems.values():
+            for request in requests:
+                item = request['PutRequest']['Item']
+                with self.table.lock:
+                    self.table.items[item['id']] = dict(item)
+        return {'UnprocessedItems': {}}
+
+
+class FakeContext:
+    """Lambda context 가짜 구현 (남은 실행 시간은 시나리오 타임아웃 기준)"""
+
+    function_name = 'aws-news-to-slack-benchmark'
+
+    def __init__(self, timeout):
+        self.deadline = time.monotonic() + timeout
+
+    def get_remaining_time_in_millis(self):
+        return max(0, int((self.deadline - time.monotonic()) * 1000))
+
+
+@contextlib.contextmanager
+def patched_module(**attributes):
+    """lambda_function 모듈 전역 값을 잠시 바꾸고 복원"""
+    original = {name: getattr(lambda_function, name) for name in attributes}
+    for name, value in attributes.items():
+        setattr(lambda_function, name, value)
+    try:
+        yield
+    finally:
+        for name, value in original.items():
+            setattr(lambda_function, name, value)
+
+
+def run_scenario(name, scenario, pages, seed, verbose=False):
+    """시나리오 하나를 실행하고 측정 결과 반환"""
+    counter = Counter()
+    rng = random.Random(seed)
+    dynamodb = InMemoryDynamoDB(counter)
+
+    with FakeServer(scenario, pages, counter, rng) as server:
+        feed_url = f"{server.base_url}/feed.xml"
+        # 초기 실행이 아니도록 실행 상태를 미리 기록 (피드의 모든 뉴스가 새 뉴스)
+        dynamodb.table.items[lambda_function.FEED_STATE_ID] = {
+            'id': lambda_function.FEED_STATE_ID,
+            'initialized_at': '2024-01-01T00:00:00',
+            'feeds': {feed_url: {'high_water_mark': '2000-01-01T00:00:00'}},
+        }
+
+        with patched_module(
+            dynamodb=dynamodb,
+            table=dynamodb.table,
+            bedrock_runtime=FakeBedrockRuntime(scenario, counter, rng),
+            bedrock_rate_limiter=lambda_function.BedrockRateLimiter(scenario['rpm'], scenario['tpm']),
+            BEDROCK_MAX_RPM=scenario['rpm'],
+            BEDROCK_MAX_TPM=scenario['tpm'],
+            RSS_FEED_URLS=[feed_url],
+            SLACK_WEBHOOK=f"{server.base_url}/slack",
+            BEDROCK_BATCH_SIZE=scenario['batch_size'],
+            BEDROCK_STREAMING=scenario['streaming'],
+            EXECUTION_MODE=scenario['execution_mode'],
+            METRICS_ENABLED=False,
+            http_session=None,
+            summary_cache=lambda_function.OrderedDict(),
+            recent_news_ids=lambda_function.OrderedDict(),
+            # 단계별 소요 시간 추정은 가짜 서비스 지연으로 시작 (실제 기본값이면 모든 시나리오에서 뉴스가 미뤄짐)
+            stage_latency={'fetch': scenario['page_latency'], 'summarize': scenario['bedrock_latency']},
+        ):
+            output = io.StringIO()
+            tracemalloc.start()
+            start = time.perf_counter()
+            with contextlib.redirect_stdout(sys.stdout if verbose else output):
+                result = lambda_function.lambda_handler({}, FakeContext(scenario['timeout']))
+            elapsed = time.perf_counter() - start
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            summary = lambda_function.run_metrics.summary()
+
+    counters = summary['counters']
+    delivered = counters.get('slack_success', 0)
+    deferred = counters.get('deferred', 0)
+    return {
+        'scenario': name,
+        'status': result['statusCode'],
+        'seconds': round(elapsed, 2),
+        'items': scenario['items'],
+        'delivered': delivered,
+        'deferred': deferred,
+        # 모든 뉴스가 전송되거나 미뤄졌고, 미뤄진 뉴스 유무가 시나리오 기대와 같은지
+        'ok': delivered + deferred == scenario['items'] and bool(deferred) == scenario['expect_deferred'],
+        'throughput': round(delivered / elapsed, 2) if elapsed else 0,
+        'peak_kb': round(peak / 1024),
+        'calls': dict(sorted(counter.counts.items())),
+        'tokens': {
+            'input': counters.get('bedrock_input_tokens', 0),
+            'output': counters.get('bedrock_output_tokens', 0),
+        },
+        'stages': summary['stages'],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--scenario', action='append', choices=sorted(SCENARIOS), help='실행할 시나리오 (반복 지정 가능)')
+    parser.add_argument('--items', type=int, help='피드의 뉴스 수 (시나리오 설정 덮어쓰기)')
+    parser.add_argument('--pages-dir', help='뉴스 페이지로 제공할 저장된 HTML 파일 디렉터리')
+    parser.add_argument('--seed', type=int, default=1, help='스로틀링/지연 난수 시드')
+    parser.add_argument('--json', help='결과를 저장할 JSON 파일 경로')
+    parser.add_argument('--verbose', action='store_true', help='lambda_handler 로그 출력')
+    args = parser.parse_args()
+
+    if args.pages_dir:
+        pages = []
+        for filename in sorted(os.listdir(args.pages_dir)):
+            if filename.endswith('.html'):
+                with open(os.path.join(args.pages_dir, filename), 'rb') as fh:
+                    pages.append(fh.read())
+    else:
+        pages = [build_sample_page()]
+
+    results = []
+    print(f"{'scenario':<12}{'status':>7}{'time(s)':>9}{'sent':>6}{'deferred':>10}{'items/s':>9}"
+          f"{'peak(KB)':>10}{'bedrock':>9}{'throttle':>10}{'slack':>7}{'pages':>7}{'check':>7}")
+    for name in args.scenario or list(SCENARIOS):
+        scenario = dict(DEFAULT_SCENARIO, **SCENARIOS[name])
+        if args.items:
+            scenario['items'] = args.items
+        result = run_scenario(name, scenario, pages, args.seed, args.verbose)
+        results.append(result)
+        calls = result['calls']
+        print(f"{name:<12}{result['status']:>7}{result['seconds']:>9.2f}{result['delivered']:>6}{result['deferred']:>10}"
+              f"{result['throughput']:>9.2f}{result['peak_kb']:>10}{calls.get('bedrock_invoke', 0):>9}"
+              f"{calls.get('bedrock_throttle', 0):>10}{calls.get('slack_post', 0):>7}{calls.get('page_get', 0):>7}"
+              f"{'ok' if result['ok'] else 'FAIL':>7}")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as fh:
+            json.dump(results, fh, ensure_ascii=False, indent=2)
+        print(f"결과 저장: {args.json}")
+
+    failed = [result['scenario'] for result in results if not result['ok']]
+    if failed:
+        # 전송 수가 기대와 다르면 처리량 비교가 의미 없으므로 실패로 종료
+        print(f"[WARN] 전송/미룸 수가 기대와 다른 시나리오: {', '.join(failed)}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
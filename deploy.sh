@@ -40,7 +40,7 @@ pip install -r requirements.txt -t . --upgrade
 
 # 배포 패키지 생성
 echo -e "${YELLOW}📦 배포 패키지 생성 중...${NC}"
-zip -r ${FUNCTION_NAME}.zip . -x "*.git*" "*.md" "*.drawio" "*.sh" "__pycache__/*" "*.pyc"
+zip -r ${FUNCTION_NAME}.zip . -x "*.git*" "*.md" "*.drawio" "*.sh" "__pycache__/*" "*.pyc" "benchmarks/*"
 
 # Lambda 함수 존재 여부 확인
 echo -e "${YELLOW}🔍 Lambda 함수 존재 여부 확인 중...${NC}"
@@ -50,6 +50,15 @@ if aws lambda get-function --function-name $FUNCTION_NAME --region $REGION &> /d
         --function-name $FUNCTION_NAME \
         --zip-file fileb://${FUNCTION_NAME}.zip \
         --region $REGION
+    
+    # fan-out 모드 worker 함수도 같은 코드로 업데이트 (CloudFormation 자리표시 코드가 메시지를 처리하지 않도록)
+    if aws lambda get-function --function-name ${FUNCTION_NAME}-worker --region $REGION &> /dev/null; then
+        echo -e "${YELLOW}🔄 fan-out worker 함수 업데이트 중...${NC}"
+        aws lambda update-function-code \
+            --function-name ${FUNCTION_NAME}-worker \
+            --zip-file fileb://${FUNCTION_NAME}.zip \
+            --region $REGION
+    fi
 else
     echo -e "${YELLOW}🆕 새 Lambda 함수 생성 중...${NC}"
     
@@ -96,10 +105,34 @@ if [ ! -z "$MAX_SLACK_LENGTH_OVERRIDE" ]; then
     ENV_VARS="$ENV_VARS,MAX_SLACK_LENGTH=$MAX_SLACK_LENGTH_OVERRIDE"
 fi
 
+if [ ! -z "$RSS_FEED_URLS_OVERRIDE" ]; then
+    ENV_VARS="$ENV_VARS,RSS_FEED_URLS=$RSS_FEED_URLS_OVERRIDE"
+fi
+
 if [ ! -z "$CONTENT_MAX_LENGTH_OVERRIDE" ]; then
     ENV_VARS="$ENV_VARS,CONTENT_MAX_LENGTH=$CONTENT_MAX_LENGTH_OVERRIDE"
 fi
 
+if [ ! -z "$CONTENT_MAX_TOKENS_OVERRIDE" ]; then
+    ENV_VARS="$ENV_VARS,CONTENT_MAX_TOKENS=$CONTENT_MAX_TOKENS_OVERRIDE"
+fi
+
+if [ ! -z "$PROCESSED_TTL_DAYS_OVERRIDE" ]; then
+    ENV_VARS="$ENV_VARS,PROCESSED_TTL_DAYS=$PROCESSED_TTL_DAYS_OVERRIDE"
+fi
+
+if [ ! -z "$NEWS_ARCHIVE_TTL_DAYS_OVERRIDE" ]; then
+    ENV_VARS="$ENV_VARS,NEWS_ARCHIVE_TTL_DAYS=$NEWS_ARCHIVE_TTL_DAYS_OVERRIDE"
+fi
+
+if [ ! -z "$RECENT_IDS_MAX_OVERRIDE" ]; then
+    ENV_VARS="$ENV_VARS,RECENT_IDS_MAX=$RECENT_IDS_MAX_OVERRIDE"
+fi
+
+if [ ! -z "$EXECUTION_MODE_OVERRIDE" ]; then
+    ENV_VARS="$ENV_VARS,EXECUTION_MODE=$EXECUTION_MODE_OVERRIDE"
+fi
+
 if [ ! -z "$REQUEST_TIMEOUT_OVERRIDE" ]; then
     ENV_VARS="$ENV_VARS,REQUEST_TIMEOUT=$REQUEST_TIMEOUT_OVERRIDE"
 fi
@@ -108,6 +141,62 @@ if [ ! -z "$PROCESSING_DELAY_OVERRIDE" ]; then
     ENV_VARS="$ENV_VARS,PROCESSING_DELAY=$PROCESSING_DELAY_OVERRIDE"
 fi
 
+if [ ! -z "$FETCH_CONCURRENCY_OVERRIDE" ]; then
+    ENV_VARS="$ENV_VARS,FETCH_CONCURRENCY=$FETCH_CONCURRENCY_OVERRIDE"
+fi
+
+if [ ! -z "$BEDROCK_CONCURRENCY_OVERRIDE" ]; then
+    ENV_VARS="$ENV_VARS,BEDROCK_CONCURRENCY=$BEDROCK_CONCURRENCY_OVERRIDE"
+fi
+
+if [ ! -z "$BEDROCK_MAX_RPM_OVERRIDE" ]; then
+    ENV_VARS="$ENV_VARS,BEDROCK_MAX_RPM=$BEDROCK_MAX_RPM_OVERRIDE"
+fi
+
+if [ ! -z "$BEDROCK_MAX_TPM_OVERRIDE" ]; then
+    ENV_VARS="$ENV_VARS,BEDROCK_MAX_TPM=$BEDROCK_MAX_TPM_OVERRIDE"
+fi
+
+if [ ! -z "$BEDROCK_STREAMING_OVERRIDE" ]; then
+    ENV_VARS="$ENV_VARS,BEDROCK_STREAMING=$BEDROCK_STREAMING_OVERRIDE"
+fi
+
+if [ ! -z "$BEDROCK_BATCH_SIZE_OVERRIDE" ]; then
+    ENV_VARS="$ENV_VARS,BEDROCK_BATCH_SIZE=$BEDROCK_BATCH_SIZE_OVERRIDE"
+fi
+
+if [ ! -z "$SLACK_DELIVERY_MODE_OVERRIDE" ]; then
+    ENV_VARS="$ENV_VARS,SLACK_DELIVERY_MODE=$SLACK_DELIVERY_MODE_OVERRIDE"
+fi
+
+if [ ! -z "$SELF_REINVOKE_OVERRIDE" ]; then
+    ENV_VARS="$ENV_VARS,SELF_REINVOKE=$SELF_REINVOKE_OVERRIDE"
+fi
+
+if [ ! -z "$SELF_REINVOKE_MAX_DEPTH_OVERRIDE" ]; then
+    ENV_VARS="$ENV_VARS,SELF_REINVOKE_MAX_DEPTH=$SELF_REINVOKE_MAX_DEPTH_OVERRIDE"
+fi
+
+if [ ! -z "$METRICS_ENABLED_OVERRIDE" ]; then
+    ENV_VARS="$ENV_VARS,METRICS_ENABLED=$METRICS_ENABLED_OVERRIDE"
+fi
+
+if [ ! -z "$BACKFILL_MODE_OVERRIDE" ]; then
+    ENV_VARS="$ENV_VARS,BACKFILL_MODE=$BACKFILL_MODE_OVERRIDE"
+fi
+
+if [ ! -z "$BACKFILL_JOB_URI_OVERRIDE" ]; then
+    ENV_VARS="$ENV_VARS,BACKFILL_JOB_URI=$BACKFILL_JOB_URI_OVERRIDE"
+fi
+
+if [ ! -z "$BACKFILL_ROLE_ARN_OVERRIDE" ]; then
+    ENV_VARS="$ENV_VARS,BACKFILL_ROLE_ARN=$BACKFILL_ROLE_ARN_OVERRIDE"
+fi
+
+if [ ! -z "$BACKFILL_MIN_RECORDS_OVERRIDE" ]; then
+    ENV_VARS="$ENV_VARS,BACKFILL_MIN_RECORDS=$BACKFILL_MIN_RECORDS_OVERRIDE"
+fi
+
 aws lambda update-function-configuration \
     --function-name $FUNCTION_NAME \
     --environment Variables="{$ENV_VARS}" \
@@ -130,6 +219,22 @@ else
     echo -e "${GREEN}✅ DynamoDB 테이블이 이미 존재합니다.${NC}"
 fi
 
+# 처리 기록/요약 캐시 등 만료 항목 자동 삭제 (기존 테이블도 TTL이 꺼져 있으면 활성화)
+TTL_STATUS=$(aws dynamodb describe-time-to-live \
+    --table-name $DYNAMODB_TABLE_VAL \
+    --query 'TimeToLiveDescription.TimeToLiveStatus' \
+    --output text \
+    --region $AWS_REGION_VAL)
+if [ "$TTL_STATUS" != "ENABLED" ] && [ "$TTL_STATUS" != "ENABLING" ]; then
+    echo -e "${YELLOW}⏱️ DynamoDB TTL(expires_at) 활성화 중...${NC}"
+    aws dynamodb update-time-to-live \
+        --table-name $DYNAMODB_TABLE_VAL \
+        --time-to-live-specification "Enabled=true, AttributeName=expires_at" \
+        --region $AWS_REGION_VAL
+else
+    echo -e "${GREEN}✅ DynamoDB TTL이 이미 활성화되어 있습니다.${NC}"
+fi
+
 # 정리
 rm -f ${FUNCTION_NAME}.zip
 
@@ -158,8 +263,28 @@ echo -e "  선택적 환경 변수 (성능 튜닝):"
 echo -e "  - MAX_RETRIES_OVERRIDE: 최대 재시도 횟수 변경 (기본: 3)"
 echo -e "  - RETRY_DELAY_BASE_OVERRIDE: 재시도 딜레이 기본값 변경 (기본: 2초)"
 echo -e "  - MAX_SLACK_LENGTH_OVERRIDE: Slack 메시지 최대 길이 변경 (기본: 3900)"
+echo -e "  - RSS_FEED_URLS_OVERRIDE: 조회할 RSS 피드 목록 변경 (세미콜론으로 구분)"
 echo -e "  - CONTENT_MAX_LENGTH_OVERRIDE: 본문 최대 길이 변경 (기본: 3000)"
+echo -e "  - CONTENT_MAX_TOKENS_OVERRIDE: 요약 요청 본문 토큰 예산 변경 (기본: 750)"
+echo -e "  - PROCESSED_TTL_DAYS_OVERRIDE: 중복 확인용 처리 기록 보관 기간 변경 (기본: 180일, 0이면 만료 없음)"
+echo -e "  - NEWS_ARCHIVE_TTL_DAYS_OVERRIDE: 뉴스 요약 보관 기간 변경 (기본: 90일, 0이면 보관 안 함)"
+echo -e "  - RECENT_IDS_MAX_OVERRIDE: 메모리에서 확인할 최근 처리 뉴스 ID 수 변경 (기본: 500, 0이면 사용 안 함)"
 echo -e "  - REQUEST_TIMEOUT_OVERRIDE: HTTP 요청 타임아웃 변경 (기본: 10초)"
-echo -e "  - PROCESSING_DELAY_OVERRIDE: 처리 딜레이 변경 (기본: 12초)"
+echo -e "  - PROCESSING_DELAY_OVERRIDE: Bedrock 호출 간 최소 간격 변경 (기본: 12초)"
+echo -e "  - EXECUTION_MODE_OVERRIDE: 뉴스 처리 실행 방식 변경 (thread 또는 async, 기본: thread)"
+echo -e "  - FETCH_CONCURRENCY_OVERRIDE: 본문 추출 동시 실행 수 변경 (기본: 5)"
+echo -e "  - BEDROCK_CONCURRENCY_OVERRIDE: Bedrock 요약 동시 실행 수 변경 (기본: 2)"
+echo -e "  - BEDROCK_MAX_RPM_OVERRIDE: 분당 Bedrock 최대 호출 수 변경 (기본: PROCESSING_DELAY로 계산)"
+echo -e "  - BEDROCK_MAX_TPM_OVERRIDE: 분당 Bedrock 최대 토큰 수 변경 (기본: 100000)"
+echo -e "  - BEDROCK_STREAMING_OVERRIDE: Bedrock 응답 스트리밍 사용 (true/false, 기본: false)"
+echo -e "  - BEDROCK_BATCH_SIZE_OVERRIDE: 한 번의 Bedrock 요청으로 요약할 최대 뉴스 수 변경 (기본: 1, 최대: 4)"
+echo -e "  - SELF_REINVOKE_OVERRIDE: 미룬 뉴스가 있으면 즉시 비동기 재호출 (true/false, 기본: false)"
+echo -e "  - SELF_REINVOKE_MAX_DEPTH_OVERRIDE: 연속 비동기 재호출 최대 횟수 변경 (기본: 5)"
+echo -e "  - SLACK_DELIVERY_MODE_OVERRIDE: Slack 전송 방식 변경 (single 또는 batch, 기본: single)"
+echo -e "  - METRICS_ENABLED_OVERRIDE: CloudWatch EMF 성능 지표 출력 (true/false, 기본: true)"
+echo -e "  - BACKFILL_MODE_OVERRIDE: 백필 방식 변경 (off 또는 batch, 기본: off)"
+echo -e "  - BACKFILL_JOB_URI_OVERRIDE: 백필 Batch Inference 입출력 위치 (s3://버킷/접두사)"
+echo -e "  - BACKFILL_ROLE_ARN_OVERRIDE: 백필 작업용 Bedrock 서비스 역할 ARN"
+echo -e "  - BACKFILL_MIN_RECORDS_OVERRIDE: Batch Inference 작업당 최소 레코드 수 변경 (기본: 100)"
 echo -e ""
 echo -e "  예시: AWS_REGION_OVERRIDE=us-east-1 PROCESSING_DELAY_OVERRIDE=15 ./deploy.sh my-function https://hooks.slack.com/..."
\ No newline at end of file
@@ -1,14 +1,23 @@
 # lambda_function.py (AWS News to Slack Bot)
 import requests
 import boto3
+import asyncio
 import os
+import re
 import json
-import feedparser
 import hashlib
+import math
 import time
+import threading
+from collections import OrderedDict
+from contextlib import asynccontextmanager, contextmanager
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from datetime import datetime
-from bs4 import BeautifulSoup
+from urllib.parse import urlsplit, urlunsplit
 from botocore.exceptions import ClientError
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+# feedparser, bs4, lxml(그리고 EXECUTION_MODE=async에서만 쓰는 aiohttp)은 콜드 스타트 단축을 위해 처음 사용할 때 import (새 뉴스가 없는 실행에서는 로드하지 않음)
 
 # 환경 변수에서 설정값 가져오기 (필수)
 SLACK_WEBHOOK = os.environ['SLACK_WEBHOOK']
@@ -16,8 +25,16 @@ AWS_REGION = os.environ['AWS_REGION']
 DYNAMODB_TABLE = os.environ['DYNAMODB_TABLE']
 BEDROCK_MODEL_ID = os.environ['BEDROCK_MODEL_ID']
 
-# RSS 피드 URL (하드코딩)
+# 기본 RSS 피드 URL (AWS What's New)
 RSS_FEED_URL = 'https://aws.amazon.com/about-aws/whats-new/recent/feed/'
+# 조회할 RSS 피드 목록 (쉼표, 세미콜론 또는 공백으로 구분, 미설정이거나 URL이 없으면 기본 피드만 조회)
+RSS_FEED_URLS = [url for url in re.split(r'[,;\s]+', os.environ.get('RSS_FEED_URLS') or '') if url]
+if not RSS_FEED_URLS:
+    if os.environ.get('RSS_FEED_URLS'):
+        print(f"[WARN] RSS_FEED_URLS에 피드 URL이 없음 ({os.environ['RSS_FEED_URLS']!r}) - 기본 피드만 조회")
+    RSS_FEED_URLS = [RSS_FEED_URL]
+# 단일 피드 시절 실행 상태 항목 최상위에 저장하던 피드별 상태 키
+LEGACY_FEED_STATE_KEYS = ('etag', 'modified', 'high_water_mark', 'boundary_ids')
 
 # 설정값 (환경 변수로 설정 가능, 기본값 제공)
 MAX_RETRIES = int(os.environ.get('MAX_RETRIES', '3'))
@@ -26,34 +43,453 @@ MAX_SLACK_LENGTH = int(os.environ.get('MAX_SLACK_LENGTH', '3900'))
 CONTENT_MAX_LENGTH = int(os.environ.get('CONTENT_MAX_LENGTH', '3000'))
 REQUEST_TIMEOUT = int(os.environ.get('REQUEST_TIMEOUT', '10'))
 PROCESSING_DELAY = int(os.environ.get('PROCESSING_DELAY', '12'))
+# 요약 요청에 넣을 본문 토큰 예산 (상용구 제거 후 문장 단위로 자름)
+CONTENT_MAX_TOKENS = int(os.environ.get('CONTENT_MAX_TOKENS', '750'))
 
-# 클라이언트 초기화 (지연 초기화로 변경)
+# Slack 전송 방식 ('single': 뉴스마다 전송, 'batch': 실행 단위로 모아 Block Kit 메시지로 전송)
+SLACK_DELIVERY_MODE = os.environ.get('SLACK_DELIVERY_MODE', 'single')
+# Slack Block Kit 제한 (메시지당 블록 수, section 블록 텍스트 길이)과 배치 메시지당 최대 글자 수
+SLACK_MAX_BLOCKS = 50
+SLACK_SECTION_MAX_LENGTH = 3000
+SLACK_BATCH_MAX_LENGTH = 12000
+
+# 본문 추출 엔진 ('lxml': 스트리밍 파싱 후 필요 시 BeautifulSoup 폴백, 'bs4': BeautifulSoup만 사용)
+EXTRACTOR_BACKEND = os.environ.get('EXTRACTOR_BACKEND', 'lxml')
+# 스트리밍 파서에 한 번에 넣는 HTML 크기 (바이트)
+HTML_PARSE_CHUNK_SIZE = 16384
+# AWS 페이지 본문(main)에 섞여 있는 상용구 줄 (소문자 비교)
+BOILERPLATE_LINES = {
+    'skip to main content', 'click here to return to amazon web services homepage',
+    'contact us', 'support', 'english', 'my account', 'sign in', 'sign in to console',
+    'create an aws account', "what's new", 'share', 'facebook', 'twitter', 'linkedin', 'email',
+    'back to top', 'close', 'menu', '»', '|',
+}
+BOILERPLATE_PATTERN = re.compile(r'^(posted on:?|learn more about|to learn more)\b', re.IGNORECASE)
+# 문장 경계 (마침표/물음표/느낌표 뒤 공백 또는 줄바꿈)
+SENTENCE_BOUNDARY = re.compile(r'(?<=[.!?])\s+|\n+')
+
+# HTTP 연결 풀 설정 (호스트당 최대 연결 수, 전송 계층 재시도 횟수)
+HTTP_POOL_MAXSIZE = int(os.environ.get('HTTP_POOL_MAXSIZE', '10'))
+HTTP_RETRIES = int(os.environ.get('HTTP_RETRIES', '2'))
+
+# 뉴스 처리 실행 방식 ('thread': 단계별 스레드 풀, 'async': asyncio 이벤트 루프에서 페이지 수신/요약/Slack 전송을 겹쳐 실행)
+EXECUTION_MODE = os.environ.get('EXECUTION_MODE', 'thread')
+
+# 파이프라인 동시성 설정
+FETCH_CONCURRENCY = int(os.environ.get('FETCH_CONCURRENCY', '5'))
+BEDROCK_CONCURRENCY = int(os.environ.get('BEDROCK_CONCURRENCY', '2'))
+# 워커 풀/세마포어 크기로 쓰이므로 0 이하는 설정 오류로 바로 실패
+for name, value in (('FETCH_CONCURRENCY', FETCH_CONCURRENCY), ('BEDROCK_CONCURRENCY', BEDROCK_CONCURRENCY)):
+    if value < 1:
+        raise ValueError(f"{name}는 1 이상이어야 합니다: {value}")
+# 분당 Bedrock 호출 수 제한 (미설정 시 기존 PROCESSING_DELAY 간격에서 계산, 0이면 제한 없음)
+BEDROCK_MAX_RPM = float(os.environ.get('BEDROCK_MAX_RPM') or (60 / PROCESSING_DELAY if PROCESSING_DELAY > 0 else 0))
+# 분당 Bedrock 토큰 수 제한 (입력 + 예상 출력 토큰, 0이면 제한 없음)
+BEDROCK_MAX_TPM = float(os.environ.get('BEDROCK_MAX_TPM') or '100000')
+
+# Bedrock 요청 설정
+BEDROCK_MAX_TOKENS = 4000
+# 요약 한 건당 예상 출력 토큰 수 (토큰 버킷 차감용)
+OUTPUT_TOKEN_ESTIMATE = 1000
+# 한 번의 Bedrock 요청으로 요약할 최대 뉴스 수 (1이면 뉴스별 요약)와 배치당 본문 토큰 예산
+# 배치 응답이 출력 토큰 한도 안에 들어가도록 BEDROCK_BATCH_SIZE_MAX(기본 4)를 넘는 값은 그 값으로 제한
+BEDROCK_BATCH_SIZE = int(os.environ.get('BEDROCK_BATCH_SIZE', '1'))
+BEDROCK_BATCH_SIZE_MAX = BEDROCK_MAX_TOKENS // OUTPUT_TOKEN_ESTIMATE
+BEDROCK_BATCH_TOKEN_BUDGET = int(os.environ.get('BEDROCK_BATCH_TOKEN_BUDGET', '8000'))
+# Bedrock 응답 스트리밍 여부 (Slack 메시지 길이에 도달하면 생성 중단)
+BEDROCK_STREAMING = os.environ.get('BEDROCK_STREAMING', 'false').lower() == 'true'
+# 요약 프롬프트 버전 (프롬프트를 바꾸면 올려서 요약 캐시를 무효화)
+PROMPT_VERSION = '2'
+
+# 요약 캐시 설정 (웜 Lambda 메모리 LRU 항목 수, DynamoDB 캐시 보관 기간)
+SUMMARY_CACHE_SIZE = int(os.environ.get('SUMMARY_CACHE_SIZE', '128'))
+SUMMARY_CACHE_TTL_DAYS = int(os.environ.get('SUMMARY_CACHE_TTL_DAYS', '30'))
+SUMMARY_CACHE_PREFIX = 'summary#'
+
+# 처리 기록(중복 확인용 항목) 보관 기간 (일, 0이면 만료 없음)
+PROCESSED_TTL_DAYS = int(os.environ.get('PROCESSED_TTL_DAYS', '180'))
+# 뉴스 제목/링크/요약 보관(archive#) 기간 (일, 0이면 보관하지 않음)
+NEWS_ARCHIVE_TTL_DAYS = int(os.environ.get('NEWS_ARCHIVE_TTL_DAYS', '90'))
+NEWS_ARCHIVE_PREFIX = 'archive#'
+# 웜 Lambda 메모리와 실행 상태 항목에 유지하는 최근 처리 뉴스 ID 수 (0이면 로컬 확인 안 함)
+RECENT_IDS_MAX = int(os.environ.get('RECENT_IDS_MAX', '500'))
+
+# 실행 상태(초기화 시각, RSS 피드 검증값과 high-water mark, 마지막 실행 통계)를 저장하는 상태 항목 ID
+FEED_STATE_ID = '__feed_state__'
+
+# DynamoDB BatchGetItem/BatchWriteItem 한 번에 처리 가능한 최대 항목 개수
+BATCH_GET_SIZE = 100
+BATCH_WRITE_SIZE = 25
+# Lambda 종료 전에 저장 버퍼를 비우기 위한 여유 시간 (밀리초)
+FLUSH_DEADLINE_MARGIN_MS = int(os.environ.get('FLUSH_DEADLINE_MARGIN_MS', '10000'))
+# 새 뉴스 처리를 시작하지 않는 Lambda 종료 전 여유 시간 (밀리초, 전송/저장/상태 기록 시간 확보)
+DEADLINE_SAFETY_MARGIN_MS = int(os.environ.get('DEADLINE_SAFETY_MARGIN_MS', '20000'))
+# 처리하지 못한 뉴스가 남으면 비동기로 자신을 다시 호출할지 여부
+SELF_REINVOKE = os.environ.get('SELF_REINVOKE', 'false').lower() == 'true'
+# 연속 비동기 재호출 최대 횟수 (정기 실행에서 시작한 재호출 체인 길이 제한)
+SELF_REINVOKE_MAX_DEPTH = int(os.environ.get('SELF_REINVOKE_MAX_DEPTH', '5'))
+# fan-out 모드에서 새 뉴스를 넣을 SQS 큐 URL (poller_handler/worker_handler 사용 시)
+NEWS_QUEUE_URL = os.environ.get('NEWS_QUEUE_URL', '')
+# SQS SendMessageBatch 한 번에 보낼 수 있는 최대 메시지 수
+SQS_BATCH_SIZE = 10
+# 단계별 소요 시간 이동 평균 가중치
+LATENCY_EMA_ALPHA = 0.3
+# CloudWatch Embedded Metric Format(EMF) 지표 출력 여부와 네임스페이스
+METRICS_ENABLED = os.environ.get('METRICS_ENABLED', 'true').lower() == 'true'
+METRICS_NAMESPACE = os.environ.get('METRICS_NAMESPACE', 'AwsNewsToSlack')
+# EMF 문서 하나에서 지표 하나에 담을 수 있는 최대 값 개수
+EMF_MAX_VALUES = 100
+
+# 백필 방식 ('off': 초기 실행은 기록만 수행, 'batch': Bedrock Batch Inference 작업으로 요약)
+BACKFILL_MODE = os.environ.get('BACKFILL_MODE', 'off')
+# Batch Inference 입출력 위치 ('s3://버킷/접두사', BACKFILL_MODE=batch이면 필수)
+BACKFILL_JOB_URI = os.environ.get('BACKFILL_JOB_URI', '')
+# Bedrock이 입출력 S3에 접근할 때 사용하는 서비스 역할
+BACKFILL_ROLE_ARN = os.environ.get('BACKFILL_ROLE_ARN', '')
+# Batch Inference 작업당 최소 레코드 수 (대부분 모델 100개, 모델별 서비스 할당량 확인)
+BACKFILL_MIN_RECORDS = int(os.environ.get('BACKFILL_MIN_RECORDS', '100'))
+# 초기 실행에서 요약할 최신 뉴스 수 (BACKFILL_MIN_RECORDS 이상)
+BACKFILL_MAX_ITEMS = int(os.environ.get('BACKFILL_MAX_ITEMS', '100'))
+# 새 뉴스가 이 개수 이상이면 실시간 처리 대신 백필 작업으로 처리 (0이면 사용 안 함, 사용 시 BACKFILL_MIN_RECORDS 이상)
+BACKFILL_CATCHUP_THRESHOLD = int(os.environ.get('BACKFILL_CATCHUP_THRESHOLD', '0'))
+# 아직 결과를 기다려야 하는 Batch Inference 작업 상태
+BATCH_JOB_RUNNING_STATUSES = ('Submitted', 'Validating', 'Scheduled', 'InProgress', 'Stopping')
+
+# 클라이언트 초기화 (지연 초기화로 변경, Bedrock 클라이언트는 요약이 필요할 때 생성)
 dynamodb = None
 bedrock_runtime = None
+bedrock_runtime_lock = threading.Lock()
 table = None
 
+# 웜 Lambda 호출 간 유지하는 최근 처리 뉴스 ID (삽입 순서 유지, 실행 상태 항목에서 초기화)
+recent_news_ids = OrderedDict()
+
+# 웜 Lambda 호출 간 재사용하는 HTTP 세션 (연결 유지)
+http_session = None
+http_session_lock = threading.Lock()
+
+class BedrockRateLimiter:
+    """분당 요청 수/토큰 수 기반 토큰 버킷 (스로틀링 시 AIMD 방식으로 속도 조절)"""
+    
+    # 스로틀링 시 속도 감소 비율, 성공 시 증가폭, 최소 속도 비율
+    DECREASE_FACTOR = 0.5
+    INCREASE_STEP = 0.1
+    MIN_RATE_RATIO = 0.1
+    # 토큰 버킷이 한 번에 허용하는 버스트 (초 단위 분량)
+    TOKEN_BURST_SECONDS = 10
+    
+    def __init__(self, max_rpm, max_tpm):
+        self.max_rpm = max_rpm
+        self.max_tpm = max_tpm
+        self.rate_ratio = 1.0
+        self.request_capacity = 1.0
+        self.token_capacity = max_tpm / 60.0 * self.TOKEN_BURST_SECONDS
+        self.available_requests = self.request_capacity
+        self.available_tokens = self.token_capacity
+        self.blocked_until = 0.0
+        self.updated_at = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def _refill(self, now):
+        """경과 시간만큼 버킷 충전 (lock 보유 상태에서 호출)"""
+        elapsed = now - self.updated_at
+        self.updated_at = now
+        if self.max_rpm > 0:
+            rate = self.max_rpm / 60.0 * self.rate_ratio
+            self.available_requests = min(self.request_capacity, self.available_requests + elapsed * rate)
+        if self.max_tpm > 0:
+            rate = self.max_tpm / 60.0 * self.rate_ratio
+            self.available_tokens = min(self.token_capacity, self.available_tokens + elapsed * rate)
+    
+    def acquire(self, tokens):
+        """요청 1건과 예상 토큰을 확보할 때까지 대기, 대기한 시간(초) 반환"""
+        waited = 0.0
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self._refill(now)
+                # 버킷 용량보다 큰 요청은 버킷이 가득 찰 때까지만 대기
+                needed_tokens = min(tokens, self.token_capacity)
+                
+                delay = self.blocked_until - now
+                if self.max_rpm > 0 and self.available_requests < 1:
+                    rate = self.max_rpm / 60.0 * self.rate_ratio
+                    delay = max(delay, (1 - self.available_requests) / rate)
+                if self.max_tpm > 0 and self.available_tokens < needed_tokens:
+                    rate = self.max_tpm / 60.0 * self.rate_ratio
+                    delay = max(delay, (needed_tokens - self.available_tokens) / rate)
+                
+                if delay <= 0:
+                    if self.max_rpm > 0:
+                        self.available_requests -= 1
+                    if self.max_tpm > 0:
+                        self.available_tokens -= needed_tokens
+                    return waited
+            
+            time.sleep(delay)
+            waited += delay
+    
+    def on_throttle(self, cooldown=0.0):
+        """스로틀링 발생: 속도를 곱셈 감소시키고 모든 호출자에게 대기 시간 공유"""
+        with self.lock:
+            self.rate_ratio = max(self.MIN_RATE_RATIO, self.rate_ratio * self.DECREASE_FACTOR)
+            self.available_requests = min(self.available_requests, 0.0)
+            self.available_tokens = min(self.available_tokens, 0.0)
+            self.blocked_until = max(self.blocked_until, time.monotonic() + cooldown)
+            print(f"[INFO] Bedrock 호출 속도 감소 - 현재 최대 대비 {self.rate_ratio:.0%}")
+    
+    def on_success(self):
+        """호출 성공: 속도를 덧셈 증가시켜 최대 속도로 복귀"""
+        with self.lock:
+            self.rate_ratio = min(1.0, self.rate_ratio + self.INCREASE_STEP)
+
+# fan-out 모드 뉴스 큐 (None이면 SQS 클라이언트를 생성, 로컬 테스트에서는 InMemoryQueue로 대체)
+news_queue = None
+
+# 백필 Batch Inference 작업 서비스 (None이면 BACKFILL_JOB_URI에 맞게 생성)
+batch_job_service = None
+
+# 단계별 최근 소요 시간 (초, 지수 이동 평균 - 웜 Lambda 호출 간 유지, 초기값은 보수적 추정치)
+stage_latency = {'fetch': 2.0, 'summarize': 15.0}
+stage_latency_lock = threading.Lock()
+
+# 요약 캐시 메모리 계층 (웜 Lambda에서 유지, 캐시 키 → 요약)
+summary_cache = OrderedDict()
+
+# Bedrock 호출 속도 제한 (웜 Lambda의 워커 스레드 간 공유)
+bedrock_rate_limiter = BedrockRateLimiter(BEDROCK_MAX_RPM, BEDROCK_MAX_TPM)
+
+def log_json(event, level='INFO', **fields):
+    """구조화된 JSON 로그 한 줄 출력 (CloudWatch Logs Insights에서 필드로 조회)"""
+    print(json.dumps({'level': level, 'event': event, **fields}, ensure_ascii=False, default=str))
+
+class RunMetrics:
+    """실행 단위 성능 지표 수집기 (단계별 소요 시간, 처리 건수, Bedrock 토큰 사용량)
+    
+    실행이 끝나면 CloudWatch EMF 문서(원시 값 배열로 p50/p99 등 통계 계산)와 JSON 실행 요약을 로그로 출력합니다.
+    """
+    
+    # 단계 이름 → EMF 지표 이름 (밀리초)
+    STAGE_METRICS = {
+        'feed': 'FeedLatency',
+        'dedup': 'DedupLatency',
+        'fetch': 'FetchLatency',
+        'summarize': 'SummarizeLatency',
+        'bedrock': 'BedrockLatency',
+        'bedrock_ttft': 'BedrockTimeToFirstToken',
+        'bedrock_wait': 'BedrockWaitTime',
+        'slack': 'SlackLatency',
+        'dynamodb_write': 'DynamoDBWriteLatency',
+    }
+    # 카운터 이름 → EMF 지표 이름 (개수)
+    COUNTER_METRICS = {
+        'new': 'NewItems',
+        'summary_success': 'SummarySuccess',
+        'slack_success': 'SlackSuccess',
+        'deferred': 'Deferred',
+        'dedup_local_hits': 'DedupLocalHits',
+        'bedrock_calls': 'BedrockCalls',
+        'bedrock_throttles': 'BedrockThrottles',
+        'bedrock_input_tokens': 'BedrockInputTokens',
+        'bedrock_output_tokens': 'BedrockOutputTokens',
+    }
+    
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.reset()
+    
+    def reset(self, handler=None):
+        """새 실행 시작 (웜 Lambda에서 이전 실행 지표 제거)"""
+        with self.lock:
+            self.handler = handler
+            self.started_at = time.perf_counter()
+            self.timings = {}
+            self.counters = {}
+    
+    def record(self, stage, seconds):
+        with self.lock:
+            self.timings.setdefault(stage, []).append(seconds * 1000)
+    
+    def increment(self, name, value=1):
+        with self.lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+    
+    @contextmanager
+    def timed(self, stage):
+        """with 블록의 소요 시간을 단계 지표로 기록"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, time.perf_counter() - start)
+    
+    @staticmethod
+    def percentile(values, percent):
+        """nearest-rank 방식 백분위수"""
+        ordered = sorted(values)
+        return ordered[max(0, math.ceil(percent / 100 * len(ordered)) - 1)]
+    
+    def summary(self):
+        """단계별 횟수/합계/p50/p99와 카운터를 담은 실행 요약"""
+        with self.lock:
+            timings = {stage: list(values) for stage, values in self.timings.items()}
+            counters = dict(self.counters)
+        return {
+            'handler': self.handler,
+            'duration_ms': round((time.perf_counter() - self.started_at) * 1000),
+            'stages': {
+                stage: {
+                    'count': len(values),
+                    'total_ms': round(sum(values)),
+                    'p50_ms': round(self.percentile(values, 50)),
+                    'p99_ms': round(self.percentile(values, 99)),
+                }
+                for stage, values in timings.items()
+            },
+            'counters': counters,
+        }
+    
+    def emf_documents(self, function_name):
+        """EMF 문서 목록 생성 (지표당 값이 100개를 넘으면 여러 문서로 나눔)"""
+        with self.lock:
+            timings = {stage: list(values) for stage, values in self.timings.items()}
+            counters = dict(self.counters)
+        counters_ms = {'RunDuration': (time.perf_counter() - self.started_at) * 1000}
+        
+        pages = max([1] + [math.ceil(len(values) / EMF_MAX_VALUES) for values in timings.values()])
+        documents = []
+        for page in range(pages):
+            values = {}
+            metrics = []
+            for stage, name in self.STAGE_METRICS.items():
+                chunk = timings.get(stage, [])[page * EMF_MAX_VALUES:(page + 1) * EMF_MAX_VALUES]
+                if chunk:
+                    values[name] = [round(value, 1) for value in chunk]
+                    metrics.append({'Name': name, 'Unit': 'Milliseconds'})
+            # 카운터와 전체 실행 시간은 첫 문서에만 기록
+            if page == 0:
+                for counter, name in self.COUNTER_METRICS.items():
+                    if counter in counters:
+                        values[name] = counters[counter]
+                        metrics.append({'Name': name, 'Unit': 'Count'})
+                for name, value in counters_ms.items():
+                    values[name] = round(value, 1)
+                    metrics.append({'Name': name, 'Unit': 'Milliseconds'})
+            documents.append({
+                '_aws': {
+                    'Timestamp': int(time.time() * 1000),
+                    'CloudWatchMetrics': [{
+                        'Namespace': METRICS_NAMESPACE,
+                        'Dimensions': [['FunctionName']],
+                        'Metrics': metrics,
+                    }],
+                },
+                'FunctionName': function_name,
+                'Handler': self.handler,
+                **values,
+            })
+        return documents
+    
+    def emit(self, context=None):
+        """EMF 지표와 JSON 실행 요약을 로그로 출력"""
+        if not METRICS_ENABLED:
+            return
+        function_name = getattr(context, 'function_name', None) or os.environ.get('AWS_LAMBDA_FUNCTION_NAME', 'local')
+        for document in self.emf_documents(function_name):
+            print(json.dumps(document, ensure_ascii=False))
+        log_json('run_summary', **self.summary())
+
+# 현재 실행의 성능 지표 (핸들러 시작 시 초기화)
+run_metrics = RunMetrics()
+
 def initialize_aws_clients():
     """AWS 클라이언트 초기화"""
-    global dynamodb, bedrock_runtime, table
+    global dynamodb, table
     
     if dynamodb is None:
         dynamodb = boto3.resource('dynamodb', region_name=AWS_REGION)
-        bedrock_runtime = boto3.client('bedrock-runtime', region_name=AWS_REGION)
         table = dynamodb.Table(DYNAMODB_TABLE)
         print(f"[INFO] AWS 클라이언트 초기화 완료 - Region: {AWS_REGION}, Table: {DYNAMODB_TABLE}")
 
+def get_bedrock_runtime():
+    """Bedrock Runtime 클라이언트 반환 (새 뉴스가 없는 실행에서 생성 비용을 피하도록 처음 사용할 때 생성)"""
+    global bedrock_runtime
+    
+    with bedrock_runtime_lock:
+        if bedrock_runtime is None:
+            bedrock_runtime = boto3.client('bedrock-runtime', region_name=AWS_REGION)
+            print(f"[INFO] Bedrock 클라이언트 초기화 완료 - Region: {AWS_REGION}")
+        
+        return bedrock_runtime
+
+def get_http_session():
+    """연결 풀과 재시도가 설정된 공용 HTTP 세션 반환"""
+    global http_session
+    
+    with http_session_lock:
+        if http_session is None:
+            # Slack 중복 전송을 막기 위해 POST는 연결 실패만 재시도
+            retry = Retry(
+                total=HTTP_RETRIES,
+                backoff_factor=0.5,
+                status_forcelist=(500, 502, 503, 504),
+                allowed_methods=frozenset(['GET', 'HEAD']),
+                raise_on_status=False
+            )
+            adapter = HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=HTTP_POOL_MAXSIZE,
+                pool_block=True,
+                max_retries=retry
+            )
+            session = requests.Session()
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            session.headers.update({'Accept-Encoding': 'gzip, deflate'})
+            http_session = session
+            print(f"[INFO] HTTP 세션 초기화 완료 - 호스트당 최대 연결: {HTTP_POOL_MAXSIZE}")
+        
+        return http_session
+
+def normalize_link(link):
+    """피드 간 중복 확인용 링크 정규화 (쿼리 문자열/프래그먼트 제거, 경로는 '/'로 끝나게 통일)
+    
+    AWS 뉴스 링크는 대부분 '/'로 끝나므로, 끝 '/'를 지우지 않고 붙이는 쪽으로 통일해 기존 뉴스 ID를 유지합니다.
+    """
+    parts = urlsplit(link.strip())
+    path = parts.path if parts.path.endswith('/') else parts.path + '/'
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, '', ''))
+
 def generate_news_id(link):
-    """뉴스 링크로부터 고유 ID 생성"""
-    return hashlib.md5(link.encode('utf-8')).hexdigest()
+    """정규화한 뉴스 링크로부터 고유 ID 생성"""
+    return hashlib.md5(normalize_link(link).encode('utf-8')).hexdigest()
 
-def is_initial_run():
-    """DynamoDB 테이블이 비어있는지 확인 (초기 실행 여부)"""
-    try:
-        response = table.scan(Limit=1)
-        return response['Count'] == 0
-    except Exception as e:
-        print(f"[ERROR] DynamoDB 스캔 실패: {e}")
+def dedup_news(news_items):
+    """정규화한 링크 기준으로 중복 뉴스 제거 (먼저 나온 뉴스 유지)"""
+    seen_ids = set()
+    unique_items = []
+    for item in news_items:
+        news_id = generate_news_id(item['link'])
+        if news_id not in seen_ids:
+            seen_ids.add(news_id)
+            unique_items.append(item)
+    return unique_items
+
+def is_initial_run(feed_state):
+    """실행 상태 항목으로 초기 실행 여부 확인
+    
+    초기화 기록(initialized_at)이나 high-water mark가 있으면 조회 없이 판단합니다. 상태 항목이 없던 이전 버전
+    배포에서만 테이블 스캔(Limit=1)으로 확인하고 초기화 기록을 남기며, 스캔 오류는 전체 피드 알림 전송을
+    막기 위해 그대로 전달합니다.
+    """
+    if feed_state.get('initialized_at') or feed_state.get('high_water_mark'):
         return False
+    
+    response = table.scan(Limit=1)
+    if response['Count'] == 0:
+        return True
+    feed_state['initialized_at'] = datetime.utcnow().isoformat()
+    return False
 
 def is_news_processed(news_id):
     """뉴스가 이미 처리되었는지 확인"""
@@ -64,138 +500,705 @@ def is_news_processed(news_id):
         print(f"[ERROR] DynamoDB 조회 실패 (ID: {news_id}): {e}")
         return False
 
+def remember_processed_ids(news_ids):
+    """최근 처리 뉴스 ID 집합에 추가 (RECENT_IDS_MAX개를 넘으면 오래된 ID부터 제거)"""
+    if RECENT_IDS_MAX <= 0:
+        return
+    for news_id in news_ids:
+        recent_news_ids[news_id] = True
+        recent_news_ids.move_to_end(news_id)
+    while len(recent_news_ids) > RECENT_IDS_MAX:
+        recent_news_ids.popitem(last=False)
+
+def filter_new_news(news_items):
+    """처리 여부를 확인하여 새 뉴스만 반환
+    
+    웜 Lambda의 최근 처리 ID 집합에 있는 뉴스는 DynamoDB를 조회하지 않고 제외하며,
+    나머지만 BatchGetItem으로 일괄 조회합니다.
+    """
+    # 링크별 ID 생성 (같은 ID가 한 요청에 중복되면 BatchGetItem이 실패하므로 제거)
+    id_by_item = [(item, generate_news_id(item['link'])) for item in news_items]
+    unique_ids = list(dict.fromkeys(news_id for _, news_id in id_by_item))
+    
+    processed_ids = {news_id for news_id in unique_ids if news_id in recent_news_ids}
+    lookup_ids = [news_id for news_id in unique_ids if news_id not in processed_ids]
+    run_metrics.increment('dedup_local_hits', len(processed_ids))
+    
+    with run_metrics.timed('dedup'):
+        for start in range(0, len(lookup_ids), BATCH_GET_SIZE):
+            chunk = lookup_ids[start:start + BATCH_GET_SIZE]
+            stored_ids = get_processed_ids(chunk)
+            remember_processed_ids(stored_ids)
+            processed_ids.update(stored_ids)
+    
+    new_items = [item for item, news_id in id_by_item if news_id not in processed_ids]
+    print(f"[INFO] 처리 여부 확인 완료 - 전체: {len(news_items)}개, 로컬 확인: {len(unique_ids) - len(lookup_ids)}개, "
+          f"새 뉴스: {len(new_items)}개")
+    return new_items
+
+def get_processed_ids(news_ids, max_retries=MAX_RETRIES):
+    """최대 100개의 ID 중 이미 처리된 ID 집합 반환 (UnprocessedKeys 재시도)"""
+    processed_ids = set()
+    request_items = {
+        DYNAMODB_TABLE: {
+            'Keys': [{'id': news_id} for news_id in news_ids],
+            'ProjectionExpression': 'id'
+        }
+    }
+    
+    try:
+        for attempt in range(max_retries + 1):
+            response = dynamodb.batch_get_item(RequestItems=request_items)
+            for item in response.get('Responses', {}).get(DYNAMODB_TABLE, []):
+                processed_ids.add(item['id'])
+            
+            request_items = response.get('UnprocessedKeys') or {}
+            if not request_items:
+                return processed_ids
+            
+            if attempt < max_retries:
+                delay = RETRY_DELAY_BASE ** attempt * 0.1
+                print(f"[INFO] UnprocessedKeys {len(request_items[DYNAMODB_TABLE]['Keys'])}개 - {delay}초 후 재시도...")
+                time.sleep(delay)
+        
+        remaining_ids = [key['id'] for key in request_items[DYNAMODB_TABLE]['Keys']]
+        print(f"[WARN] UnprocessedKeys 재시도 초과 - 개별 조회로 전환: {len(remaining_ids)}개")
+    except Exception as e:
+        print(f"[ERROR] DynamoDB 일괄 조회 실패 - 개별 조회로 전환: {e}")
+        remaining_ids = [news_id for news_id in news_ids if news_id not in processed_ids]
+    
+    # 일괄 조회 실패분은 기존 개별 조회로 처리
+    for news_id in remaining_ids:
+        if is_news_processed(news_id):
+            processed_ids.add(news_id)
+    return processed_ids
+
+def apply_high_water_mark(news_items, feed_state):
+    """저장된 최신 발표 시각(high-water mark)보다 오래된 뉴스를 메모리에서 제외"""
+    mark = feed_state.get('high_water_mark')
+    if not mark:
+        return news_items
+    
+    mark_datetime = datetime.fromisoformat(mark)
+    boundary_ids = set(feed_state.get('boundary_ids', []))
+    
+    # 같은 시각의 뉴스는 이미 처리한 ID만 제외하고 나머지는 DynamoDB 조회 대상으로 남김
+    remaining_items = [
+        item for item in news_items
+        if item['datetime'] > mark_datetime
+        or (item['datetime'] == mark_datetime and generate_news_id(item['link']) not in boundary_ids)
+    ]
+    print(f"[INFO] High-water mark({mark}) 적용 - 조회 대상: {len(remaining_items)}/{len(news_items)}개")
+    return remaining_items
+
+def update_high_water_mark(news_items, feed_state):
+    """이번 실행에서 본 가장 최신 발표 시각과 그 시각의 뉴스 ID를 feed_state에 기록"""
+    if not news_items:
+        return
+    
+    latest = max(item['datetime'] for item in news_items)
+    latest_ids = {generate_news_id(item['link']) for item in news_items if item['datetime'] == latest}
+    
+    mark = feed_state.get('high_water_mark')
+    if mark and datetime.fromisoformat(mark) > latest:
+        return
+    if mark and datetime.fromisoformat(mark) == latest:
+        latest_ids.update(feed_state.get('boundary_ids', []))
+    
+    feed_state['high_water_mark'] = latest.isoformat()
+    feed_state['boundary_ids'] = sorted(latest_ids)
+
+def build_news_record(news_id, status=None):
+    """중복 확인용 처리 기록 항목 생성 (status='queued'는 fan-out 워커 처리 대기 중)
+    
+    중복 확인에는 ID만 필요하므로 제목/링크/요약은 build_archive_record의 보관 항목에 따로 저장하고,
+    처리 기록에는 처리 시각과 만료 시각(expires_at, TTL)만 남깁니다.
+    """
+    now = time.time()
+    item = {
+        'id': news_id,
+        'processed_at': datetime.utcfromtimestamp(now).isoformat(),
+    }
+    if PROCESSED_TTL_DAYS > 0:
+        item['expires_at'] = int(now) + PROCESSED_TTL_DAYS * 86400
+    if status:
+        item['status'] = status
+    return item
+
+def build_archive_record(news_id, title, link, summary=None):
+    """요약된 뉴스의 제목/링크/요약 보관 항목 생성 (요약이 없거나 보관하지 않으면 None)"""
+    if not summary or NEWS_ARCHIVE_TTL_DAYS <= 0:
+        return None
+    now = time.time()
+    return {
+        'id': NEWS_ARCHIVE_PREFIX + news_id,
+        'title': title,
+        'link': link,
+        'summary': summary,
+        'processed_at': datetime.utcfromtimestamp(now).isoformat(),
+        'expires_at': int(now) + NEWS_ARCHIVE_TTL_DAYS * 86400,
+    }
+
 def save_processed_news(news_id, title, link, summary=None):
     """처리된 뉴스를 DynamoDB에 저장"""
     try:
-        item = {
-            'id': news_id,
-            'title': title,
-            'link': link,
-            'processed_at': datetime.utcnow().isoformat(),
-        }
-        if summary:
-            item['summary'] = summary
-            
-        table.put_item(Item=item)
+        with run_metrics.timed('dynamodb_write'):
+            table.put_item(Item=build_news_record(news_id))
+            archive = build_archive_record(news_id, title, link, summary)
+            if archive:
+                table.put_item(Item=archive)
+        remember_processed_ids([news_id])
         print(f"[INFO] DynamoDB 저장 완료: {title[:50]}...")
         return True
     except Exception as e:
         print(f"[ERROR] DynamoDB 저장 실패: {e}")
         return False
 
+class BufferedNewsWriter:
+    """처리된 뉴스 기록을 모아 BatchWriteItem(25개 단위)으로 저장하는 쓰기 버퍼"""
+    
+    def __init__(self, context=None, max_retries=MAX_RETRIES):
+        self.context = context
+        self.max_retries = max_retries
+        # 같은 ID가 한 요청에 중복되면 BatchWriteItem이 실패하므로 ID 기준으로 보관
+        self.pending = {}
+        self.written = 0
+    
+    def add(self, news_id, title, link, summary=None, status=None):
+        """기록을 버퍼에 추가 (25개가 모이거나 Lambda 종료가 가까우면 즉시 저장)"""
+        self.pending[news_id] = build_news_record(news_id, status)
+        archive = build_archive_record(news_id, title, link, summary)
+        if archive:
+            self.pending[archive['id']] = archive
+        if len(self.pending) >= BATCH_WRITE_SIZE or self.deadline_near():
+            self.flush()
+    
+    def deadline_near(self):
+        """Lambda 남은 실행 시간이 FLUSH_DEADLINE_MARGIN_MS보다 적은지 확인"""
+        if self.context is None or not hasattr(self.context, 'get_remaining_time_in_millis'):
+            return False
+        return self.context.get_remaining_time_in_millis() < FLUSH_DEADLINE_MARGIN_MS
+    
+    def flush(self):
+        """버퍼의 모든 기록을 저장하고 저장된 개수 반환"""
+        items = list(self.pending.values())
+        self.pending = {}
+        written = 0
+        for start in range(0, len(items), BATCH_WRITE_SIZE):
+            chunk = items[start:start + BATCH_WRITE_SIZE]
+            with run_metrics.timed('dynamodb_write'):
+                chunk_written = self._write_chunk(chunk)
+            written += chunk_written
+            # 모두 저장된 청크의 처리 기록만 최근 처리 ID로 기억 (일부 실패 시 다음 실행에서 DynamoDB로 확인)
+            if chunk_written == len(chunk):
+                remember_processed_ids(
+                    item['id'] for item in chunk if not item['id'].startswith(NEWS_ARCHIVE_PREFIX)
+                )
+        
+        if items:
+            print(f"[INFO] DynamoDB 일괄 저장 완료: {written}/{len(items)}개")
+        self.written += written
+        return written
+    
+    def _write_chunk(self, items):
+        """최대 25개 기록을 BatchWriteItem으로 저장 (UnprocessedItems 재시도)"""
+        request_items = {DYNAMODB_TABLE: [{'PutRequest': {'Item': item}} for item in items]}
+        
+        try:
+            for attempt in range(self.max_retries + 1):
+                response = dynamodb.batch_write_item(RequestItems=request_items)
+                request_items = response.get('UnprocessedItems') or {}
+                if not request_items:
+                    return len(items)
+                
+                if attempt < self.max_retries:
+                    delay = RETRY_DELAY_BASE ** attempt * 0.1
+                    print(f"[INFO] UnprocessedItems {len(request_items[DYNAMODB_TABLE])}개 - {delay}초 후 재시도...")
+                    time.sleep(delay)
+            
+            remaining = [request['PutRequest']['Item'] for request in request_items[DYNAMODB_TABLE]]
+            print(f"[WARN] UnprocessedItems 재시도 초과 - 개별 저장으로 전환: {len(remaining)}개")
+        except Exception as e:
+            print(f"[ERROR] DynamoDB 일괄 저장 실패 - 개별 저장으로 전환: {e}")
+            remaining = items
+        
+        # 일괄 저장 실패분은 기존 개별 저장으로 처리
+        failed = 0
+        for item in remaining:
+            try:
+                table.put_item(Item=item)
+            except Exception as e:
+                print(f"[ERROR] DynamoDB 저장 실패: {e}")
+                failed += 1
+        return len(items) - failed
+
+def load_feed_state():
+    """DynamoDB에서 실행 상태 항목 조회 (초기화 시각, 피드 검증값/high-water mark, 미처리 뉴스, 마지막 실행 통계, 최근 처리 ID)
+    
+    웜 Lambda에서도 매 실행 강한 일관성 읽기 한 번으로 가져와 다른 실행(동시 실행, 백필 처리 등)이 저장한 상태를 놓치지 않으며,
+    조회에 실패하면 초기 실행으로 오인하지 않도록 예외를 그대로 전달합니다.
+    """
+    response = table.get_item(Key={'id': FEED_STATE_ID}, ConsistentRead=True)
+    item = response.get('Item', {})
+    remember_processed_ids(item.get('recent_ids', []))
+    return {key: value for key, value in item.items() if key != 'id'}
+
+def save_feed_state(feed_state):
+    """실행 상태 항목을 DynamoDB에 저장"""
+    try:
+        item = {key: value for key, value in feed_state.items() if value and key != 'recent_ids'}
+        if recent_news_ids:
+            item['recent_ids'] = list(recent_news_ids)
+        item['id'] = FEED_STATE_ID
+        table.put_item(Item=item)
+        return True
+    except Exception as e:
+        print(f"[ERROR] 실행 상태 저장 실패: {e}")
+        return False
+
+class MainTextCollector:
+    """lxml 파서 target - main/article/본문 div 안의 텍스트를 문서 순서대로 수집"""
+    
+    CONTENT_CLASSES = {'content', 'main-content', 'post-content'}
+    SKIP_TAGS = {'script', 'style', 'noscript', 'template'}
+    
+    def __init__(self, limit):
+        self.limit = limit
+        self.main = None
+        self.article = None
+        self.divs = []
+        self.main_length = 0
+        self.open_blocks = []
+        self.stack = []
+        self.skip_depth = 0
+        self.pending = []
+    
+    @property
+    def done(self):
+        """최우선 블록(main)에서 필요한 길이를 모두 모았는지 여부"""
+        return self.main_length > self.limit
+    
+    def _flush(self):
+        text = ''.join(self.pending).strip()
+        self.pending = []
+        if not text:
+            return
+        for block in self.open_blocks:
+            block.append(text)
+        if self.main is not None and any(block is self.main for block in self.open_blocks):
+            self.main_length += len(text) + 1
+    
+    def start(self, tag, attrib):
+        self._flush()
+        block = None
+        if tag in self.SKIP_TAGS:
+            self.skip_depth += 1
+        elif tag == 'main' and self.main is None:
+            block = self.main = []
+        elif tag == 'article' and self.article is None:
+            block = self.article = []
+        elif tag == 'div' and self.CONTENT_CLASSES & set(attrib.get('class', '').split()):
+            block = []
+            self.divs.append(block)
+        if block is not None:
+            self.open_blocks.append(block)
+        self.stack.append((tag, block))
+    
+    def end(self, tag):
+        self._flush()
+        if not self.stack:
+            return
+        tag, block = self.stack.pop()
+        if tag in self.SKIP_TAGS:
+            self.skip_depth -= 1
+        if block is not None:
+            self.open_blocks = [open_block for open_block in self.open_blocks if open_block is not block]
+    
+    def data(self, data):
+        if self.open_blocks and not self.skip_depth and not self.done:
+            self.pending.append(data)
+    
+    def comment(self, text):
+        pass
+    
+    def close(self):
+        """BeautifulSoup 경로와 같은 우선순위(main → article → 본문 div)로 결과 선택"""
+        self._flush()
+        if self.main:
+            return '\n'.join(self.main)
+        if self.article:
+            return '\n'.join(self.article)
+        text = ""
+        for block in self.divs:
+            text = '\n'.join(block)
+            if len(text) > 100:
+                break
+        return text
+
+def extract_text_with_lxml(content, limit=CONTENT_MAX_LENGTH):
+    """lxml 스트리밍 파서로 본문 추출 (main 본문이 limit을 넘으면 파싱 중단)"""
+    from lxml import etree
+    
+    collector = MainTextCollector(limit)
+    parser = etree.HTMLParser(target=collector)
+    for start in range(0, len(content), HTML_PARSE_CHUNK_SIZE):
+        parser.feed(content[start:start + HTML_PARSE_CHUNK_SIZE])
+        if collector.done:
+            break
+    return parser.close()
+
+def extract_text_with_bs4(content):
+    """BeautifulSoup(html.parser)으로 본문 추출"""
+    from bs4 import BeautifulSoup
+    
+    soup = BeautifulSoup(content, "html.parser")
+    
+    # main 태그 우선 시도
+    main_block = soup.select_one("main")
+    if main_block and main_block.get_text(strip=True):
+        return main_block.get_text(separator='\n', strip=True)
+    
+    # article 태그 시도
+    article_block = soup.select_one("article")
+    if article_block and article_block.get_text(strip=True):
+        return article_block.get_text(separator='\n', strip=True)
+    
+    # content div 시도
+    content_divs = soup.find_all('div', class_=['content', 'main-content', 'post-content'])
+    text = ""
+    for div in content_divs:
+        text = div.get_text(separator='\n', strip=True)
+        if len(text) > 100:  # 충분한 길이의 텍스트가 있으면
+            break
+    return text
+
+def extract_text_from_html(content):
+    """설정된 추출 엔진으로 HTML에서 본문 추출 (lxml 결과가 없으면 BeautifulSoup으로 재시도)"""
+    if EXTRACTOR_BACKEND == 'lxml':
+        try:
+            text = extract_text_with_lxml(content)
+            if text:
+                return text
+        except Exception as e:
+            print(f"[WARN] lxml 본문 추출 실패, BeautifulSoup으로 재시도: {e}")
+    return extract_text_with_bs4(content)
+
+def clean_body(text):
+    """본문에서 상용구 줄과 중복 줄 제거"""
+    seen = set()
+    lines = []
+    for line in text.split('\n'):
+        line = ' '.join(line.split())
+        key = line.lower()
+        if not line or key in seen or key in BOILERPLATE_LINES or BOILERPLATE_PATTERN.match(line):
+            continue
+        seen.add(key)
+        lines.append(line)
+    return '\n'.join(lines)
+
+def trim_to_token_budget(text, max_tokens=CONTENT_MAX_TOKENS):
+    """토큰 예산을 넘지 않도록 문장 경계에서 본문 자르기 (첫 문장부터 넘치면 글자 단위로 자름)"""
+    if estimate_tokens(text) <= max_tokens:
+        return text
+    
+    # estimate_tokens와 같은 방식으로 누적 (문장별 추정치를 더하면 나머지 버림 오차가 쌓임)
+    end = 0
+    ascii_count = 0
+    other_count = 0
+    for match in SENTENCE_BOUNDARY.finditer(text + '\n'):
+        sentence = text[end:match.end()]
+        sentence_ascii = sum(1 for ch in sentence if ord(ch) < 128)
+        if (ascii_count + sentence_ascii) // 4 + other_count + len(sentence) - sentence_ascii > max_tokens:
+            break
+        ascii_count += sentence_ascii
+        other_count += len(sentence) - sentence_ascii
+        end = match.end()
+    
+    if end == 0:
+        # 첫 문장이 예산보다 길면 예산 비율만큼만 남김
+        end = len(text) * max_tokens // estimate_tokens(text)
+    return text[:end].rstrip() + "..."
+
+def prepare_body(text, url):
+    """요약 요청 전 본문 전처리 (상용구/중복 줄 제거 → 토큰 예산 내 문장 단위 자르기), 절감한 토큰 수 기록"""
+    before_tokens = estimate_tokens(text)
+    text = trim_to_token_budget(clean_body(text))
+    after_tokens = estimate_tokens(text)
+    if before_tokens > after_tokens:
+        saved_ratio = (before_tokens - after_tokens) / before_tokens
+        print(f"[INFO] 본문 전처리: {before_tokens} → {after_tokens} 토큰 ({saved_ratio:.0%} 절감): {url}")
+    return text
+
 def extract_main_text(url):
     """웹 페이지에서 본문 텍스트 추출"""
     try:
-        response = requests.get(url, timeout=REQUEST_TIMEOUT)
+        start = time.perf_counter()
+        response = get_http_session().get(url, timeout=REQUEST_TIMEOUT)
         response.raise_for_status()
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        print(f"[INFO] 페이지 수신 완료 ({elapsed_ms:.0f}ms, {len(response.content)}바이트): {url}")
         
-        soup = BeautifulSoup(response.content, "html.parser")
+        return parse_main_text(response.content, url)
         
-        # main 태그 우선 시도
-        main_block = soup.select_one("main")
-        if main_block and main_block.get_text(strip=True):
-            text = main_block.get_text(separator='\n', strip=True)
-        else:
-            # article 태그 시도
-            article_block = soup.select_one("article")
-            if article_block and article_block.get_text(strip=True):
-                text = article_block.get_text(separator='\n', strip=True)
-            else:
-                # content div 시도
-                content_divs = soup.find_all('div', class_=['content', 'main-content', 'post-content'])
-                text = ""
-                for div in content_divs:
-                    text = div.get_text(separator='\n', strip=True)
-                    if len(text) > 100:  # 충분한 길이의 텍스트가 있으면
-                        break
-        
-        # 본문 길이 제한 (토큰 사용량 감소)
-        if text and len(text) > CONTENT_MAX_LENGTH:
-            text = text[:CONTENT_MAX_LENGTH] + "..."
-            print(f"[INFO] 본문이 너무 길어서 {CONTENT_MAX_LENGTH}자로 제한: {url}")
-        
-        if not text:
-            print(f"[WARN] 본문을 찾을 수 없음: {url}")
-            return ""
+    except Exception as e:
+        print(f"[ERROR] 웹 페이지 본문 추출 실패 ({url}): {e}")
+        return ""
+
+def parse_main_text(content, url):
+    """수신한 HTML에서 본문을 추출하고 전처리 (본문이 없으면 빈 문자열)"""
+    # BeautifulSoup 경로는 페이지 전체 텍스트를 반환하므로 전처리 전에 CONTENT_MAX_LENGTH로 자름
+    text = extract_text_from_html(content)[:CONTENT_MAX_LENGTH]
+    
+    # 상용구 제거와 토큰 예산 내 문장 단위 자르기 (토큰 사용량 감소)
+    if text:
+        text = prepare_body(text, url)
+    
+    if not text:
+        print(f"[WARN] 본문을 찾을 수 없음: {url}")
+        return ""
+    
+    return text
+
+async def extract_main_text_async(session, url):
+    """extract_main_text의 asyncio 버전 (aiohttp 세션이 없으면 동기 함수를 스레드에서 실행)"""
+    if session is None:
+        return await asyncio.to_thread(extract_main_text, url)
+    
+    try:
+        start = time.perf_counter()
+        # 동기 경로의 HTTP 세션처럼 서버 오류(5xx)는 HTTP_RETRIES회까지 재시도
+        for attempt in range(HTTP_RETRIES + 1):
+            async with session.get(url) as response:
+                if response.status in (500, 502, 503, 504) and attempt < HTTP_RETRIES:
+                    await asyncio.sleep(0.5 * 2 ** attempt)
+                    continue
+                response.raise_for_status()
+                content = await response.read()
+                break
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        print(f"[INFO] 페이지 수신 완료 ({elapsed_ms:.0f}ms, {len(content)}바이트): {url}")
         
-        return text
+        return parse_main_text(content, url)
         
     except Exception as e:
         print(f"[ERROR] 웹 페이지 본문 추출 실패 ({url}): {e}")
         return ""
 
-def summarize_with_bedrock(title, body, date, link, max_retries=MAX_RETRIES):
-    """Bedrock Claude를 사용하여 뉴스 요약"""
-    
-    # 사용자 제공 프롬프트 사용
-    prompt = f"""다음은 AWS의 새로운 서비스 또는 기능 업데이트 뉴스입니다. 이 내용을 요약해서 Slack 메시지로 작성해주세요.
-언어는 한국어로 번역해서 전달해주세요.
+def estimate_tokens(text):
+    """텍스트의 토큰 수 추정 (ASCII는 약 4자당 1토큰, 한글 등은 글자당 1토큰)"""
+    ascii_count = sum(1 for ch in text if ord(ch) < 128)
+    return ascii_count // 4 + (len(text) - ascii_count)
 
-출력 형식은 다음과 같이 구성합니다:
+def summary_cache_key(title, body, date, link):
+    """모델 ID, 프롬프트 버전, 프롬프트 입력값으로 요약 캐시 키 생성"""
+    payload = json.dumps([BEDROCK_MODEL_ID, PROMPT_VERSION, title, date, link, body], ensure_ascii=False)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
 
-1. 첫 줄: 🎉 이모지 + 뉴스 제목 (한 줄로 간결히 요약)
-2. 두 번째 줄: 🗓 발표일 (예: 2025년 6월 9일 형식)
-3. 그 아래 한두 문장으로 핵심 요약 (기능, 목적, 기대 효과 등 자연스럽게 설명)
-4. ✨ 주요 특징 제목 줄
-5. 주요 특징 항목을 아래 형식으로 나열
+def get_cached_summary(cache_key):
+    """메모리 LRU → DynamoDB 순서로 캐시된 요약 조회"""
+    if cache_key in summary_cache:
+        summary_cache.move_to_end(cache_key)
+        return summary_cache[cache_key]
+    
+    try:
+        response = table.get_item(Key={'id': SUMMARY_CACHE_PREFIX + cache_key})
+        item = response.get('Item')
+        # TTL 삭제는 지연될 수 있으므로 만료 시각을 직접 확인
+        if not item or int(item.get('expires_at', 0)) <= time.time():
+            return None
+        remember_summary(cache_key, item['summary'])
+        return item['summary']
+    except Exception as e:
+        print(f"[ERROR] 요약 캐시 조회 실패: {e}")
+        return None
 
-각 특징 항목 형식은 다음과 같이 구성합니다:
+def remember_summary(cache_key, summary):
+    """메모리 LRU에 요약 저장 (오래된 항목부터 제거)"""
+    summary_cache[cache_key] = summary
+    summary_cache.move_to_end(cache_key)
+    while len(summary_cache) > SUMMARY_CACHE_SIZE:
+        summary_cache.popitem(last=False)
 
-1️⃣ 항목 제목 (한 줄로 요약)  
-- 해당 기능 또는 특징에 대한 설명 (1~2줄, 효과나 유용성 중심)
+def save_cached_summary(cache_key, summary):
+    """요약을 메모리 LRU와 DynamoDB(TTL 적용)에 저장"""
+    remember_summary(cache_key, summary)
+    try:
+        table.put_item(Item={
+            'id': SUMMARY_CACHE_PREFIX + cache_key,
+            'summary': summary,
+            'expires_at': int(time.time()) + SUMMARY_CACHE_TTL_DAYS * 86400,
+        })
+        return True
+    except Exception as e:
+        print(f"[ERROR] 요약 캐시 저장 실패: {e}")
+        return False
 
-2️⃣ ...  
-- ...
+# 요약 출력 형식 지침 (단건/배치 프롬프트 공용)
+SUMMARY_FORMAT_INSTRUCTIONS = """한국어로 번역해서 마크다운 없는 Slack 메시지로, 아래 형식을 그대로 따라 작성해주세요.
 
-항목은 총 2~3개로 구성하며, 이모지는 실제 숫자 이모지(1️⃣, 2️⃣, 3️⃣ 등)를 사용합니다.  
-전체 메시지는 Slack 메시지 형식으로 마크다운 없이, 자연스럽고 명확하게 구성해주세요.
-전체 응답은 반드시 한국어로 출력해주세요.
+🎉 뉴스 제목 (한 줄로 간결히 요약)
+🗓 발표일 (예: 2025년 6월 9일)
+핵심 요약 1~2문장 (기능, 목적, 기대 효과)
+✨ 주요 특징
+1️⃣ 항목 제목 (한 줄 요약)
+- 설명 1~2줄 (효과나 유용성 중심)
+(특징 항목은 2~3개, 숫자 이모지 1️⃣ 2️⃣ 3️⃣ 사용)
+🔗 자세히 보기: (뉴스 URL)"""
 
-마지막 줄에는 🔗 자세히 보기: (뉴스 URL)을 추가해주세요.
+def build_summary_prompt(title, body, date, link):
+    """요약 요청 프롬프트 생성 (내용을 바꾸면 PROMPT_VERSION을 올릴 것)"""
+    return f"""다음 AWS 서비스/기능 업데이트 뉴스를 요약해주세요.
+{SUMMARY_FORMAT_INSTRUCTIONS}
 ---
-
 제목: {title}
 발표일: {date}
 뉴스 원문:
 {body}
 뉴스 링크: {link}"""
 
+def build_batch_summary_prompt(articles):
+    """여러 뉴스를 한 번에 요약하는 프롬프트 생성 (articles: (제목, 본문, 발표일, 링크) 목록)"""
+    sections = "\n\n".join(
+        f"[뉴스 {number}]\n제목: {title}\n발표일: {date}\n뉴스 원문:\n{body}\n뉴스 링크: {link}"
+        for number, (title, body, date, link) in enumerate(articles, start=1)
+    )
+    return f"""다음 AWS 서비스/기능 업데이트 뉴스 {len(articles)}건을 각각 하나의 Slack 메시지로 요약해주세요.
+{SUMMARY_FORMAT_INSTRUCTIONS}
+
+다른 설명 없이 JSON 배열로만 응답해주세요. id는 뉴스 번호, summary는 위 형식의 메시지 전체입니다.
+[{{"id": 1, "summary": "..."}}, {{"id": 2, "summary": "..."}}]
+---
+{sections}"""
+
+def build_model_input(prompt):
+    """Bedrock Claude 요청 본문 생성 (InvokeModel과 Batch Inference 입력 레코드에 공통 사용)"""
+    return {
+        "anthropic_version": "bedrock-2023-05-31",
+        "max_tokens": BEDROCK_MAX_TOKENS,
+        "messages": [
+            {
+                "role": "user",
+                "content": prompt
+            }
+        ],
+        "temperature": 0.3
+    }
+
+def read_bedrock_response(prompt, label):
+    """invoke_model로 전체 응답을 받아 텍스트 반환"""
+    start = time.perf_counter()
+    response = get_bedrock_runtime().invoke_model(
+        modelId=BEDROCK_MODEL_ID,
+        body=json.dumps(build_model_input(prompt)),
+        contentType="application/json"
+    )
+    
+    response_body = json.loads(response['body'].read())
+    elapsed = time.perf_counter() - start
+    run_metrics.record('bedrock', elapsed)
+    record_token_usage(response_body.get('usage', {}))
+    print(f"[INFO] Bedrock 응답 수신 (전체 {elapsed:.2f}s): {label[:50]}...")
+    return response_body['content'][0]['text']
+
+def record_token_usage(usage):
+    """Bedrock 응답의 usage(input_tokens/output_tokens)를 실행 지표에 합산"""
+    run_metrics.increment('bedrock_input_tokens', usage.get('input_tokens', 0))
+    run_metrics.increment('bedrock_output_tokens', usage.get('output_tokens', 0))
+
+def stream_bedrock_response(prompt, label, max_length=None):
+    """invoke_model_with_response_stream으로 응답을 받아 (텍스트, 조기 종료 여부) 반환
+    
+    max_length가 주어지면 응답이 그 길이에 도달하는 즉시 스트림을 닫아 생성을 중단하고,
+    토큰 중간에서 끊기지 않도록 max_length 안의 마지막 줄까지만 남깁니다.
+    첫 토큰까지 걸린 시간(TTFT)과 전체 소요 시간을 기록합니다.
+    """
+    start = time.perf_counter()
+    first_token_at = None
+    parts = []
+    length = 0
+    stopped = False
+    usage = {}
+    
+    response = get_bedrock_runtime().invoke_model_with_response_stream(
+        modelId=BEDROCK_MODEL_ID,
+        body=json.dumps(build_model_input(prompt)),
+        contentType="application/json"
+    )
+    stream = response['body']
+    try:
+        for event in stream:
+            chunk = json.loads(event.get('chunk', {}).get('bytes', b'{}'))
+            # 입력 토큰은 message_start, 출력 토큰은 message_delta의 usage로 전달됨
+            if chunk.get('type') == 'message_start':
+                usage.update(chunk.get('message', {}).get('usage', {}))
+            elif chunk.get('type') == 'message_delta':
+                usage.update(chunk.get('usage', {}))
+            if chunk.get('type') != 'content_block_delta':
+                continue
+            
+            if first_token_at is None:
+                first_token_at = time.perf_counter()
+            text = chunk['delta'].get('text', '')
+            parts.append(text)
+            length += len(text)
+            if max_length and length >= max_length:
+                stopped = True
+                break
+    finally:
+        # 조기 종료 시 연결을 닫아 남은 토큰 생성을 중단
+        if stopped:
+            stream.close()
+    
+    total = time.perf_counter() - start
+    ttft = (first_token_at - start) if first_token_at is not None else total
+    run_metrics.record('bedrock', total)
+    run_metrics.record('bedrock_ttft', ttft)
+    if stopped:
+        # 조기 종료하면 message_delta를 받지 못하므로 받은 텍스트로 출력 토큰 추정
+        usage['output_tokens'] = estimate_tokens(''.join(parts))
+    record_token_usage(usage)
+    print(
+        f"[INFO] Bedrock 스트리밍 {'조기 종료' if stopped else '완료'} "
+        f"(첫 토큰 {ttft:.2f}s, 전체 {total:.2f}s, {length}자): {label[:50]}..."
+    )
+    text = ''.join(parts)
+    if stopped:
+        text = text[:max_length]
+        line_end = text.rfind('\n')
+        if line_end > 0:
+            text = text[:line_end]
+        text = text.rstrip()
+    return text, stopped
+
+def invoke_bedrock(prompt, request_tokens, label, max_retries=MAX_RETRIES, max_length=None):
+    """Bedrock Claude 호출 (속도 제한기 적용, 재시도), (응답 텍스트, 조기 종료 여부) 또는 실패 시 (None, False) 반환
+    
+    BEDROCK_STREAMING이 켜져 있으면 응답을 스트리밍으로 받고, max_length에 도달하면 생성을 중단합니다.
+    """
     for attempt in range(max_retries):
         try:
             # Bedrock Claude 3.5 Sonnet 호출
-            payload = {
-                "anthropic_version": "bedrock-2023-05-31",
-                "max_tokens": 4000,
-                "messages": [
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                "temperature": 0.3
-            }
-            
-            response = bedrock_runtime.invoke_model(
-                modelId=BEDROCK_MODEL_ID,
-                body=json.dumps(payload),
-                contentType="application/json"
-            )
-            
-            response_body = json.loads(response['body'].read())
-            summary = response_body['content'][0]['text']
+            run_metrics.record('bedrock_wait', bedrock_rate_limiter.acquire(request_tokens))
+            run_metrics.increment('bedrock_calls')
+            if BEDROCK_STREAMING:
+                text, truncated = stream_bedrock_response(prompt, label, max_length)
+            else:
+                text, truncated = read_bedrock_response(prompt, label), False
+            bedrock_rate_limiter.on_success()
             
-            print(f"[INFO] Bedrock 요약 성공: {title[:50]}...")
-            return {'success': True, 'summary': summary}
+            print(f"[INFO] Bedrock 요약 성공: {label[:50]}...")
+            return text, truncated
             
         except ClientError as e:
             error_code = e.response['Error']['Code']
             print(f"[ERROR] Bedrock 호출 실패 (시도 {attempt + 1}/{max_retries}): {error_code}")
             
             if error_code == 'ThrottlingException':
+                # 다른 워커와 공유하는 속도 제한기에 알리고, 재시도는 속도 제한기 대기로 조절
+                run_metrics.increment('bedrock_throttles')
+                bedrock_rate_limiter.on_throttle(RETRY_DELAY_BASE ** attempt)
                 if attempt < max_retries - 1:
-                    delay = (RETRY_DELAY_BASE ** (attempt + 1)) + 5  # 훨씬 더 긴 딜레이
-                    print(f"[INFO] ThrottlingException - {delay}초 후 재시도...")
-                    time.sleep(delay)
+                    print("[INFO] ThrottlingException - 속도 제한기 대기 후 재시도...")
                     continue
             else:
                 break
@@ -206,19 +1209,97 @@ def summarize_with_bedrock(title, body, date, link, max_retries=MAX_RETRIES):
                 delay = RETRY_DELAY_BASE ** (attempt + 1)
                 print(f"[INFO] {delay}초 후 재시도...")
                 time.sleep(delay)
+                run_metrics.record('bedrock_wait', delay)
+    
+    return None, False
+
+def summarize_with_bedrock(title, body, date, link, max_retries=MAX_RETRIES):
+    """Bedrock Claude를 사용하여 뉴스 요약
+    
+    개별 전송 모드에서 스트리밍하면 Slack 메시지 길이에서 생성을 멈추고 링크 줄을 다시 붙이며,
+    이렇게 잘린 요약은 truncated로 표시하여 요약 캐시에 저장하지 않습니다.
+    배치 전송 모드는 메시지를 자르지 않고 나누어 보내므로 끝까지 받습니다.
+    """
+    prompt = build_summary_prompt(title, body, date, link)
+    request_tokens = estimate_tokens(prompt) + OUTPUT_TOKEN_ESTIMATE
+    
+    link_line = f"\n\n🔗 자세히 보기: {link}"
+    max_length = max(1, MAX_SLACK_LENGTH - len(link_line)) if SLACK_DELIVERY_MODE != 'batch' else None
+    summary, truncated = invoke_bedrock(prompt, request_tokens, title, max_retries, max_length=max_length)
+    if summary is not None and truncated:
+        return {'success': True, 'summary': summary + link_line, 'truncated': True}
+    if summary is not None:
+        return {'success': True, 'summary': summary}
     
     # 모든 재시도 실패 시 실패 정보 반환
     print(f"[ERROR] Bedrock 요약 최종 실패: {title}")
-    fallback_message = f"🎉 {title}\n🗓 {date}\n\n요약 생성에 실패했습니다.\n\n🔗 자세히 보기: {link}"
-    return {'success': False, 'summary': fallback_message}
+    return {'success': False, 'summary': build_fallback_summary(title, date, link)}
+
+def build_fallback_summary(title, date, link):
+    """요약 생성 실패 시 전송할 대체 메시지"""
+    return f"🎉 {title}\n🗓 {date}\n\n요약 생성에 실패했습니다.\n\n🔗 자세히 보기: {link}"
+
+def parse_batch_summaries(text, count):
+    """배치 요약 응답(JSON 배열)을 뉴스 순서대로 정렬한 요약 목록으로 변환, 형식이 맞지 않으면 None"""
+    try:
+        start, end = text.index('['), text.rindex(']') + 1
+        results = json.loads(text[start:end])
+        summaries = {int(result['id']): result['summary'].strip() for result in results}
+    except (ValueError, KeyError, TypeError, AttributeError) as e:
+        print(f"[WARN] 배치 요약 응답 파싱 실패: {e}")
+        return None
+    
+    if sorted(summaries) != list(range(1, count + 1)) or not all(summaries.values()):
+        print(f"[WARN] 배치 요약 응답의 뉴스 번호가 맞지 않음: {sorted(summaries)}")
+        return None
+    return [summaries[number] for number in range(1, count + 1)]
+
+def summarize_news_batch(articles):
+    """여러 뉴스를 한 번의 Bedrock 요청으로 요약 (실패 시 뉴스별 요약으로 대체)"""
+    if len(articles) == 1:
+        return [summarize_with_bedrock(*articles[0])]
+    
+    prompt = build_batch_summary_prompt(articles)
+    request_tokens = estimate_tokens(prompt) + OUTPUT_TOKEN_ESTIMATE * len(articles)
+    text, _ = invoke_bedrock(prompt, request_tokens, f"배치 {len(articles)}건: {articles[0][0]}")
+    
+    summaries = parse_batch_summaries(text, len(articles)) if text else None
+    if summaries is None:
+        print(f"[WARN] 배치 요약 실패 - 뉴스 {len(articles)}건을 개별 요약으로 처리")
+        return [summarize_with_bedrock(*article) for article in articles]
+    return [{'success': True, 'summary': summary} for summary in summaries]
 
-def get_rss_news():
-    """RSS 피드에서 뉴스 목록 가져오기"""
+def get_rss_news(feed_state=None, feed_url=RSS_FEED_URL):
+    """RSS 피드에서 뉴스 목록 가져오기
+    
+    feed_state(피드별 상태)가 주어지면 저장된 ETag/Last-Modified로 조건부 요청을 보내고,
+    응답의 새 검증값으로 feed_state를 갱신합니다. 피드가 변경되지 않았으면(304) None을 반환합니다.
+    조건부 요청은 공용 HTTP 세션으로 보내고, feedparser는 피드가 변경된 경우에만 로드합니다.
+    """
     try:
-        feed = feedparser.parse(RSS_FEED_URL)
+        headers = {}
+        if feed_state:
+            if feed_state.get('etag'):
+                headers['If-None-Match'] = feed_state['etag']
+            if feed_state.get('modified'):
+                headers['If-Modified-Since'] = feed_state['modified']
+        
+        response = get_http_session().get(feed_url, headers=headers, timeout=REQUEST_TIMEOUT)
+        
+        if response.status_code == 304:
+            print(f"[INFO] RSS 피드 변경 없음 (304 Not Modified): {feed_url}")
+            return None
+        response.raise_for_status()
+        
+        import feedparser
+        feed = feedparser.parse(response.content)
+        
+        if feed_state is not None:
+            feed_state['etag'] = response.headers.get('ETag')
+            feed_state['modified'] = response.headers.get('Last-Modified')
         
         if not feed.entries:
-            print(f"[WARN] RSS 피드에서 뉴스를 가져올 수 없음: {RSS_FEED_URL}")
+            print(f"[WARN] RSS 피드에서 뉴스를 가져올 수 없음: {feed_url}")
             return []
         
         news_list = []
@@ -240,116 +1321,1036 @@ def get_rss_news():
                 print(f"[ERROR] RSS 항목 파싱 실패: {e}")
                 continue
         
-        print(f"[INFO] RSS에서 {len(news_list)}개 뉴스 수집 완료")
+        print(f"[INFO] RSS에서 {len(news_list)}개 뉴스 수집 완료: {feed_url}")
         return news_list
         
     except Exception as e:
-        print(f"[ERROR] RSS 피드 파싱 실패: {e}")
+        print(f"[ERROR] RSS 피드 파싱 실패 ({feed_url}): {e}")
         return []
 
-def send_to_slack(message):
-    """Slack으로 메시지 전송"""
-    try:
-        if len(message) > MAX_SLACK_LENGTH:
-            print(f"[WARN] 메시지가 너무 긺 ({len(message)}자), 잘라서 전송")
-            message = message[:MAX_SLACK_LENGTH] + "...\n(메시지가 잘렸습니다)"
-        
-        response = requests.post(
+def get_feed_state(feed_state, feed_url):
+    """실행 상태에서 피드별 상태(검증값, high-water mark) 반환 (단일 피드 시절 상태는 기본 피드로 이전)"""
+    feeds = feed_state.setdefault('feeds', {})
+    if feed_url not in feeds:
+        feeds[feed_url] = {}
+        if feed_url == RSS_FEED_URL:
+            if feed_state.get('high_water_mark') and not feed_state.get('initialized_at'):
+                feed_state['initialized_at'] = datetime.utcnow().isoformat()
+            for key in LEGACY_FEED_STATE_KEYS:
+                value = feed_state.pop(key, None)
+                if value:
+                    feeds[feed_url][key] = value
+    return feeds[feed_url]
+
+def fetch_feeds(feed_state):
+    """RSS_FEED_URLS의 피드를 동시에 조회해 {피드 URL: 뉴스 목록 (변경 없으면 None)} 반환"""
+    states = {feed_url: get_feed_state(feed_state, feed_url) for feed_url in RSS_FEED_URLS}
+    with ThreadPoolExecutor(max_workers=min(len(states), FETCH_CONCURRENCY)) as feed_pool:
+        futures = {
+            feed_url: feed_pool.submit(timed_call, 'feed', get_rss_news, state, feed_url)
+            for feed_url, state in states.items()
+        }
+        return {feed_url: future.result() for feed_url, future in futures.items()}
+
+def merge_feed_news(feed_news):
+    """피드별 뉴스를 최신순으로 합치고 정규화한 링크 기준으로 중복 제거"""
+    news_items = sorted(
+        (item for items in feed_news.values() for item in items),
+        key=lambda item: item['datetime'],
+        reverse=True
+    )
+    merged_items = dedup_news(news_items)
+    if len(feed_news) > 1:
+        print(f"[INFO] 피드 {len(feed_news)}개 병합 - 뉴스: {len(merged_items)}개 (중복 {len(news_items) - len(merged_items)}개 제외)")
+    return merged_items
+
+def update_feed_marks(feed_news, feed_state):
+    """피드별로 이번 실행에서 본 최신 발표 시각(high-water mark) 기록"""
+    for feed_url, items in feed_news.items():
+        update_high_water_mark(items, get_feed_state(feed_state, feed_url))
+
+def post_to_slack(payload, max_retries=MAX_RETRIES):
+    """Slack Webhook으로 payload 전송 (429 응답은 Retry-After만큼 대기 후 재시도)"""
+    for attempt in range(max_retries):
+        start = time.perf_counter()
+        response = get_http_session().post(
             SLACK_WEBHOOK,
-            json={"text": message},
+            json=payload,
             timeout=REQUEST_TIMEOUT
         )
+        if response.status_code == 429 and attempt < max_retries - 1:
+            delay = int(response.headers.get('Retry-After', '1'))
+            print(f"[WARN] Slack 요청 제한 (429) - {delay}초 후 재시도...")
+            time.sleep(delay)
+            continue
+        
         response.raise_for_status()
-        print("[INFO] Slack 전송 성공")
+        elapsed = time.perf_counter() - start
+        run_metrics.record('slack', elapsed)
+        print(f"[INFO] Slack 전송 성공 ({elapsed * 1000:.0f}ms)")
         return True
+
+async def post_to_slack_async(session, payload, max_retries=MAX_RETRIES):
+    """post_to_slack의 asyncio 버전 (aiohttp 세션 사용, 429 응답은 Retry-After만큼 대기 후 재시도)"""
+    for attempt in range(max_retries):
+        start = time.perf_counter()
+        async with session.post(SLACK_WEBHOOK, json=payload) as response:
+            if response.status == 429 and attempt < max_retries - 1:
+                delay = int(response.headers.get('Retry-After', '1'))
+                print(f"[WARN] Slack 요청 제한 (429) - {delay}초 후 재시도...")
+            else:
+                response.raise_for_status()
+                elapsed = time.perf_counter() - start
+                run_metrics.record('slack', elapsed)
+                print(f"[INFO] Slack 전송 성공 ({elapsed * 1000:.0f}ms)")
+                return True
+        await asyncio.sleep(delay)
+
+def truncate_for_slack(message):
+    """Slack 메시지 최대 길이를 넘으면 잘라서 반환"""
+    if len(message) > MAX_SLACK_LENGTH:
+        print(f"[WARN] 메시지가 너무 긺 ({len(message)}자), 잘라서 전송")
+        message = message[:MAX_SLACK_LENGTH] + "...\n(메시지가 잘렸습니다)"
+    return message
+
+def send_to_slack(message):
+    """Slack으로 메시지 전송"""
+    try:
+        return post_to_slack({"text": truncate_for_slack(message)})
         
     except Exception as e:
         print(f"[ERROR] Slack 전송 실패: {e}")
         return False
 
-def lambda_handler(event, context):
-    """Lambda 핸들러 함수"""
-    print("[INFO] AWS News to Slack 처리 시작")
+async def send_to_slack_async(session, message):
+    """send_to_slack의 asyncio 버전 (aiohttp 세션이 없으면 동기 함수를 스레드에서 실행)"""
+    if session is None:
+        return await asyncio.to_thread(send_to_slack, message)
     
     try:
-        # AWS 클라이언트 초기화
-        initialize_aws_clients()
+        return await post_to_slack_async(session, {"text": truncate_for_slack(message)})
         
-        # RSS 뉴스 가져오기
-        news_items = get_rss_news()
-        if not news_items:
-            return {'statusCode': 200, 'body': 'No news found'}
+    except Exception as e:
+        print(f"[ERROR] Slack 전송 실패: {e}")
+        return False
+
+def split_for_section(text, limit=SLACK_SECTION_MAX_LENGTH):
+    """section 블록 길이 제한에 맞춰 줄 단위로 텍스트 분할 (한 줄이 너무 길면 강제 분할)"""
+    chunks = []
+    current = ""
+    for line in text.split('\n'):
+        while len(line) > limit:
+            if current:
+                chunks.append(current)
+                current = ""
+            chunks.append(line[:limit])
+            line = line[limit:]
         
-        # 초기 실행 확인
-        if is_initial_run():
-            print("[INFO] 초기 실행 감지 - 기록만 수행하고 알림은 전송하지 않음")
-            
-            # 모든 뉴스를 DynamoDB에 기록만 함
-            for item in news_items:
-                news_id = generate_news_id(item['link'])
-                save_processed_news(news_id, item['title'], item['link'])
-            
-            return {
-                'statusCode': 200, 
-                'body': f'Initial run completed - recorded {len(news_items)} news items'
-            }
+        candidate = f"{current}\n{line}" if current else line
+        if len(candidate) > limit:
+            chunks.append(current)
+            current = line
+        else:
+            current = candidate
+    
+    if current:
+        chunks.append(current)
+    return chunks
+
+def build_slack_batches(summaries):
+    """요약 목록을 Block Kit 메시지로 묶음 (뉴스 단위로만 메시지를 나눔)
+    
+    반환값은 (blocks, 포함된 요약 개수) 목록입니다.
+    """
+    batches = []
+    blocks = []
+    count = 0
+    length = 0
+    
+    for summary in summaries:
+        item_blocks = [
+            {"type": "section", "text": {"type": "mrkdwn", "text": chunk}}
+            for chunk in split_for_section(summary)
+        ]
+        
+        # 현재 메시지에 들어가지 않으면 새 메시지 시작 (구분선 포함 계산)
+        if blocks and (len(blocks) + 1 + len(item_blocks) > SLACK_MAX_BLOCKS
+                       or length + len(summary) > SLACK_BATCH_MAX_LENGTH):
+            batches.append((blocks, count))
+            blocks, count, length = [], 0, 0
         
-        # 새로운 뉴스 필터링 및 순차 처리
-        new_news_count = 0
-        summary_success_count = 0
-        slack_success_count = 0
+        if blocks:
+            blocks.append({"type": "divider"})
+        blocks.extend(item_blocks)
+        count += 1
+        length += len(summary)
+    
+    if blocks:
+        batches.append((blocks, count))
+    return batches
+
+def send_batch_to_slack(summaries):
+    """요약 목록을 최소한의 Block Kit 메시지로 전송, 전송에 성공한 요약 개수 반환"""
+    delivered = 0
+    batches = build_slack_batches(summaries)
+    for page, (blocks, count) in enumerate(batches, start=1):
+        try:
+            post_to_slack({"text": f"AWS 새 소식 {count}건 ({page}/{len(batches)})", "blocks": blocks})
+            delivered += count
+        except Exception as e:
+            print(f"[ERROR] Slack 배치 전송 실패 ({page}/{len(batches)}): {e}")
+    
+    print(f"[INFO] Slack 배치 전송 완료 - 메시지 {len(batches)}개, 요약 {delivered}/{len(summaries)}개")
+    return delivered
+
+def record_latency(stage, seconds):
+    """단계별 소요 시간을 실행 지표에 기록하고, 시간 예산 계산에 쓰는 단계는 이동 평균 갱신"""
+    run_metrics.record(stage, seconds)
+    with stage_latency_lock:
+        if stage in stage_latency:
+            stage_latency[stage] = (1 - LATENCY_EMA_ALPHA) * stage_latency[stage] + LATENCY_EMA_ALPHA * seconds
+
+def timed_call(stage, func, *args):
+    """함수를 실행하고 소요 시간을 단계별 이동 평균에 반영"""
+    start = time.perf_counter()
+    try:
+        return func(*args)
+    finally:
+        record_latency(stage, time.perf_counter() - start)
+
+class TimeBudget:
+    """Lambda 남은 실행 시간과 최근 단계별 소요 시간으로 처리 가능한 작업량 추정"""
+    
+    def __init__(self, context=None):
+        self.context = context
+        self.summary_started = False
+    
+    def remaining(self):
+        """안전 여유 시간을 뺀 남은 시간 (초, context가 없으면 무제한)"""
+        if self.context is None or not hasattr(self.context, 'get_remaining_time_in_millis'):
+            return float('inf')
+        return (self.context.get_remaining_time_in_millis() - DEADLINE_SAFETY_MARGIN_MS) / 1000
+    
+    def item_interval(self):
+        """요약 단계에서 뉴스 한 건이 차지하는 평균 시간 (동시성과 분당 호출 제한 반영)"""
+        with stage_latency_lock:
+            interval = stage_latency['summarize'] / max(1, BEDROCK_CONCURRENCY)
+        if BEDROCK_MAX_RPM > 0:
+            interval = max(interval, 60.0 / BEDROCK_MAX_RPM)
+        return interval
+    
+    def capacity(self):
+        """남은 시간 안에 끝낼 수 있는 뉴스 개수 (제한이 없으면 None)"""
+        remaining = self.remaining()
+        if remaining == float('inf'):
+            return None
+        with stage_latency_lock:
+            first_item = stage_latency['fetch'] + stage_latency['summarize']
+        # 이동 평균이 남은 시간보다 커져도(스로틀링 직후 등) 한 건은 처리해야 평균이 갱신되고 처리가 진행됨
+        if remaining < first_item:
+            return 1
+        return int((remaining - first_item) / self.item_interval()) + 1
+    
+    def can_start_summary(self, queued):
+        """대기 중인 요약이 queued개일 때 새 요약을 시작해도 시간 안에 끝나는지 확인 (실행마다 첫 요약은 항상 시작)"""
+        if not self.summary_started:
+            self.summary_started = True
+            return True
+        with stage_latency_lock:
+            summarize = stage_latency['summarize']
+        return self.remaining() >= summarize + queued * self.item_interval()
+
+def serialize_pending_items(news_items):
+    """다음 실행에서 이어서 처리할 뉴스를 DynamoDB에 저장할 수 있는 형태로 변환"""
+    return [
+        {
+            'title': item['title'],
+            'link': item['link'],
+            'date': item['date'],
+            'datetime': item['datetime'].isoformat(),
+        }
+        for item in news_items
+    ]
+
+def restore_pending_items(feed_state):
+    """feed_state에 기록된 미처리 뉴스 목록 복원"""
+    return [
+        dict(item, datetime=datetime.fromisoformat(item['datetime']))
+        for item in feed_state.get('pending_items', [])
+    ]
+
+def reinvoke_self(context, depth=1):
+    """미처리 뉴스를 이어서 처리하도록 Lambda 함수를 비동기로 다시 호출 (depth: 연속 재호출 횟수)"""
+    try:
+        lambda_client = boto3.client('lambda', region_name=AWS_REGION)
+        lambda_client.invoke(
+            FunctionName=context.function_name,
+            InvocationType='Event',
+            Payload=json.dumps({'resume': True, 'reinvoke_depth': depth})
+        )
+        print(f"[INFO] 미처리 뉴스 처리를 위해 비동기 재호출 ({depth}/{SELF_REINVOKE_MAX_DEPTH})")
+        return True
+    except Exception as e:
+        print(f"[ERROR] 비동기 재호출 실패 - 다음 정기 실행에서 이어서 처리: {e}")
+        return False
+
+def resolve_summary_futures(batch_future, item_futures):
+    """배치 요약 작업 결과를 뉴스별 Future에 전달"""
+    try:
+        results = batch_future.result()
+    except Exception as e:
+        for item_future in item_futures:
+            item_future.set_exception(e)
+        return
+    for item_future, result in zip(item_futures, results):
+        item_future.set_result(result)
+
+def limit_to_capacity(news_items, budget, stats):
+    """남은 시간 안에 끝낼 수 있는 만큼만 반환하고 나머지는 stats['deferred']로 다음 실행에 미룸"""
+    capacity = budget.capacity()
+    if capacity is not None and capacity < len(news_items):
+        print(f"[WARN] 남은 시간 부족 - {capacity}/{len(news_items)}개만 처리하고 나머지는 다음 실행으로 미룸")
+        stats['deferred'] = news_items[capacity:]
+        return news_items[:capacity]
+    return news_items
+
+def finish_news_stats(stats, news_items, deferred_indexes):
+    """요약을 시작하지 못한 뉴스를 미룬 목록에 합치고 실행 지표에 결과 기록"""
+    if deferred_indexes:
+        print(f"[WARN] 남은 시간 부족으로 요약하지 못한 뉴스 {len(deferred_indexes)}개를 다음 실행으로 미룸")
+    stats['deferred'] = [news_items[index] for index in sorted(deferred_indexes)] + stats['deferred']
+    for name in ('new', 'summary_success', 'slack_success'):
+        run_metrics.increment(name, stats[name])
+    run_metrics.increment('deferred', len(stats['deferred']))
+    return stats
+
+class SummaryBatchPlanner:
+    """본문이 준비된 뉴스를 요약 작업으로 묶어 시작 (스레드/asyncio 파이프라인 공용)
+    
+    BEDROCK_BATCH_SIZE가 2 이상이면 캐시에 없는 뉴스를 토큰 예산 안에서 모아 한 번에 요약하며,
+    남은 시간 안에 끝낼 수 없는 배치는 시작하지 않고 deferred_indexes에 넣어 다음 실행으로 미룹니다.
+    배치를 시작할 때 호출하는 submit(indexes, articles)은 뉴스별 요약 Future를 summary_futures에 등록합니다.
+    """
+    
+    def __init__(self, news_items, main_texts, summary_futures, budget, submit):
+        self.news_items = news_items
+        self.main_texts = main_texts
+        self.summary_futures = summary_futures
+        self.budget = budget
+        self.submit = submit
+        # 배치 크기는 출력 토큰 한도 안에 들어가도록 제한
+        self.max_batch_size = max(1, min(BEDROCK_BATCH_SIZE, BEDROCK_BATCH_SIZE_MAX))
+        if BEDROCK_BATCH_SIZE > self.max_batch_size:
+            print(f"[WARN] BEDROCK_BATCH_SIZE={BEDROCK_BATCH_SIZE}가 출력 토큰 한도로 정한 최대값보다 커서 "
+                  f"{self.max_batch_size}개씩 요약")
+        self.deferred_indexes = set()
+        self.batch = []
+        self.batch_tokens = 0
+    
+    def add(self, index):
+        """뉴스를 배치에 추가 (토큰 예산을 넘기 전이나 배치가 가득 차면 요약 시작)"""
+        article_tokens = estimate_tokens(self.main_texts[index])
+        if self.batch and self.batch_tokens + article_tokens > BEDROCK_BATCH_TOKEN_BUDGET:
+            self.flush()
+        self.batch.append(index)
+        self.batch_tokens += article_tokens
+        if len(self.batch) >= self.max_batch_size:
+            self.flush()
+    
+    def flush(self):
+        """모아둔 뉴스를 하나의 요약 작업으로 시작 (시간 안에 끝낼 수 없으면 다음 실행으로 미룸)"""
+        indexes, self.batch, self.batch_tokens = sorted(self.batch), [], 0
+        if not indexes:
+            return
         
-        # 첫 번째 요청 전 딜레이
-        print("[INFO] Bedrock 요청 제한 방지를 위해 초기 3초 대기...")
-        time.sleep(3)
+        queued = sum(1 for summary_future in self.summary_futures.values() if not summary_future.done())
+        if not self.budget.can_start_summary(queued):
+            self.deferred_indexes.update(indexes)
+            return
         
-        for item in news_items:
-            news_id = generate_news_id(item['link'])
+        articles = [
+            (self.news_items[index]['title'], self.main_texts[index], self.news_items[index]['date'],
+             self.news_items[index]['link'])
+            for index in indexes
+        ]
+        self.submit(indexes, articles)
+
+def cached_summary_result(item, cached_summary):
+    """캐시된 요약을 요약 결과 형태로 변환"""
+    print(f"[INFO] 캐시된 요약 사용: {item['title'][:50]}...")
+    return {'success': True, 'summary': cached_summary, 'cached': True}
+
+def delivery_order(news_items, main_texts, deferred_indexes):
+    """3단계에서 피드 순서대로 처리할 뉴스를 (순번, 뉴스 ID, 뉴스, 본문 유무)로 반환 (미룬 뉴스 제외)"""
+    for index, item in enumerate(news_items):
+        if index in deferred_indexes:
+            continue
+        print(f"[INFO] 새 뉴스 처리 중 ({index + 1}/{len(news_items)}): {item['title'][:50]}...")
+        if not main_texts[index]:
+            # 본문이 없어도 DynamoDB에는 기록하여 중복 방지
+            print(f"[WARN] 본문이 없어 건너뜀: {item['title']}")
+        yield index, generate_news_id(item['link']), item, bool(main_texts[index])
+
+def record_summary_result(item, bedrock_result, stats):
+    """요약 결과를 실행 통계에 반영하고, 새로 만든 완전한 요약이라 캐시에 저장해야 하면 True 반환 (길이 제한으로 잘린 요약은 제외)"""
+    if not bedrock_result['success']:
+        print(f"[WARN] 요약 실패, 기본 메시지 사용: {item['title'][:50]}...")
+        return False
+    stats['summary_success'] += 1
+    print(f"[INFO] 요약 성공: {item['title'][:50]}...")
+    return not bedrock_result.get('cached') and not bedrock_result.get('truncated')
+
+def deliver_batched(batched, writer):
+    """배치 전송 모드에서 모아둔 요약을 한 번에 Slack으로 전송하고 기록 (Slack 전송 성공 수 반환)"""
+    if not batched:
+        return 0
+    slack_success = send_batch_to_slack([summary for _, _, summary in batched])
+    for news_id, item, summary in batched:
+        writer.add(news_id, item['title'], item['link'], summary)
+    return slack_success
+
+def process_news_items(news_items, writer, budget=None):
+    """새 뉴스를 단계별 워커 풀로 처리 (본문 추출 → Bedrock 요약 → Slack 전송 → 저장 버퍼)
+    
+    budget의 남은 시간 안에 끝낼 수 없는 뉴스는 처리하지 않고 stats['deferred']로 반환합니다.
+    EXECUTION_MODE=async이면 같은 단계를 asyncio 이벤트 루프에서 실행합니다 (process_news_items_async).
+    """
+    if EXECUTION_MODE == 'async':
+        return asyncio.run(process_news_items_async(news_items, writer, budget))
+    
+    budget = budget or TimeBudget()
+    stats = {'new': len(news_items), 'summary_success': 0, 'slack_success': 0, 'deferred': []}
+    if not news_items:
+        return stats
+    
+    # 남은 시간 안에 끝낼 수 있는 만큼만 처리하고 나머지는 다음 실행으로 미룸
+    news_items = limit_to_capacity(news_items, budget, stats)
+    main_texts = {}
+    cache_keys = {}
+    summary_futures = {}
+    batched = []
+    
+    with ThreadPoolExecutor(max_workers=FETCH_CONCURRENCY) as fetch_pool, \
+            ThreadPoolExecutor(max_workers=BEDROCK_CONCURRENCY) as summary_pool:
+        def submit_batch(indexes, articles):
+            """배치 요약 작업을 요약 워커 풀에 제출하고 뉴스별 Future 등록"""
+            item_futures = [Future() for _ in indexes]
+            summary_futures.update(zip(indexes, item_futures))
+            batch_future = summary_pool.submit(timed_call, 'summarize', summarize_news_batch, articles)
+            batch_future.add_done_callback(lambda done: resolve_summary_futures(done, item_futures))
+        
+        planner = SummaryBatchPlanner(news_items, main_texts, summary_futures, budget, submit_batch)
+        
+        # 1단계: 본문 추출은 병렬로 진행
+        fetch_futures = {
+            fetch_pool.submit(timed_call, 'fetch', extract_main_text, item['link']): index
+            for index, item in enumerate(news_items)
+        }
+        
+        # 2단계: 본문이 준비되는 대로 캐시 확인 후 Bedrock 요약 요청 (동시성/호출 간격 제한 적용)
+        for future in as_completed(fetch_futures):
+            index = fetch_futures[future]
+            item = news_items[index]
+            main_texts[index] = future.result()
+            if not main_texts[index]:
+                continue
             
-            # 이미 처리된 뉴스인지 확인
-            if is_news_processed(news_id):
+            cache_keys[index] = summary_cache_key(item['title'], main_texts[index], item['date'], item['link'])
+            cached_summary = get_cached_summary(cache_keys[index])
+            if cached_summary:
+                summary_futures[index] = Future()
+                summary_futures[index].set_result(cached_summary_result(item, cached_summary))
+            else:
+                planner.add(index)
+        planner.flush()
+        
+        # 3단계: 피드 순서대로 Slack 전송 및 DynamoDB 저장 (배치 모드에서는 모아서 한 번에 전송)
+        for index, news_id, item, has_body in delivery_order(news_items, main_texts, planner.deferred_indexes):
+            if not has_body:
+                writer.add(news_id, item['title'], item['link'])
                 continue
             
-            new_news_count += 1
-            print(f"[INFO] 새 뉴스 처리 중 ({new_news_count}): {item['title'][:50]}...")
+            bedrock_result = summary_futures[index].result()
+            if record_summary_result(item, bedrock_result, stats):
+                save_cached_summary(cache_keys[index], bedrock_result['summary'])
             
-            # 본문 추출
-            main_text = extract_main_text(item['link'])
-            if not main_text:
-                print(f"[WARN] 본문이 없어 건너뜀: {item['title']}")
-                # 본문이 없어도 DynamoDB에는 기록하여 중복 방지
-                save_processed_news(news_id, item['title'], item['link'])
+            if SLACK_DELIVERY_MODE == 'batch':
+                batched.append((news_id, item, bedrock_result['summary']))
                 continue
             
-            # Bedrock으로 요약 생성 (순차 처리)
-            bedrock_result = summarize_with_bedrock(
-                item['title'], 
-                main_text, 
-                item['date'], 
-                item['link']
-            )
+            if send_to_slack(bedrock_result['summary']):
+                stats['slack_success'] += 1
+            writer.add(news_id, item['title'], item['link'], bedrock_result['summary'])
+    
+    stats['slack_success'] += deliver_batched(batched, writer)
+    return finish_news_stats(stats, news_items, planner.deferred_indexes)
+
+@asynccontextmanager
+async def open_async_session():
+    """aiohttp 세션 생성 (aiohttp가 설치되지 않았으면 None - 요청은 동기 함수를 스레드에서 실행)"""
+    try:
+        import aiohttp
+    except ImportError:
+        print("[INFO] aiohttp 미설치 - 페이지 수신과 Slack 전송을 asyncio.to_thread로 실행")
+        yield None
+        return
+    
+    connector = aiohttp.TCPConnector(limit_per_host=HTTP_POOL_MAXSIZE)
+    timeout = aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout,
+                                     headers={'Accept-Encoding': 'gzip, deflate'}) as session:
+        yield session
+
+async def process_news_items_async(news_items, writer, budget=None):
+    """process_news_items의 asyncio 버전 (EXECUTION_MODE=async)
+    
+    페이지 수신과 Slack 전송은 aiohttp로, Bedrock 요약과 DynamoDB 호출은 asyncio.to_thread로 이벤트 루프 밖에서
+    실행합니다. 배치 구성과 전송 판단은 동기 경로와 같은 SummaryBatchPlanner/delivery_order를 사용합니다.
+    """
+    budget = budget or TimeBudget()
+    stats = {'new': len(news_items), 'summary_success': 0, 'slack_success': 0, 'deferred': []}
+    if not news_items:
+        return stats
+    
+    news_items = limit_to_capacity(news_items, budget, stats)
+    main_texts = {}
+    cache_keys = {}
+    summary_futures = {}
+    batched = []
+    fetch_slots = asyncio.Semaphore(FETCH_CONCURRENCY)
+    summary_slots = asyncio.Semaphore(BEDROCK_CONCURRENCY)
+    loop = asyncio.get_running_loop()
+    
+    async with open_async_session() as session:
+        async def fetch(index):
+            async with fetch_slots:
+                start = time.perf_counter()
+                try:
+                    return index, await extract_main_text_async(session, news_items[index]['link'])
+                finally:
+                    record_latency('fetch', time.perf_counter() - start)
+        
+        async def summarize(articles):
+            async with summary_slots:
+                return await asyncio.to_thread(timed_call, 'summarize', summarize_news_batch, articles)
+        
+        def submit_batch(indexes, articles):
+            """배치 요약 작업을 생성하고 뉴스별 Future 등록"""
+            item_futures = [loop.create_future() for _ in indexes]
+            summary_futures.update(zip(indexes, item_futures))
+            batch_task = asyncio.ensure_future(summarize(articles))
+            batch_task.add_done_callback(lambda done: resolve_summary_futures(done, item_futures))
+        
+        planner = SummaryBatchPlanner(news_items, main_texts, summary_futures, budget, submit_batch)
+        
+        # 1단계: 본문 추출은 동시에 진행
+        fetch_tasks = [asyncio.ensure_future(fetch(index)) for index in range(len(news_items))]
+        
+        # 2단계: 본문이 준비되는 대로 캐시 확인 후 요약 작업 생성
+        for next_fetch in asyncio.as_completed(fetch_tasks):
+            index, main_texts[index] = await next_fetch
+            item = news_items[index]
+            if not main_texts[index]:
+                continue
             
-            # 요약 성공 여부 체크
-            if bedrock_result['success']:
-                summary_success_count += 1
-                print(f"[INFO] 요약 성공: {item['title'][:50]}...")
+            cache_keys[index] = summary_cache_key(item['title'], main_texts[index], item['date'], item['link'])
+            cached_summary = await asyncio.to_thread(get_cached_summary, cache_keys[index])
+            if cached_summary:
+                summary_futures[index] = loop.create_future()
+                summary_futures[index].set_result(cached_summary_result(item, cached_summary))
             else:
-                print(f"[WARN] 요약 실패, 기본 메시지 사용: {item['title'][:50]}...")
+                planner.add(index)
+        planner.flush()
+        
+        # 3단계: 피드 순서대로 Slack 전송 및 DynamoDB 저장 (뒤 뉴스의 요약은 그동안 계속 진행)
+        for index, news_id, item, has_body in delivery_order(news_items, main_texts, planner.deferred_indexes):
+            if not has_body:
+                await asyncio.to_thread(writer.add, news_id, item['title'], item['link'])
+                continue
             
-            # Slack으로 전송
-            if send_to_slack(bedrock_result['summary']):
-                slack_success_count += 1
+            bedrock_result = await summary_futures[index]
+            if record_summary_result(item, bedrock_result, stats):
+                await asyncio.to_thread(save_cached_summary, cache_keys[index], bedrock_result['summary'])
+            
+            if SLACK_DELIVERY_MODE == 'batch':
+                batched.append((news_id, item, bedrock_result['summary']))
+                continue
             
-            # DynamoDB에 저장
-            save_processed_news(news_id, item['title'], item['link'], bedrock_result['summary'])
+            if await send_to_slack_async(session, bedrock_result['summary']):
+                stats['slack_success'] += 1
+            await asyncio.to_thread(writer.add, news_id, item['title'], item['link'], bedrock_result['summary'])
+    
+    if batched:
+        stats['slack_success'] += await asyncio.to_thread(deliver_batched, batched, writer)
+    return finish_news_stats(stats, news_items, planner.deferred_indexes)
+
+class InMemoryQueue:
+    """로컬 테스트용 SQS 대체 구현 (send_message_batch 인터페이스 호환)"""
+    
+    def __init__(self):
+        self.messages = []
+    
+    def send_message_batch(self, QueueUrl, Entries):
+        for entry in Entries:
+            self.messages.append({
+                'messageId': f"msg-{len(self.messages)}",
+                'body': entry['MessageBody'],
+            })
+        return {'Successful': [{'Id': entry['Id']} for entry in Entries], 'Failed': []}
+    
+    def drain_worker_event(self):
+        """쌓인 메시지를 worker_handler에 전달할 SQS 이벤트 형태로 꺼냄"""
+        records, self.messages = self.messages, []
+        return {'Records': records}
+
+def get_news_queue():
+    """fan-out 모드 뉴스 큐 클라이언트 반환"""
+    global news_queue
+    
+    if news_queue is None:
+        news_queue = boto3.client('sqs', region_name=AWS_REGION)
+    return news_queue
+
+def enqueue_news_items(news_items):
+    """새 뉴스를 SQS 큐에 10개 단위로 넣고, 넣지 못한 뉴스 목록 반환"""
+    queue = get_news_queue()
+    failed_items = []
+    for start in range(0, len(news_items), SQS_BATCH_SIZE):
+        chunk = news_items[start:start + SQS_BATCH_SIZE]
+        entries = [
+            {'Id': str(index), 'MessageBody': json.dumps(message, ensure_ascii=False)}
+            for index, message in enumerate(serialize_pending_items(chunk))
+        ]
+        try:
+            response = queue.send_message_batch(QueueUrl=NEWS_QUEUE_URL, Entries=entries)
+            failed_items.extend(chunk[int(failure['Id'])] for failure in response.get('Failed', []))
+        except Exception as e:
+            print(f"[ERROR] SQS 전송 실패: {e}")
+            failed_items.extend(chunk)
+    
+    print(f"[INFO] SQS 전송 완료 - {len(news_items) - len(failed_items)}/{len(news_items)}개")
+    return failed_items
+
+def is_news_queued(news_id):
+    """poller가 큐에 넣은 뒤 아직 워커가 처리하지 않은 뉴스인지 확인"""
+    try:
+        response = table.get_item(Key={'id': news_id}, ConsistentRead=True)
+        return response.get('Item', {}).get('status') == 'queued'
+    except Exception as e:
+        # 확인에 실패하면 누락보다 처리를 우선
+        print(f"[ERROR] DynamoDB 조회 실패 (ID: {news_id}): {e}")
+        return True
+
+class BedrockBatchJobService:
+    """Bedrock Batch Inference 작업 서비스 (입력/출력 JSONL은 S3에 저장)"""
+    
+    # 작업당 최소 레코드 수 (이보다 적으면 작업 검증에 실패)
+    min_records = BACKFILL_MIN_RECORDS
+    
+    def __init__(self, s3_uri, role_arn):
+        self.bucket, _, prefix = s3_uri[len('s3://'):].partition('/')
+        self.prefix = prefix.strip('/')
+        self.role_arn = role_arn
+        self.bedrock = boto3.client('bedrock', region_name=AWS_REGION)
+        self.s3 = boto3.client('s3', region_name=AWS_REGION)
+    
+    def _key(self, *parts):
+        return '/'.join(part for part in (self.prefix,) + parts if part)
+    
+    def submit(self, job_name, records):
+        """입력 레코드를 S3에 올리고 작업을 생성한 뒤 작업 ARN 반환"""
+        input_key = self._key(job_name, 'input.jsonl')
+        body = '\n'.join(json.dumps(record, ensure_ascii=False) for record in records)
+        self.s3.put_object(Bucket=self.bucket, Key=input_key, Body=body.encode('utf-8'))
+        
+        response = self.bedrock.create_model_invocation_job(
+            jobName=job_name,
+            roleArn=self.role_arn,
+            modelId=BEDROCK_MODEL_ID,
+            inputDataConfig={'s3InputDataConfig': {'s3InputFormat': 'JSONL', 's3Uri': f"s3://{self.bucket}/{input_key}"}},
+            outputDataConfig={'s3OutputDataConfig': {'s3Uri': f"s3://{self.bucket}/{self._key(job_name, 'output')}/"}}
+        )
+        return response['jobArn']
+    
+    def get_status(self, job_id):
+        return self.bedrock.get_model_invocation_job(jobIdentifier=job_id)['status']
+    
+    def read_outputs(self, job_id):
+        """작업 출력(<출력 위치>/<작업 ID>/*.jsonl.out)의 레코드를 차례로 반환"""
+        job = self.bedrock.get_model_invocation_job(jobIdentifier=job_id)
+        output_uri = job['outputDataConfig']['s3OutputDataConfig']['s3Uri']
+        bucket, _, prefix = output_uri[len('s3://'):].partition('/')
+        prefix = f"{prefix.rstrip('/')}/{job_id.split('/')[-1]}/"
+        
+        paginator = self.s3.get_paginator('list_objects_v2')
+        for page in paginator.paginate(Bucket=bucket, Prefix=prefix):
+            for obj in page.get('Contents', []):
+                if not obj['Key'].endswith('.jsonl.out'):
+                    continue
+                body = self.s3.get_object(Bucket=bucket, Key=obj['Key'])['Body'].read().decode('utf-8')
+                for line in body.splitlines():
+                    if line.strip():
+                        yield json.loads(line)
+
+class LocalBatchJobService:
+    """로컬 테스트용 Batch Inference 대체 구현 (BedrockBatchJobService 인터페이스 호환)
+    
+    submit은 <디렉터리>/<작업 이름>/input.jsonl에 입력을 쓰고, 같은 위치에 input.jsonl.out이 생기면
+    작업이 완료된 것으로 봅니다. responder(요청 본문 → 응답 텍스트)를 주면 제출 즉시 출력을 작성합니다.
+    """
+    
+    min_records = 1
+    
+    def __init__(self, directory, responder=None):
+        self.directory = directory
+        self.responder = responder
+    
+    def _path(self, job_id, name):
+        return os.path.join(self.directory, job_id, name)
+    
+    def submit(self, job_name, records):
+        os.makedirs(os.path.join(self.directory, job_name), exist_ok=True)
+        with open(self._path(job_name, 'input.jsonl'), 'w', encoding='utf-8') as fh:
+            for record in records:
+                fh.write(json.dumps(record, ensure_ascii=False) + '\n')
+        if self.responder:
+            self.complete(job_name, self.responder)
+        return job_name
+    
+    def complete(self, job_id, responder):
+        """입력 레코드마다 responder 응답으로 Batch Inference 형식의 출력 파일 작성"""
+        with open(self._path(job_id, 'input.jsonl'), encoding='utf-8') as fh:
+            records = [json.loads(line) for line in fh if line.strip()]
+        with open(self._path(job_id, 'input.jsonl.out'), 'w', encoding='utf-8') as fh:
+            for record in records:
+                record['modelOutput'] = {'content': [{'type': 'text', 'text': responder(record['modelInput'])}]}
+                fh.write(json.dumps(record, ensure_ascii=False) + '\n')
+    
+    def get_status(self, job_id):
+        return 'Completed' if os.path.exists(self._path(job_id, 'input.jsonl.out')) else 'InProgress'
+    
+    def read_outputs(self, job_id):
+        with open(self._path(job_id, 'input.jsonl.out'), encoding='utf-8') as fh:
+            for line in fh:
+                if line.strip():
+                    yield json.loads(line)
+
+def validate_backfill_config():
+    """BACKFILL_MODE=batch 설정 검증 (작업이 끝나지 않거나 검증에 실패할 설정이면 ValueError)"""
+    if not BACKFILL_JOB_URI.startswith('s3://'):
+        raise ValueError(f"BACKFILL_MODE=batch에는 s3:// 형식의 BACKFILL_JOB_URI가 필요합니다: {BACKFILL_JOB_URI!r}")
+    if not BACKFILL_ROLE_ARN:
+        raise ValueError("BACKFILL_MODE=batch에는 BACKFILL_ROLE_ARN이 필요합니다")
+    if 0 < BACKFILL_MAX_ITEMS < BACKFILL_MIN_RECORDS:
+        raise ValueError(f"BACKFILL_MAX_ITEMS({BACKFILL_MAX_ITEMS})가 작업당 최소 레코드 수({BACKFILL_MIN_RECORDS})보다 작습니다")
+    if 0 < BACKFILL_CATCHUP_THRESHOLD < BACKFILL_MIN_RECORDS:
+        raise ValueError(
+            f"BACKFILL_CATCHUP_THRESHOLD({BACKFILL_CATCHUP_THRESHOLD})가 작업당 최소 레코드 수({BACKFILL_MIN_RECORDS})보다 작습니다"
+        )
+
+def get_batch_job_service():
+    """백필 Batch Inference 작업 서비스 반환 (테스트는 batch_job_service에 대체 구현을 넣어 사용)"""
+    global batch_job_service
+    
+    if batch_job_service is None:
+        validate_backfill_config()
+        batch_job_service = BedrockBatchJobService(BACKFILL_JOB_URI, BACKFILL_ROLE_ARN)
+    return batch_job_service
+
+def parse_batch_inference_outputs(records):
+    """Batch Inference 출력 레코드를 레코드 ID(뉴스 ID) → 요약 텍스트로 변환 (오류 레코드는 제외)"""
+    summaries = {}
+    for record in records:
+        try:
+            summaries[record['recordId']] = record['modelOutput']['content'][0]['text']
+        except (KeyError, IndexError, TypeError):
+            print(f"[WARN] 백필 요약 실패 레코드: {record.get('recordId')} - {record.get('error')}")
+    return summaries
+
+def start_backfill_job(news_items, feed_state, writer):
+    """뉴스 요약 요청을 Batch Inference 작업 하나로 제출하고, 작업에 포함하지 못한 뉴스 목록 반환
+    
+    제출한 뉴스는 'backfill' 상태로 기록해 실시간 처리 대상에서 빼고, 작업 정보는 feed_state에 남겨
+    다음 실행의 consume_backfill_job이 결과를 가져가도록 합니다.
+    """
+    if not news_items:
+        return []
+    
+    service = get_batch_job_service()
+    if len(news_items) < service.min_records:
+        print(f"[INFO] 뉴스 {len(news_items)}개 - 작업당 최소 레코드 수({service.min_records}) 미만이라 백필 작업을 제출하지 않음")
+        return news_items
+    
+    with ThreadPoolExecutor(max_workers=FETCH_CONCURRENCY) as fetch_pool:
+        main_texts = list(fetch_pool.map(extract_main_text, [item['link'] for item in news_items]))
+    
+    job_items = [(item, main_text) for item, main_text in zip(news_items, main_texts) if main_text]
+    records = [
+        {
+            'recordId': generate_news_id(item['link']),
+            'modelInput': build_model_input(build_summary_prompt(item['title'], main_text, item['date'], item['link']))
+        }
+        for item, main_text in job_items
+    ]
+    if len(records) < service.min_records:
+        print(f"[INFO] 본문을 가져온 뉴스 {len(records)}개 - 작업당 최소 레코드 수({service.min_records}) 미만이라 백필 작업을 제출하지 않음")
+        return news_items
+    
+    job_name = f"aws-news-backfill-{datetime.utcnow().strftime('%Y%m%d%H%M%S')}"
+    try:
+        job_id = service.submit(job_name, records)
+    except Exception as e:
+        print(f"[ERROR] 백필 작업 제출 실패: {e}")
+        return news_items
+    
+    print(f"[INFO] 백필 작업 제출 완료 - 뉴스 {len(records)}개: {job_id}")
+    feed_state['backfill_job'] = {
+        'job_id': job_id,
+        'items': serialize_pending_items([item for item, _ in job_items]),
+    }
+    for item, _ in job_items:
+        writer.add(generate_news_id(item['link']), item['title'], item['link'], status='backfill')
+    
+    submitted_ids = {record['recordId'] for record in records}
+    return [item for item in news_items if generate_news_id(item['link']) not in submitted_ids]
+
+def release_backfill_items(news_items):
+    """요약을 받지 못한 백필 뉴스의 'backfill' 처리 기록을 지워 실시간 처리 대상으로 되돌리고, 되돌린 뉴스 목록 반환
+    
+    기록이 이미 다른 상태(실시간 처리 완료 등)로 바뀐 뉴스는 지우지 않고 제외합니다.
+    """
+    released = []
+    for item in news_items:
+        news_id = generate_news_id(item['link'])
+        recent_news_ids.pop(news_id, None)
+        try:
+            table.delete_item(
+                Key={'id': news_id},
+                ConditionExpression='#status = :backfill',
+                ExpressionAttributeNames={'#status': 'status'},
+                ExpressionAttributeValues={':backfill': 'backfill'}
+            )
+            released.append(item)
+        except ClientError as e:
+            if e.response['Error']['Code'] != 'ConditionalCheckFailedException':
+                print(f"[ERROR] 백필 처리 기록 삭제 실패 (ID: {news_id}): {e}")
+        except Exception as e:
+            print(f"[ERROR] 백필 처리 기록 삭제 실패 (ID: {news_id}): {e}")
+    return released
+
+def get_backfill_pending_ids(news_ids, max_retries=MAX_RETRIES):
+    """처리 기록이 아직 'backfill' 상태인 뉴스 ID 집합 반환 (BatchGetItem 강한 일관성 읽기)
+    
+    오래된 작업 정보로 다시 전송하지 않도록, 이미 실시간 처리나 다른 실행에서 전송되어 상태가 바뀐 뉴스는 제외합니다.
+    UnprocessedKeys를 재시도한 뒤에도 남으면 예외를 발생시켜 다음 실행에서 다시 확인하도록 합니다.
+    """
+    pending_ids = set()
+    for start in range(0, len(news_ids), BATCH_GET_SIZE):
+        request_items = {
+            DYNAMODB_TABLE: {
+                'Keys': [{'id': news_id} for news_id in news_ids[start:start + BATCH_GET_SIZE]],
+                'ConsistentRead': True,
+                'ProjectionExpression': 'id, #status',
+                'ExpressionAttributeNames': {'#status': 'status'}
+            }
+        }
+        for attempt in range(max_retries + 1):
+            response = dynamodb.batch_get_item(RequestItems=request_items)
+            for item in response.get('Responses', {}).get(DYNAMODB_TABLE, []):
+                if item.get('status') == 'backfill':
+                    pending_ids.add(item['id'])
             
-            # ThrottlingException 방지를 위한 더 긴 딜레이
-            print(f"[INFO] 다음 뉴스 처리를 위해 {PROCESSING_DELAY}초 대기...")
-            time.sleep(PROCESSING_DELAY)
+            request_items = response.get('UnprocessedKeys') or {}
+            if not request_items:
+                break
+            if attempt < max_retries:
+                time.sleep(RETRY_DELAY_BASE ** attempt * 0.1)
+        else:
+            raise RuntimeError(f"UnprocessedKeys 재시도 초과: {len(request_items[DYNAMODB_TABLE]['Keys'])}개")
+    return pending_ids
+
+def consume_backfill_job(feed_state, writer):
+    """끝난 백필 작업의 요약을 Slack으로 전송하고 요약과 함께 기록 (처리했으면 Slack 전송 성공 수, 아니면 None)"""
+    job = feed_state.get('backfill_job')
+    if not job:
+        return None
+    
+    service = get_batch_job_service()
+    try:
+        status = service.get_status(job['job_id'])
+        if status in BATCH_JOB_RUNNING_STATUSES:
+            print(f"[INFO] 백필 작업 진행 중 ({status}): {job['job_id']}")
+            return None
+        summaries = {}
+        if status in ('Completed', 'PartiallyCompleted'):
+            summaries = parse_batch_inference_outputs(service.read_outputs(job['job_id']))
+    except Exception as e:
+        print(f"[ERROR] 백필 작업 조회 실패 - 다음 실행에서 다시 확인: {e}")
+        return None
+    
+    if not summaries:
+        print(f"[ERROR] 백필 작업 결과 없음 ({status}) - 모든 뉴스를 실시간 처리로 되돌림: {job['job_id']}")
+    
+    delivered = []
+    missing = []
+    for item in restore_pending_items({'pending_items': job['items']}):
+        summary = summaries.get(generate_news_id(item['link']))
+        if summary:
+            delivered.append((generate_news_id(item['link']), item, summary))
+        else:
+            missing.append(item)
+    
+    try:
+        pending_ids = get_backfill_pending_ids([news_id for news_id, _, _ in delivered])
+    except Exception as e:
+        print(f"[ERROR] 백필 처리 기록 조회 실패 - 다음 실행에서 다시 확인: {e}")
+        return None
+    if len(pending_ids) < len(delivered):
+        print(f"[INFO] 이미 처리된 백필 뉴스 {len(delivered) - len(pending_ids)}개는 전송 생략")
+        delivered = [entry for entry in delivered if entry[0] in pending_ids]
+    
+    if SLACK_DELIVERY_MODE == 'batch':
+        slack_success = send_batch_to_slack([summary for _, _, summary in delivered])
+    else:
+        slack_success = sum(1 for _, _, summary in delivered if send_to_slack(summary))
+    
+    for news_id, item, summary in delivered:
+        writer.add(news_id, item['title'], item['link'], summary)
+    writer.flush()
+    
+    # 요약을 받지 못한 뉴스(작업 실패/중단/만료, 누락 레코드)는 미처리 목록에 넣어 이번 실행부터 실시간으로 처리
+    if missing:
+        released = release_backfill_items(missing)
+        feed_state['pending_items'] = feed_state.get('pending_items', []) + serialize_pending_items(released)
+        print(f"[WARN] 백필 요약을 받지 못한 뉴스 {len(released)}/{len(missing)}개를 실시간 처리 대상으로 되돌림")
+    
+    # 결과를 가져간 작업은 상태에서 제거 (피드가 바뀌지 않아 이후 단계가 생략되어도 바로 저장)
+    del feed_state['backfill_job']
+    save_feed_state(feed_state)
+    print(f"[INFO] 백필 작업 처리 완료 - 요약: {len(delivered)}/{len(job['items'])}개, Slack 전송 성공: {slack_success}개")
+    return slack_success
+
+def collect_new_news(feed_state, writer):
+    """RSS 피드들을 조회해 처리할 새 뉴스 수집
+    
+    (응답, 피드별 뉴스 목록, 새 뉴스 목록)을 반환합니다. 피드 변경이 없거나 초기 실행처럼
+    더 처리할 필요가 없으면 응답(dict)이 채워지고, 그렇지 않으면 응답은 None입니다.
+    """
+    # 끝난 백필 작업이 있으면 결과부터 전송 (설정 오류는 작업 제출 전에 실행 실패로 드러나도록 먼저 확인)
+    if BACKFILL_MODE == 'batch':
+        get_batch_job_service()
+        consume_backfill_job(feed_state, writer)
+    
+    # 이전 실행에서 미룬 뉴스가 있으면 피드가 그대로여도 이어서 처리
+    pending_items = restore_pending_items(feed_state)
+    feed_news = fetch_feeds(feed_state)
+    if all(items is None for items in feed_news.values()) and not pending_items:
+        return {'statusCode': 200, 'body': 'Feed not modified'}, {}, []
+    
+    feed_news = {feed_url: items for feed_url, items in feed_news.items() if items}
+    news_items = merge_feed_news(feed_news)
+    if not news_items and not pending_items:
+        return {'statusCode': 200, 'body': 'No news found'}, feed_news, []
+    
+    # 초기 실행 확인
+    if is_initial_run(feed_state):
+        print("[INFO] 초기 실행 감지 - 기록만 수행하고 알림은 전송하지 않음")
+        feed_state['initialized_at'] = datetime.utcnow().isoformat()
+        
+        # 모든 뉴스를 DynamoDB에 기록만 함
+        for item in news_items:
+            news_id = generate_news_id(item['link'])
+            writer.add(news_id, item['title'], item['link'])
+        
+        # 백필 모드면 최신 뉴스 요약을 Batch Inference 작업으로 맡기고 다음 실행에서 결과를 전송
+        # (작업에 포함하지 못한 뉴스는 초기 실행 규칙대로 기록만 남음)
+        if BACKFILL_MODE == 'batch' and BACKFILL_MAX_ITEMS > 0:
+            backfill_items = news_items[:BACKFILL_MAX_ITEMS]
+            not_submitted = start_backfill_job(backfill_items, feed_state, writer)
+            if not_submitted:
+                print(f"[INFO] 백필 작업에 포함하지 못한 뉴스 {len(not_submitted)}/{len(backfill_items)}개는 기록만 수행")
+        writer.flush()
         
-        result_message = f"처리 완료 - 새 뉴스: {new_news_count}개, 요약 성공: {summary_success_count}개, Slack 전송 성공: {slack_success_count}개"
+        update_feed_marks(feed_news, feed_state)
+        save_feed_state(feed_state)
+        return {
+            'statusCode': 200,
+            'body': f'Initial run completed - recorded {len(news_items)} news items'
+        }, feed_news, []
+    
+    # 피드별 high-water mark 이전 뉴스는 메모리에서 제외 (새로 추가된 피드는 첫 조회에서 기록만 수행)
+    candidate_items = []
+    for feed_url, items in feed_news.items():
+        state = get_feed_state(feed_state, feed_url)
+        if feed_url != RSS_FEED_URL and not state.get('high_water_mark'):
+            print(f"[INFO] 새 피드 감지 - 뉴스 {len(items)}개를 기록만 수행: {feed_url}")
+            for item in items:
+                writer.add(generate_news_id(item['link']), item['title'], item['link'])
+            continue
+        candidate_items.extend(apply_high_water_mark(items, state))
+    candidate_items.sort(key=lambda item: item['datetime'], reverse=True)
+    
+    # 미룬 뉴스를 앞에 붙이고 피드 간 중복을 제거한 뒤 일괄 조회로 처리 여부 확인
+    new_items = filter_new_news(dedup_news(pending_items + candidate_items))
+    
+    # 밀린 뉴스가 많으면 실시간 처리 대신 백필 작업으로 처리 (진행 중인 작업이 없을 때만)
+    if (BACKFILL_MODE == 'batch' and 0 < BACKFILL_CATCHUP_THRESHOLD <= len(new_items)
+            and not feed_state.get('backfill_job')):
+        print(f"[INFO] 새 뉴스 {len(new_items)}개 - 백필 작업으로 처리")
+        new_items = start_backfill_job(new_items, feed_state, writer)
+    return None, feed_news, new_items
+
+def lambda_handler(event, context):
+    """Lambda 핸들러 함수"""
+    print("[INFO] AWS News to Slack 처리 시작")
+    run_metrics.reset('lambda_handler')
+    
+    # 처리된 뉴스 기록은 모아서 일괄 저장 (Lambda 종료가 가까우면 즉시 저장)
+    writer = BufferedNewsWriter(context)
+    
+    try:
+        # AWS 클라이언트 초기화
+        initialize_aws_clients()
+        
+        # RSS 뉴스 가져오기 (저장된 검증값으로 조건부 요청) 및 새 뉴스 선별
+        feed_state = load_feed_state()
+        response, feed_news, new_items = collect_new_news(feed_state, writer)
+        if response:
+            return response
+        
+        # 새로운 뉴스 파이프라인 처리 (남은 실행 시간 안에 끝낼 수 있는 만큼만)
+        stats = process_news_items(new_items, writer, TimeBudget(context))
+        writer.flush()
+        
+        # 처리가 끝난 뒤에만 검증값, high-water mark, 미처리 목록을 저장하여 실패 시 다음 실행에서 다시 처리하도록 함
+        feed_state['pending_items'] = serialize_pending_items(stats['deferred'])
+        feed_state['last_run'] = {
+            'finished_at': datetime.utcnow().isoformat(),
+            'new': stats['new'],
+            'summary_success': stats['summary_success'],
+            'slack_success': stats['slack_success'],
+            'deferred': len(stats['deferred']),
+        }
+        update_feed_marks(feed_news, feed_state)
+        save_feed_state(feed_state)
+        
+        result_message = (
+            f"처리 완료 - 새 뉴스: {stats['new']}개, "
+            f"요약 성공: {stats['summary_success']}개, Slack 전송 성공: {stats['slack_success']}개, "
+            f"다음 실행으로 미룸: {len(stats['deferred'])}개"
+        )
         print(f"[INFO] {result_message}")
         
+        if stats['deferred'] and SELF_REINVOKE and context is not None:
+            # 처리한 뉴스가 없거나 연속 재호출 한도에 닿으면 다음 정기 실행에 맡겨 무한 재호출을 막음
+            depth = event.get('reinvoke_depth', 0) if isinstance(event, dict) else 0
+            if stats['new'] == len(stats['deferred']):
+                print("[WARN] 이번 실행에서 처리한 뉴스가 없어 재호출하지 않음 - 다음 정기 실행에서 이어서 처리")
+            elif depth >= SELF_REINVOKE_MAX_DEPTH:
+                print(f"[WARN] 연속 재호출 한도({SELF_REINVOKE_MAX_DEPTH}) 도달 - 다음 정기 실행에서 이어서 처리")
+            else:
+                reinvoke_self(context, depth + 1)
+        
         return {
             'statusCode': 200,
             'body': result_message
@@ -358,9 +2359,106 @@ def lambda_handler(event, context):
     except Exception as e:
         error_message = f"Lambda 실행 중 오류 발생: {e}"
         print(f"[ERROR] {error_message}")
+        # 이미 Slack으로 전송한 뉴스가 다시 전송되지 않도록 버퍼에 남은 기록 저장
+        writer.flush()
         return {
             'statusCode': 500,
             'body': error_message
         }
+    finally:
+        # 단계별 소요 시간, 처리 건수, 토큰 사용량을 EMF 지표와 실행 요약으로 출력
+        run_metrics.emit(context)
 
+def poller_handler(event, context):
+    """fan-out 모드 poller 핸들러 - 새 뉴스를 선별해 SQS 큐에 넣음"""
+    print("[INFO] AWS News to Slack poller 시작")
+    run_metrics.reset('poller_handler')
+    
+    writer = BufferedNewsWriter(context)
+    
+    try:
+        initialize_aws_clients()
+        
+        feed_state = load_feed_state()
+        response, feed_news, new_items = collect_new_news(feed_state, writer)
+        if response:
+            return response
+        
+        # 큐에 넣은 뉴스는 'queued' 상태로 기록하여 다음 poll에서 다시 넣지 않음
+        failed_items = enqueue_news_items(new_items)
+        failed_ids = {generate_news_id(item['link']) for item in failed_items}
+        for item in new_items:
+            news_id = generate_news_id(item['link'])
+            if news_id not in failed_ids:
+                writer.add(news_id, item['title'], item['link'], status='queued')
+        writer.flush()
+        
+        # 큐에 넣지 못한 뉴스는 다음 poll에서 다시 시도
+        feed_state['pending_items'] = serialize_pending_items(failed_items)
+        feed_state['last_run'] = {
+            'finished_at': datetime.utcnow().isoformat(),
+            'new': len(new_items),
+            'queued': len(new_items) - len(failed_items),
+            'deferred': len(failed_items),
+        }
+        update_feed_marks(feed_news, feed_state)
+        save_feed_state(feed_state)
+        
+        result_message = f"큐 전송 완료 - 새 뉴스: {len(new_items)}개, 다음 실행으로 미룸: {len(failed_items)}개"
+        print(f"[INFO] {result_message}")
+        return {'statusCode': 200, 'body': result_message}
+        
+    except Exception as e:
+        error_message = f"Lambda 실행 중 오류 발생: {e}"
+        print(f"[ERROR] {error_message}")
+        writer.flush()
+        return {'statusCode': 500, 'body': error_message}
+    finally:
+        run_metrics.emit(context)
 
+def worker_handler(event, context):
+    """fan-out 모드 worker 핸들러 - SQS로 받은 뉴스를 처리 (본문 추출 → 요약 → Slack 전송 → 저장)
+    
+    시간 부족 등으로 처리하지 못한 메시지는 batchItemFailures로 반환하여 SQS가 다시 전달하도록 합니다.
+    """
+    records = event.get('Records', [])
+    print(f"[INFO] AWS News to Slack worker 시작 - 메시지 {len(records)}개")
+    run_metrics.reset('worker_handler')
+    
+    writer = BufferedNewsWriter(context)
+    message_ids = {}
+    news_items = []
+    
+    try:
+        initialize_aws_clients()
+        
+        for record in records:
+            item = restore_pending_items({'pending_items': [json.loads(record['body'])]})[0]
+            news_id = generate_news_id(item['link'])
+            # SQS 중복 전달로 이미 처리된 뉴스는 건너뜀
+            if news_id in message_ids or not is_news_queued(news_id):
+                print(f"[INFO] 이미 처리된 뉴스 건너뜀: {item['title'][:50]}...")
+                continue
+            message_ids[news_id] = record['messageId']
+            news_items.append(item)
+        
+        stats = process_news_items(news_items, writer, TimeBudget(context))
+        writer.flush()
+        
+        failures = [
+            {'itemIdentifier': message_ids[generate_news_id(item['link'])]}
+            for item in stats['deferred']
+        ]
+        print(
+            f"[INFO] worker 처리 완료 - 뉴스: {stats['new']}개, 요약 성공: {stats['summary_success']}개, "
+            f"Slack 전송 성공: {stats['slack_success']}개, 재시도: {len(failures)}개"
+        )
+        return {'batchItemFailures': failures}
+        
+    except Exception as e:
+        print(f"[ERROR] Lambda 실행 중 오류 발생: {e}")
+        writer.flush()
+        # 모든 메시지를 다시 전달받되, 이미 저장까지 끝난 뉴스는 'queued' 상태가 아니므로 건너뜀
+        return {'batchItemFailures': [{'itemIdentifier': record['messageId']} for record in records]}
+    finally:
+        run_metrics.emit(context)
@@ -1,6 +1,9 @@
 import unittest
-from unittest.mock import patch, MagicMock, Mock
+from unittest.mock import patch, AsyncMock, MagicMock, Mock
 import os
+import json
+import subprocess
+import sys
 import lambda_function
 import hashlib
 
@@ -13,6 +16,8 @@ class TestLambdaFunction(unittest.TestCase):
         os.environ['AWS_REGION'] = 'ap-northeast-2'
         os.environ['DYNAMODB_TABLE'] = 'ProcessedNews'
         os.environ['BEDROCK_MODEL_ID'] = 'anthropic.claude-3-haiku-20240307-v1:0'
+        # 웜 Lambda 최근 처리 ID 집합은 테스트 간에 공유되지 않도록 비움
+        lambda_function.recent_news_ids.clear()
     
     def test_environment_variables_default_values(self):
         """환경 변수 기본값 테스트"""
@@ -27,8 +32,13 @@ class TestLambdaFunction(unittest.TestCase):
         self.assertEqual(lambda_function.RETRY_DELAY_BASE, 2)
         self.assertEqual(lambda_function.MAX_SLACK_LENGTH, 3900)
         self.assertEqual(lambda_function.CONTENT_MAX_LENGTH, 3000)
+        self.assertEqual(lambda_function.CONTENT_MAX_TOKENS, 750)
         self.assertEqual(lambda_function.REQUEST_TIMEOUT, 10)
         self.assertEqual(lambda_function.PROCESSING_DELAY, 12)
+        self.assertEqual(lambda_function.FETCH_CONCURRENCY, 5)
+        self.assertEqual(lambda_function.BEDROCK_CONCURRENCY, 2)
+        self.assertEqual(lambda_function.BEDROCK_MAX_RPM, 5)
+        self.assertEqual(lambda_function.BEDROCK_MAX_TPM, 100000)
     
     @patch.dict(os.environ, {
         'AWS_REGION': 'us-east-1',
@@ -51,27 +61,71 @@ class TestLambdaFunction(unittest.TestCase):
     @patch('boto3.resource')
     @patch('boto3.client')
     def test_initialize_aws_clients(self, mock_client, mock_resource):
-        """AWS 클라이언트 초기화 테스트"""
+        """AWS 클라이언트 초기화 테스트 - Bedrock 클라이언트는 만들지 않음"""
         mock_dynamodb = MagicMock()
-        mock_bedrock = MagicMock()
         mock_table = MagicMock()
         
         mock_resource.return_value = mock_dynamodb
-        mock_client.return_value = mock_bedrock
         mock_dynamodb.Table.return_value = mock_table
         
         # 초기화 함수 호출
-        lambda_function.initialize_aws_clients()
+        with patch.object(lambda_function, 'dynamodb', None), patch.object(lambda_function, 'bedrock_runtime', None):
+            lambda_function.initialize_aws_clients()
+            
+            # 클라이언트들이 올바르게 초기화되었는지 확인
+            mock_resource.assert_called_once_with('dynamodb', region_name=lambda_function.AWS_REGION)
+            mock_client.assert_not_called()
+            mock_dynamodb.Table.assert_called_once_with(lambda_function.DYNAMODB_TABLE)
+            
+            # 전역 변수들이 설정되었는지 확인
+            self.assertIs(lambda_function.dynamodb, mock_dynamodb)
+            self.assertIs(lambda_function.table, mock_table)
+            self.assertIsNone(lambda_function.bedrock_runtime)
+    
+    @patch('boto3.client')
+    def test_get_bedrock_runtime_lazy(self, mock_client):
+        """Bedrock 클라이언트 지연 생성 테스트 - 처음 사용할 때 한 번만 생성"""
+        with patch.object(lambda_function, 'bedrock_runtime', None):
+            client = lambda_function.get_bedrock_runtime()
+            self.assertIs(lambda_function.get_bedrock_runtime(), client)
         
-        # 클라이언트들이 올바르게 초기화되었는지 확인
-        mock_resource.assert_called_once_with('dynamodb', region_name=lambda_function.AWS_REGION)
         mock_client.assert_called_once_with('bedrock-runtime', region_name=lambda_function.AWS_REGION)
-        mock_dynamodb.Table.assert_called_once_with(lambda_function.DYNAMODB_TABLE)
+    
+    def test_import_defers_heavy_dependencies(self):
+        """콜드 스타트 테스트 - 모듈 import 시 feedparser/bs4/lxml을 로드하지 않음"""
+        code = (
+            "import sys, lambda_function; "
+            "print(','.join(m for m in ('feedparser', 'bs4', 'lxml.etree') if m in sys.modules))"
+        )
+        result = subprocess.run(
+            [sys.executable, '-c', code],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            env=dict(os.environ),
+            capture_output=True,
+            text=True,
+            check=True
+        )
+        self.assertEqual(result.stdout.strip(), '')
+    
+    def run_import(self, **env):
+        """새 인터프리터에서 환경 변수를 바꿔 lambda_function import (설정 검증 확인용)"""
+        return subprocess.run(
+            [sys.executable, '-c', 'import lambda_function; print(lambda_function.RSS_FEED_URLS)'],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            env=dict(os.environ, **env),
+            capture_output=True,
+            text=True
+        )
+    
+    def test_feed_and_concurrency_config_validated(self):
+        """설정 테스트 - 피드 URL이 없는 RSS_FEED_URLS는 기본 피드로, 0 이하 동시성은 import 시 설정 오류"""
+        result = self.run_import(RSS_FEED_URLS=',')
+        self.assertEqual(result.returncode, 0)
+        self.assertEqual(result.stdout.strip().splitlines()[-1], repr([lambda_function.RSS_FEED_URL]))
         
-        # 전역 변수들이 설정되었는지 확인
-        self.assertIsNotNone(lambda_function.dynamodb)
-        self.assertIsNotNone(lambda_function.bedrock_runtime)
-        self.assertIsNotNone(lambda_function.table)
+        result = self.run_import(FETCH_CONCURRENCY='0')
+        self.assertNotEqual(result.returncode, 0)
+        self.assertIn('FETCH_CONCURRENCY', result.stderr)
     
     def test_generate_news_id(self):
         """뉴스 ID 생성 테스트"""
@@ -80,6 +134,14 @@ class TestLambdaFunction(unittest.TestCase):
         actual_id = lambda_function.generate_news_id(link)
         self.assertEqual(actual_id, expected_id)
     
+    def test_generate_news_id_normalizes_link(self):
+        """뉴스 ID 생성 테스트 - 쿼리 문자열과 끝 '/' 차이는 같은 뉴스로 취급"""
+        link = "https://aws.amazon.com/blogs/aws/new-feature/"
+        self.assertEqual(lambda_function.generate_news_id(link + "?sc_channel=sm#top"),
+                         lambda_function.generate_news_id(link))
+        self.assertEqual(lambda_function.generate_news_id(link.rstrip('/')),
+                         lambda_function.generate_news_id(link))
+    
     @patch('lambda_function.table')
     def test_is_news_processed_exists(self, mock_table):
         """이미 처리된 뉴스 확인 테스트 - 존재하는 경우"""
@@ -94,19 +156,108 @@ class TestLambdaFunction(unittest.TestCase):
         result = lambda_function.is_news_processed('test-id')
         self.assertFalse(result)
     
+    @patch('lambda_function.dynamodb')
+    def test_filter_new_news(self, mock_dynamodb):
+        """새 뉴스 일괄 필터링 테스트 - 처리된 뉴스 제외"""
+        items = [{'link': 'https://example.com/a'}, {'link': 'https://example.com/b'}]
+        processed_id = lambda_function.generate_news_id('https://example.com/a')
+        mock_dynamodb.batch_get_item.return_value = {
+            'Responses': {lambda_function.DYNAMODB_TABLE: [{'id': processed_id}]},
+            'UnprocessedKeys': {}
+        }
+        
+        result = lambda_function.filter_new_news(items)
+        self.assertEqual(result, [{'link': 'https://example.com/b'}])
+        mock_dynamodb.batch_get_item.assert_called_once()
+    
+    @patch('time.sleep')
+    @patch('lambda_function.dynamodb')
+    def test_get_processed_ids_retries_unprocessed_keys(self, mock_dynamodb, mock_sleep):
+        """일괄 조회 테스트 - UnprocessedKeys 재시도"""
+        table_name = lambda_function.DYNAMODB_TABLE
+        mock_dynamodb.batch_get_item.side_effect = [
+            {
+                'Responses': {table_name: [{'id': 'a'}]},
+                'UnprocessedKeys': {table_name: {'Keys': [{'id': 'b'}], 'ProjectionExpression': 'id'}}
+            },
+            {'Responses': {table_name: [{'id': 'b'}]}, 'UnprocessedKeys': {}}
+        ]
+        
+        result = lambda_function.get_processed_ids(['a', 'b', 'c'])
+        self.assertEqual(result, {'a', 'b'})
+        self.assertEqual(mock_dynamodb.batch_get_item.call_count, 2)
+    
+    def test_apply_high_water_mark(self):
+        """High-water mark 테스트 - 이전 뉴스와 처리된 경계 뉴스 제외"""
+        from datetime import datetime
+        mark = datetime(2024, 1, 2, 12, 0, 0)
+        items = [
+            {'link': 'https://example.com/old', 'datetime': datetime(2024, 1, 1)},
+            {'link': 'https://example.com/seen', 'datetime': mark},
+            {'link': 'https://example.com/boundary', 'datetime': mark},
+            {'link': 'https://example.com/new', 'datetime': datetime(2024, 1, 3)}
+        ]
+        feed_state = {
+            'high_water_mark': mark.isoformat(),
+            'boundary_ids': [lambda_function.generate_news_id('https://example.com/seen')]
+        }
+        
+        result = lambda_function.apply_high_water_mark(items, feed_state)
+        self.assertEqual([item['link'] for item in result],
+                         ['https://example.com/boundary', 'https://example.com/new'])
+    
+    def test_update_high_water_mark(self):
+        """High-water mark 테스트 - 최신 시각과 경계 ID 갱신"""
+        from datetime import datetime
+        latest = datetime(2024, 1, 3)
+        items = [
+            {'link': 'https://example.com/a', 'datetime': latest},
+            {'link': 'https://example.com/b', 'datetime': datetime(2024, 1, 1)}
+        ]
+        feed_state = {'high_water_mark': datetime(2024, 1, 2).isoformat(), 'boundary_ids': ['old']}
+        
+        lambda_function.update_high_water_mark(items, feed_state)
+        self.assertEqual(feed_state['high_water_mark'], latest.isoformat())
+        self.assertEqual(feed_state['boundary_ids'], [lambda_function.generate_news_id('https://example.com/a')])
+    
     @patch('lambda_function.table')
     def test_is_initial_run_empty(self, mock_table):
-        """초기 실행 확인 테스트 - 빈 테이블"""
+        """초기 실행 확인 테스트 - 상태 항목 없는 빈 테이블"""
         mock_table.scan.return_value = {'Count': 0}
-        result = lambda_function.is_initial_run()
+        result = lambda_function.is_initial_run({})
         self.assertTrue(result)
     
     @patch('lambda_function.table')
     def test_is_initial_run_not_empty(self, mock_table):
-        """초기 실행 확인 테스트 - 데이터가 있는 테이블"""
+        """초기 실행 확인 테스트 - 상태 항목 없이 데이터가 있는 테이블은 초기화 기록을 남김"""
         mock_table.scan.return_value = {'Count': 5}
-        result = lambda_function.is_initial_run()
+        feed_state = {}
+        result = lambda_function.is_initial_run(feed_state)
         self.assertFalse(result)
+        self.assertIn('initialized_at', feed_state)
+    
+    @patch('lambda_function.table')
+    def test_is_initial_run_uses_state_marker(self, mock_table):
+        """초기 실행 확인 테스트 - 초기화 기록이 있으면 스캔하지 않음"""
+        result = lambda_function.is_initial_run({'initialized_at': '2024-01-01T00:00:00'})
+        self.assertFalse(result)
+        mock_table.scan.assert_not_called()
+    
+    @patch('lambda_function.send_to_slack')
+    @patch('lambda_function.get_rss_news')
+    @patch('lambda_function.initialize_aws_clients')
+    @patch('lambda_function.table')
+    def test_lambda_handler_state_read_failure(self, mock_table, mock_init, mock_get_rss, mock_slack):
+        """Lambda 핸들러 테스트 - 상태 항목 조회 실패 시 초기 실행으로 오인하지 않고 오류 반환"""
+        from botocore.exceptions import ClientError
+        mock_table.get_item.side_effect = ClientError({'Error': {'Code': 'ProvisionedThroughputExceededException'}}, 'GetItem')
+        
+        result = lambda_function.lambda_handler({}, None)
+        
+        self.assertEqual(result['statusCode'], 500)
+        mock_table.get_item.assert_called_once_with(Key={'id': lambda_function.FEED_STATE_ID}, ConsistentRead=True)
+        mock_get_rss.assert_not_called()
+        mock_slack.assert_not_called()
     
     @patch('lambda_function.table')
     def test_save_processed_news(self, mock_table):
@@ -119,9 +270,136 @@ class TestLambdaFunction(unittest.TestCase):
             'Test Summary'
         )
         self.assertTrue(result)
-        mock_table.put_item.assert_called_once()
+        # 중복 확인용 처리 기록과 요약 보관 항목을 따로 저장
+        record, archive = [c[1]['Item'] for c in mock_table.put_item.call_args_list]
+        self.assertEqual(set(record), {'id', 'processed_at', 'expires_at'})
+        self.assertEqual(archive['id'], lambda_function.NEWS_ARCHIVE_PREFIX + 'test-id')
+        self.assertEqual(archive['summary'], 'Test Summary')
+        self.assertIn('test-id', lambda_function.recent_news_ids)
+    
+    def test_build_news_record_compact(self):
+        """처리 기록 생성 테스트 - 제목/링크 없이 만료 시각만 기록, 요약 없으면 보관 항목 없음"""
+        with patch.object(lambda_function, 'PROCESSED_TTL_DAYS', 0):
+            record = lambda_function.build_news_record('id-1', status='queued')
+        self.assertEqual(set(record), {'id', 'processed_at', 'status'})
+        self.assertIsNone(lambda_function.build_archive_record('id-1', 'Title', 'https://example.com'))
+        with patch.object(lambda_function, 'NEWS_ARCHIVE_TTL_DAYS', 0):
+            self.assertIsNone(lambda_function.build_archive_record('id-1', 'Title', 'https://example.com', 'Summary'))
+    
+    @patch('lambda_function.dynamodb')
+    def test_filter_new_news_uses_recent_ids(self, mock_dynamodb):
+        """새 뉴스 필터 테스트 - 최근 처리 ID는 로컬에서 확인하고 나머지만 DynamoDB 조회"""
+        items = [{'title': f'News {name}', 'link': f'https://example.com/{name}/'} for name in ('a', 'b', 'c')]
+        ids = [lambda_function.generate_news_id(item['link']) for item in items]
+        lambda_function.remember_processed_ids([ids[0]])
+        mock_dynamodb.batch_get_item.return_value = {
+            'Responses': {lambda_function.DYNAMODB_TABLE: [{'id': ids[1]}]}, 'UnprocessedKeys': {}
+        }
+        
+        new_items = lambda_function.filter_new_news(items)
+        
+        self.assertEqual(new_items, [items[2]])
+        requested = mock_dynamodb.batch_get_item.call_args[1]['RequestItems'][lambda_function.DYNAMODB_TABLE]['Keys']
+        self.assertEqual(requested, [{'id': ids[1]}, {'id': ids[2]}])
+        # DynamoDB에서 확인한 처리 ID도 기억하여 다음 실행은 로컬에서 확인
+        self.assertEqual(list(lambda_function.recent_news_ids), [ids[0], ids[1]])
+    
+    def test_remember_processed_ids_capped(self):
+        """최근 처리 ID 테스트 - RECENT_IDS_MAX개를 넘으면 오래된 ID부터 제거"""
+        with patch.object(lambda_function, 'RECENT_IDS_MAX', 2):
+            lambda_function.remember_processed_ids(['a', 'b', 'c'])
+        self.assertEqual(list(lambda_function.recent_news_ids), ['b', 'c'])
     
-    @patch('requests.get')
+    @patch('lambda_function.table')
+    def test_feed_state_persists_recent_ids(self, mock_table):
+        """실행 상태 테스트 - 최근 처리 ID를 상태 항목에 저장하고 콜드 스타트 시 복원"""
+        lambda_function.remember_processed_ids(['a', 'b'])
+        lambda_function.save_feed_state({'initialized_at': '2024-01-01T00:00:00'})
+        saved = mock_table.put_item.call_args[1]['Item']
+        self.assertEqual(saved['recent_ids'], ['a', 'b'])
+        
+        lambda_function.recent_news_ids.clear()
+        mock_table.get_item.return_value = {'Item': saved}
+        lambda_function.load_feed_state()
+        self.assertEqual(list(lambda_function.recent_news_ids), ['a', 'b'])
+    
+    @patch('lambda_function.table')
+    def test_load_feed_state_reads_every_run(self, mock_table):
+        """실행 상태 테스트 - 웜 실행에서도 매번 강한 일관성 읽기로 조회하고, 실패한 실행의 변경이 남지 않음"""
+        stored = {'id': lambda_function.FEED_STATE_ID, 'feeds': {'https://example.com/feed': {'etag': '"old"'}}}
+        mock_table.get_item.side_effect = lambda **kwargs: {'Item': json.loads(json.dumps(stored))}
+        
+        feed_state = lambda_function.load_feed_state()
+        feed_state['feeds']['https://example.com/feed']['etag'] = '"new"'
+        
+        self.assertEqual(lambda_function.load_feed_state()['feeds']['https://example.com/feed']['etag'], '"old"')
+        self.assertEqual(mock_table.get_item.call_count, 2)
+        mock_table.get_item.assert_called_with(Key={'id': lambda_function.FEED_STATE_ID}, ConsistentRead=True)
+    
+    @patch('time.sleep')
+    @patch('lambda_function.dynamodb')
+    def test_buffered_news_writer_batches_and_retries(self, mock_dynamodb, mock_sleep):
+        """일괄 저장 버퍼 테스트 - 25개 단위 저장 및 UnprocessedItems 재시도"""
+        table_name = lambda_function.DYNAMODB_TABLE
+        unprocessed = {table_name: [{'PutRequest': {'Item': {'id': 'id-0'}}}]}
+        mock_dynamodb.batch_write_item.side_effect = [
+            {'UnprocessedItems': unprocessed},
+            {'UnprocessedItems': {}},
+            {'UnprocessedItems': {}}
+        ]
+        
+        writer = lambda_function.BufferedNewsWriter()
+        for i in range(30):
+            writer.add(f'id-{i}', f'Title {i}', f'https://example.com/{i}')
+        # 25개가 모이면 자동 저장, 나머지는 flush 시 저장
+        self.assertEqual(len(writer.pending), 5)
+        writer.flush()
+        
+        self.assertEqual(writer.written, 30)
+        self.assertEqual(mock_dynamodb.batch_write_item.call_count, 3)
+        first_request = mock_dynamodb.batch_write_item.call_args_list[0][1]['RequestItems'][table_name]
+        self.assertEqual(len(first_request), 25)
+    
+    @patch('lambda_function.dynamodb')
+    def test_buffered_news_writer_flushes_near_deadline(self, mock_dynamodb):
+        """일괄 저장 버퍼 테스트 - Lambda 종료가 가까우면 즉시 저장"""
+        mock_dynamodb.batch_write_item.return_value = {'UnprocessedItems': {}}
+        context = MagicMock()
+        context.get_remaining_time_in_millis.return_value = 5000
+        
+        writer = lambda_function.BufferedNewsWriter(context)
+        writer.add('id-0', 'Title', 'https://example.com')
+        
+        self.assertEqual(writer.pending, {})
+        mock_dynamodb.batch_write_item.assert_called_once()
+    
+    @patch('lambda_function.dynamodb')
+    def test_buffered_news_writer_archives_summaries(self, mock_dynamodb):
+        """일괄 저장 버퍼 테스트 - 요약은 보관 항목으로 함께 저장하고 처리 ID만 기억"""
+        mock_dynamodb.batch_write_item.return_value = {'UnprocessedItems': {}}
+        
+        writer = lambda_function.BufferedNewsWriter()
+        writer.add('id-0', 'Title', 'https://example.com', 'Summary')
+        writer.flush()
+        
+        written = mock_dynamodb.batch_write_item.call_args[1]['RequestItems'][lambda_function.DYNAMODB_TABLE]
+        ids = [request['PutRequest']['Item']['id'] for request in written]
+        self.assertEqual(ids, ['id-0', lambda_function.NEWS_ARCHIVE_PREFIX + 'id-0'])
+        self.assertEqual(list(lambda_function.recent_news_ids), ['id-0'])
+    
+    @patch('lambda_function.prepare_body', side_effect=lambda text, url: text)
+    def test_parse_main_text_caps_bs4_length(self, mock_prepare):
+        """본문 추출 테스트 - bs4 경로도 전처리 전에 CONTENT_MAX_LENGTH로 자름"""
+        content = ('<main>' + 'Amazon Example Service now supports feature. ' * 500 + '</main>').encode('utf-8')
+        
+        with patch.object(lambda_function, 'EXTRACTOR_BACKEND', 'bs4'), \
+                patch.object(lambda_function, 'CONTENT_MAX_LENGTH', 1000):
+            text = lambda_function.parse_main_text(content, 'https://example.com/news')
+        
+        self.assertEqual(len(mock_prepare.call_args[0][0]), 1000)
+        self.assertEqual(len(text), 1000)
+    
+    @patch('requests.Session.get')
     def test_extract_main_text_success(self, mock_get):
         """웹 페이지 본문 추출 테스트 - 성공"""
         mock_response = MagicMock()
@@ -132,7 +410,45 @@ class TestLambdaFunction(unittest.TestCase):
         result = lambda_function.extract_main_text('https://example.com')
         self.assertEqual(result, 'Test main content')
     
-    @patch('requests.get')
+    def test_clean_body_removes_boilerplate_and_duplicates(self):
+        """본문 전처리 테스트 - 상용구 줄과 중복 줄 제거"""
+        text = (
+            "Skip to main content\nPosted On: Jan 1, 2024\n"
+            "Amazon S3 now supports  feature X.\nShare\nAmazon S3 now supports feature X.\nDetails here."
+        )
+        self.assertEqual(lambda_function.clean_body(text), "Amazon S3 now supports feature X.\nDetails here.")
+    
+    def test_trim_to_token_budget_at_sentence_boundary(self):
+        """본문 전처리 테스트 - 토큰 예산 안에서 문장 경계로 자름"""
+        text = "First sentence is here. Second sentence is here. Third sentence is here."
+        
+        self.assertEqual(lambda_function.trim_to_token_budget(text, 100), text)
+        self.assertEqual(lambda_function.trim_to_token_budget(text, 12), "First sentence is here. Second sentence is here....")
+        self.assertTrue(lambda_function.trim_to_token_budget("x" * 400, 10).endswith("..."))
+    
+    def test_extract_text_with_lxml_matches_bs4(self):
+        """lxml 본문 추출 테스트 - BeautifulSoup 결과와 동일"""
+        html = (
+            '<html><body><nav>Menu</nav><article><h1>제목</h1>'
+            '<p>Hello <b>world</b> &amp; more</p><script>var x = 1;</script></article></body></html>'
+        ).encode('utf-8')
+        expected = lambda_function.extract_text_with_bs4(html)
+        self.assertEqual(expected, '제목\nHello\nworld\n& more')
+        self.assertEqual(lambda_function.extract_text_with_lxml(html), expected)
+    
+    def test_extract_text_with_lxml_stops_early(self):
+        """lxml 본문 추출 테스트 - 필요한 길이를 모으면 파싱 중단"""
+        paragraphs = ''.join(f'<p>paragraph {i}</p>' for i in range(1000))
+        html = f'<html><body><main>{paragraphs}</main></body></html>'.encode('utf-8')
+        
+        with patch.object(lambda_function, 'HTML_PARSE_CHUNK_SIZE', 256):
+            text = lambda_function.extract_text_with_lxml(html, limit=100)
+        
+        self.assertGreater(len(text), 100)
+        self.assertLess(len(text), 400)
+        self.assertTrue(text.startswith('paragraph 0\nparagraph 1'))
+    
+    @patch('requests.Session.get')
     def test_extract_main_text_failure(self, mock_get):
         """웹 페이지 본문 추출 테스트 - 실패"""
         mock_get.side_effect = Exception("Network error")
@@ -140,7 +456,16 @@ class TestLambdaFunction(unittest.TestCase):
         result = lambda_function.extract_main_text('https://example.com')
         self.assertEqual(result, "")
     
-    @patch('requests.post')
+    def test_get_http_session_reused(self):
+        """HTTP 세션 테스트 - 연결 풀 설정 및 재사용"""
+        with patch.object(lambda_function, 'http_session', None):
+            session = lambda_function.get_http_session()
+            self.assertIs(lambda_function.get_http_session(), session)
+            adapter = session.get_adapter('https://aws.amazon.com')
+            self.assertEqual(adapter._pool_maxsize, lambda_function.HTTP_POOL_MAXSIZE)
+            self.assertEqual(adapter.max_retries.total, lambda_function.HTTP_RETRIES)
+    
+    @patch('requests.Session.post')
     def test_send_to_slack_success(self, mock_post):
         """Slack 전송 테스트 - 성공"""
         mock_response = MagicMock()
@@ -150,7 +475,7 @@ class TestLambdaFunction(unittest.TestCase):
         result = lambda_function.send_to_slack('Test message')
         self.assertTrue(result)
     
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_send_to_slack_failure(self, mock_post):
         """Slack 전송 테스트 - 실패"""
         mock_post.side_effect = Exception("Network error")
@@ -158,8 +483,422 @@ class TestLambdaFunction(unittest.TestCase):
         result = lambda_function.send_to_slack('Test message')
         self.assertFalse(result)
     
+    @patch('lambda_function.save_cached_summary')
+    @patch('lambda_function.get_cached_summary', return_value=None)
+    @patch('lambda_function.send_to_slack')
+    @patch('lambda_function.summarize_with_bedrock')
+    @patch('lambda_function.extract_main_text')
+    def test_process_news_items(self, mock_extract, mock_summarize, mock_slack, mock_get_cache, mock_save_cache):
+        """뉴스 파이프라인 처리 테스트 - 본문 없는 뉴스는 기록만 수행"""
+        items = [
+            {'title': 'News A', 'link': 'https://example.com/a', 'date': '2024-01-01'},
+            {'title': 'News B', 'link': 'https://example.com/b', 'date': '2024-01-01'}
+        ]
+        mock_extract.side_effect = lambda url: 'Body' if url.endswith('/a') else ''
+        mock_summarize.return_value = {'success': True, 'summary': 'Summary A'}
+        mock_slack.return_value = True
+        
+        writer = MagicMock()
+        stats = lambda_function.process_news_items(items, writer)
+        
+        self.assertEqual(stats, {'new': 2, 'summary_success': 1, 'slack_success': 1, 'deferred': []})
+        mock_summarize.assert_called_once_with('News A', 'Body', '2024-01-01', 'https://example.com/a')
+        mock_slack.assert_called_once_with('Summary A')
+        self.assertEqual(writer.add.call_count, 2)
+        mock_save_cache.assert_called_once()
+    
+    @patch('lambda_function.send_to_slack')
+    @patch('lambda_function.summarize_with_bedrock')
+    @patch('lambda_function.extract_main_text')
+    def test_process_news_items_uses_cached_summary(self, mock_extract, mock_summarize, mock_slack):
+        """뉴스 파이프라인 처리 테스트 - 캐시된 요약은 Bedrock 호출 생략"""
+        item = {'title': 'News A', 'link': 'https://example.com/a', 'date': '2024-01-01'}
+        mock_extract.return_value = 'Body'
+        cache_key = lambda_function.summary_cache_key('News A', 'Body', '2024-01-01', 'https://example.com/a')
+        
+        from collections import OrderedDict
+        with patch.object(lambda_function, 'summary_cache', OrderedDict({cache_key: 'Cached'})):
+            stats = lambda_function.process_news_items([item], MagicMock())
+        
+        self.assertEqual(stats['summary_success'], 1)
+        mock_summarize.assert_not_called()
+        mock_slack.assert_called_once_with('Cached')
+    
+    @patch('lambda_function.table')
+    def test_get_cached_summary_from_dynamodb(self, mock_table):
+        """요약 캐시 테스트 - DynamoDB 계층 조회 후 메모리에 보관"""
+        import time
+        from collections import OrderedDict
+        mock_table.get_item.return_value = {
+            'Item': {'id': 'summary#key', 'summary': 'Cached', 'expires_at': int(time.time()) + 60}
+        }
+        
+        with patch.object(lambda_function, 'summary_cache', OrderedDict()):
+            self.assertEqual(lambda_function.get_cached_summary('key'), 'Cached')
+            self.assertEqual(lambda_function.get_cached_summary('key'), 'Cached')
+        
+        mock_table.get_item.assert_called_once_with(Key={'id': 'summary#key'})
+    
+    def test_summary_cache_key_changes_with_prompt_version(self):
+        """요약 캐시 키 테스트 - 프롬프트 버전이 바뀌면 다른 키"""
+        key = lambda_function.summary_cache_key('Title', 'Body', '2024-01-01', 'https://example.com')
+        with patch.object(lambda_function, 'PROMPT_VERSION', 'next'):
+            self.assertNotEqual(
+                lambda_function.summary_cache_key('Title', 'Body', '2024-01-01', 'https://example.com'), key
+            )
+    
+    def _fake_clock(self):
+        """time.monotonic/time.sleep 대체용 가상 시계"""
+        clock = {'now': 1000.0}
+        def sleep(seconds):
+            clock['now'] += seconds
+        return clock, (lambda: clock['now']), sleep
+    
+    def test_bedrock_rate_limiter_spaces_requests(self):
+        """Bedrock 속도 제한기 테스트 - 분당 요청 수에 맞춰 대기"""
+        clock, monotonic, sleep = self._fake_clock()
+        with patch('time.monotonic', monotonic), patch('time.sleep', sleep):
+            limiter = lambda_function.BedrockRateLimiter(max_rpm=60, max_tpm=0)
+            self.assertEqual(limiter.acquire(100), 0.0)
+            self.assertAlmostEqual(limiter.acquire(100), 1.0)
+    
+    def test_bedrock_rate_limiter_aimd(self):
+        """Bedrock 속도 제한기 테스트 - 스로틀링 시 감소, 성공 시 회복"""
+        clock, monotonic, sleep = self._fake_clock()
+        with patch('time.monotonic', monotonic), patch('time.sleep', sleep):
+            limiter = lambda_function.BedrockRateLimiter(max_rpm=60, max_tpm=60000)
+            limiter.acquire(100)
+            limiter.on_throttle(cooldown=5)
+            self.assertEqual(limiter.rate_ratio, 0.5)
+            # 쿨다운(5초)과 절반 속도(2초/요청) 중 긴 쪽만큼 대기
+            self.assertAlmostEqual(limiter.acquire(100), 5.0)
+            limiter.on_success()
+            self.assertAlmostEqual(limiter.rate_ratio, 0.6)
+    
+    @patch('lambda_function.bedrock_rate_limiter')
+    @patch('lambda_function.bedrock_runtime')
+    def test_summarize_with_bedrock_throttled_then_success(self, mock_bedrock, mock_limiter):
+        """Bedrock 요약 테스트 - 스로틀링을 속도 제한기에 전달 후 재시도"""
+        from botocore.exceptions import ClientError
+        mock_body = MagicMock()
+        mock_body.read.return_value = b'{"content": [{"text": "Summary"}]}'
+        mock_bedrock.invoke_model.side_effect = [
+            ClientError({'Error': {'Code': 'ThrottlingException'}}, 'InvokeModel'),
+            {'body': mock_body}
+        ]
+        
+        result = lambda_function.summarize_with_bedrock('Title', 'Body', '2024-01-01', 'https://example.com')
+        
+        self.assertEqual(result, {'success': True, 'summary': 'Summary'})
+        mock_limiter.on_throttle.assert_called_once()
+        mock_limiter.on_success.assert_called_once()
+        self.assertEqual(mock_limiter.acquire.call_count, 2)
+    
+    def mock_bedrock_stream(self, mock_bedrock, texts):
+        """Bedrock 스트리밍 응답 가짜 구현 (texts: content_block_delta 텍스트 목록)"""
+        def event(payload):
+            return {'chunk': {'bytes': json.dumps(payload).encode('utf-8')}}
+        
+        events = [event({'type': 'message_start'})] + [
+            event({'type': 'content_block_delta', 'delta': {'type': 'text_delta', 'text': text}}) for text in texts
+        ]
+        stream = MagicMock()
+        stream.__iter__.return_value = iter(events)
+        mock_bedrock.invoke_model_with_response_stream.return_value = {'body': stream}
+        return stream
+    
+    @patch('lambda_function.bedrock_rate_limiter')
+    @patch('lambda_function.bedrock_runtime')
+    def test_summarize_with_bedrock_streaming_stops_early(self, mock_bedrock, mock_limiter):
+        """Bedrock 스트리밍 테스트 - Slack 길이에 도달하면 스트림을 닫고 마지막 줄까지만 남긴 뒤 링크 줄을 붙임"""
+        stream = self.mock_bedrock_stream(mock_bedrock, ['line one\nline', ' two\nline three\n'] * 5)
+        link_line = '\n\n🔗 자세히 보기: https://example.com'
+        
+        with patch.object(lambda_function, 'BEDROCK_STREAMING', True), \
+                patch.object(lambda_function, 'MAX_SLACK_LENGTH', len(link_line) + 25):
+            result = lambda_function.summarize_with_bedrock('Title', 'Body', '2024-01-01', 'https://example.com')
+        
+        self.assertEqual(result, {'success': True, 'summary': 'line one\nline two' + link_line, 'truncated': True})
+        stream.close.assert_called_once()
+        mock_bedrock.invoke_model.assert_not_called()
+        # 잘린 요약은 캐시에 저장하지 않음
+        self.assertFalse(lambda_function.record_summary_result({'title': 'Title'}, result, {'summary_success': 0}))
+    
+    @patch('lambda_function.bedrock_rate_limiter')
+    @patch('lambda_function.bedrock_runtime')
+    def test_summarize_with_bedrock_streaming_batch_delivery_not_truncated(self, mock_bedrock, mock_limiter):
+        """Bedrock 스트리밍 테스트 - 배치 전송 모드는 메시지를 나누어 보내므로 끝까지 받음"""
+        stream = self.mock_bedrock_stream(mock_bedrock, ['abcde'] * 10)
+        
+        with patch.object(lambda_function, 'BEDROCK_STREAMING', True), \
+                patch.object(lambda_function, 'SLACK_DELIVERY_MODE', 'batch'), \
+                patch.object(lambda_function, 'MAX_SLACK_LENGTH', 12):
+            result = lambda_function.summarize_with_bedrock('Title', 'Body', '2024-01-01', 'https://example.com')
+        
+        self.assertEqual(result, {'success': True, 'summary': 'abcde' * 10})
+        stream.close.assert_not_called()
+    
+    @patch('lambda_function.bedrock_rate_limiter')
+    @patch('lambda_function.bedrock_runtime')
+    def test_invoke_bedrock_records_token_usage(self, mock_bedrock, mock_limiter):
+        """성능 지표 테스트 - Bedrock 응답의 usage 토큰 수와 호출 횟수 기록"""
+        mock_body = MagicMock()
+        mock_body.read.return_value = b'{"content": [{"text": "Summary"}], "usage": {"input_tokens": 120, "output_tokens": 80}}'
+        mock_bedrock.invoke_model.return_value = {'body': mock_body}
+        mock_limiter.acquire.return_value = 0.5
+        metrics = lambda_function.RunMetrics()
+        
+        with patch.object(lambda_function, 'run_metrics', metrics):
+            lambda_function.invoke_bedrock('prompt', 100, 'Title')
+        
+        self.assertEqual(metrics.counters, {'bedrock_calls': 1, 'bedrock_input_tokens': 120, 'bedrock_output_tokens': 80})
+        self.assertEqual(metrics.timings['bedrock_wait'], [500.0])
+        self.assertEqual(len(metrics.timings['bedrock']), 1)
+    
+    def test_run_metrics_emf_documents(self):
+        """성능 지표 테스트 - EMF 문서 형식, 값 100개 단위 분할, 실행 요약 백분위수"""
+        metrics = lambda_function.RunMetrics()
+        metrics.reset('lambda_handler')
+        for value in range(1, 151):
+            metrics.record('fetch', value / 1000)
+        metrics.increment('slack_success', 3)
+        
+        documents = metrics.emf_documents('aws-news-to-slack')
+        
+        self.assertEqual(len(documents), 2)
+        self.assertEqual(len(documents[0]['FetchLatency']), 100)
+        self.assertEqual(len(documents[1]['FetchLatency']), 50)
+        self.assertEqual(documents[0]['SlackSuccess'], 3)
+        self.assertNotIn('SlackSuccess', documents[1])
+        directive = documents[0]['_aws']['CloudWatchMetrics'][0]
+        self.assertEqual(directive['Dimensions'], [['FunctionName']])
+        self.assertIn({'Name': 'FetchLatency', 'Unit': 'Milliseconds'}, directive['Metrics'])
+        self.assertEqual(documents[0]['FunctionName'], 'aws-news-to-slack')
+        
+        summary = metrics.summary()
+        self.assertEqual(summary['stages']['fetch']['count'], 150)
+        self.assertEqual(summary['stages']['fetch']['p50_ms'], 75)
+        self.assertEqual(summary['stages']['fetch']['p99_ms'], 149)
+    
+    def test_parse_batch_summaries(self):
+        """배치 요약 파싱 테스트 - 코드 블록 허용, 번호가 빠지면 None"""
+        text = '```json\n[{"id": 2, "summary": "B"}, {"id": 1, "summary": "A"}]\n```'
+        self.assertEqual(lambda_function.parse_batch_summaries(text, 2), ['A', 'B'])
+        self.assertIsNone(lambda_function.parse_batch_summaries('[{"id": 1, "summary": "A"}]', 2))
+        self.assertIsNone(lambda_function.parse_batch_summaries('요약할 수 없습니다', 1))
+    
+    @patch('lambda_function.summarize_with_bedrock')
+    @patch('lambda_function.invoke_bedrock', return_value=('not json', False))
+    def test_summarize_news_batch_falls_back(self, mock_invoke, mock_summarize):
+        """배치 요약 테스트 - 응답 형식이 맞지 않으면 뉴스별 요약으로 대체"""
+        articles = [('A', 'Body A', '2024-01-01', 'https://example.com/a'),
+                    ('B', 'Body B', '2024-01-01', 'https://example.com/b')]
+        mock_summarize.side_effect = lambda title, *args: {'success': True, 'summary': title}
+        
+        results = lambda_function.summarize_news_batch(articles)
+        
+        mock_invoke.assert_called_once()
+        self.assertEqual([result['summary'] for result in results], ['A', 'B'])
+    
+    def test_time_budget_capacity(self):
+        """시간 예산 테스트 - 남은 시간과 최근 소요 시간으로 처리 가능 개수 추정"""
+        context = MagicMock()
+        context.get_remaining_time_in_millis.return_value = 100000
+        budget = lambda_function.TimeBudget(context)
+        
+        with patch.object(lambda_function, 'stage_latency', {'fetch': 2.0, 'summarize': 10.0}), \
+                patch.object(lambda_function, 'DEADLINE_SAFETY_MARGIN_MS', 20000), \
+                patch.object(lambda_function, 'BEDROCK_CONCURRENCY', 2), \
+                patch.object(lambda_function, 'BEDROCK_MAX_RPM', 6):
+            # 남은 80초 - 첫 뉴스 12초 = 68초, 이후 뉴스당 max(10/2, 60/6) = 10초
+            self.assertEqual(budget.capacity(), 7)
+            self.assertTrue(budget.can_start_summary(queued=7))
+            self.assertFalse(budget.can_start_summary(queued=8))
+        
+        self.assertIsNone(lambda_function.TimeBudget().capacity())
+    
+    def test_time_budget_admits_one_item_when_average_exceeds_remaining(self):
+        """시간 예산 테스트 - 요약 이동 평균이 남은 시간보다 커도 실행마다 한 건은 처리"""
+        context = MagicMock()
+        context.get_remaining_time_in_millis.return_value = 60000
+        budget = lambda_function.TimeBudget(context)
+        
+        with patch.object(lambda_function, 'stage_latency', {'fetch': 2.0, 'summarize': 120.0}), \
+                patch.object(lambda_function, 'DEADLINE_SAFETY_MARGIN_MS', 20000):
+            self.assertEqual(budget.capacity(), 1)
+            self.assertTrue(budget.can_start_summary(queued=0))
+            self.assertFalse(budget.can_start_summary(queued=0))
+    
+    @patch('lambda_function.reinvoke_self')
+    @patch('lambda_function.process_news_items')
+    @patch('lambda_function.collect_new_news')
+    @patch('lambda_function.save_feed_state')
+    @patch('lambda_function.load_feed_state', return_value={})
+    @patch('lambda_function.initialize_aws_clients')
+    def test_lambda_handler_reinvoke_guard(self, mock_init, mock_load, mock_save_state, mock_collect,
+                                           mock_process, mock_reinvoke):
+        """Lambda 핸들러 테스트 - 진행이 없거나 연속 재호출 한도에 닿으면 재호출하지 않음"""
+        from datetime import datetime
+        items = [{'title': f'News {i}', 'link': f'https://example.com/{i}', 'date': '2024-01-01',
+                  'datetime': datetime(2024, 1, 1)} for i in range(2)]
+        mock_collect.return_value = (None, {}, items)
+        context = MagicMock(function_name='aws-news-to-slack')
+        context.get_remaining_time_in_millis.return_value = 300000
+        
+        with patch.object(lambda_function, 'SELF_REINVOKE', True), \
+                patch.object(lambda_function, 'SELF_REINVOKE_MAX_DEPTH', 3):
+            # 한 건 처리 후 나머지를 미룸 → 다음 깊이로 재호출
+            mock_process.return_value = {'new': 2, 'summary_success': 1, 'slack_success': 1, 'deferred': items[1:]}
+            lambda_function.lambda_handler({'resume': True, 'reinvoke_depth': 1}, context)
+            mock_reinvoke.assert_called_once_with(context, 2)
+            
+            # 연속 재호출 한도 도달
+            mock_reinvoke.reset_mock()
+            lambda_function.lambda_handler({'resume': True, 'reinvoke_depth': 3}, context)
+            mock_reinvoke.assert_not_called()
+            
+            # 처리한 뉴스가 없으면 재호출하지 않음
+            mock_process.return_value = {'new': 2, 'summary_success': 0, 'slack_success': 0, 'deferred': items}
+            lambda_function.lambda_handler({}, context)
+            mock_reinvoke.assert_not_called()
+    
+    @patch('lambda_function.send_to_slack', return_value=True)
+    @patch('lambda_function.summarize_with_bedrock', return_value={'success': True, 'summary': 'Summary'})
+    @patch('lambda_function.get_cached_summary', return_value=None)
+    @patch('lambda_function.save_cached_summary')
+    @patch('lambda_function.extract_main_text', return_value='Body')
+    def test_process_news_items_defers_over_budget(self, mock_extract, mock_save_cache, mock_get_cache,
+                                                   mock_summarize, mock_slack):
+        """뉴스 파이프라인 처리 테스트 - 시간 안에 끝낼 수 없는 뉴스는 미룸"""
+        items = [{'title': f'News {i}', 'link': f'https://example.com/{i}', 'date': '2024-01-01'} for i in range(3)]
+        budget = MagicMock()
+        budget.capacity.return_value = 2
+        budget.can_start_summary.return_value = True
+        writer = MagicMock()
+        
+        stats = lambda_function.process_news_items(items, writer, budget)
+        
+        self.assertEqual(stats['deferred'], [items[2]])
+        self.assertEqual(mock_summarize.call_count, 2)
+        self.assertEqual(writer.add.call_count, 2)
+    
+    @patch('lambda_function.process_news_items')
+    @patch('lambda_function.filter_new_news', side_effect=lambda items: items)
+    @patch('lambda_function.is_initial_run', return_value=False)
+    @patch('lambda_function.save_feed_state')
+    @patch('lambda_function.get_rss_news', return_value=None)
+    @patch('lambda_function.load_feed_state')
+    @patch('lambda_function.initialize_aws_clients')
+    def test_lambda_handler_resumes_pending_items(self, mock_init, mock_load, mock_get_rss, mock_save_state,
+                                                  mock_initial, mock_filter, mock_process):
+        """Lambda 핸들러 테스트 - 피드가 그대로여도 미룬 뉴스를 이어서 처리"""
+        pending = {'title': 'News', 'link': 'https://example.com/a', 'date': '2024-01-01',
+                   'datetime': '2024-01-01T00:00:00'}
+        mock_load.return_value = {'etag': '"abc"', 'pending_items': [pending]}
+        mock_process.return_value = {'new': 1, 'summary_success': 1, 'slack_success': 1, 'deferred': []}
+        
+        result = lambda_function.lambda_handler({}, None)
+        
+        self.assertEqual(result['statusCode'], 200)
+        processed_items = mock_process.call_args[0][0]
+        self.assertEqual([item['link'] for item in processed_items], ['https://example.com/a'])
+        saved_state = mock_save_state.call_args[0][0]
+        self.assertEqual(saved_state['pending_items'], [])
+    
+    @patch('time.sleep')
+    @patch('requests.Session.post')
+    def test_send_to_slack_retries_after_429(self, mock_post, mock_sleep):
+        """Slack 전송 테스트 - 429 응답 시 Retry-After만큼 대기 후 재시도"""
+        limited = MagicMock(status_code=429, headers={'Retry-After': '3'})
+        ok = MagicMock(status_code=200)
+        mock_post.side_effect = [limited, ok]
+        
+        self.assertTrue(lambda_function.send_to_slack('Test message'))
+        mock_sleep.assert_called_once_with(3)
+        self.assertEqual(mock_post.call_count, 2)
+    
+    def test_build_slack_batches_splits_on_item_boundaries(self):
+        """Slack 배치 구성 테스트 - 블록 수 제한에 맞춰 뉴스 단위로 분할"""
+        summaries = [f'Summary {i}\nline' for i in range(30)]
+        
+        batches = lambda_function.build_slack_batches(summaries)
+        
+        self.assertEqual([count for _, count in batches], [25, 5])
+        for blocks, _ in batches:
+            self.assertLessEqual(len(blocks), lambda_function.SLACK_MAX_BLOCKS)
+        self.assertEqual(batches[1][0][0]['text']['text'], 'Summary 25\nline')
+    
+    def test_split_for_section(self):
+        """section 블록 분할 테스트 - 줄 단위 분할 및 긴 줄 강제 분할"""
+        chunks = lambda_function.split_for_section('aaaa\nbbbb\n' + 'c' * 12, limit=10)
+        self.assertEqual(chunks, ['aaaa\nbbbb', 'cccccccccc', 'cc'])
+    
+    @patch('lambda_function.send_batch_to_slack', return_value=2)
+    @patch('lambda_function.send_to_slack')
+    @patch('lambda_function.summarize_with_bedrock')
+    @patch('lambda_function.get_cached_summary', return_value=None)
+    @patch('lambda_function.save_cached_summary')
+    @patch('lambda_function.extract_main_text', return_value='Body')
+    def test_process_news_items_batch_delivery(self, mock_extract, mock_save_cache, mock_get_cache,
+                                               mock_summarize, mock_slack, mock_batch):
+        """뉴스 파이프라인 처리 테스트 - 배치 모드는 요약을 모아 한 번에 전송"""
+        items = [
+            {'title': 'News A', 'link': 'https://example.com/a', 'date': '2024-01-01'},
+            {'title': 'News B', 'link': 'https://example.com/b', 'date': '2024-01-01'}
+        ]
+        mock_summarize.side_effect = lambda title, *args: {'success': True, 'summary': f'{title} summary'}
+        
+        writer = MagicMock()
+        with patch.object(lambda_function, 'SLACK_DELIVERY_MODE', 'batch'):
+            stats = lambda_function.process_news_items(items, writer)
+        
+        mock_slack.assert_not_called()
+        mock_batch.assert_called_once_with(['News A summary', 'News B summary'])
+        self.assertEqual(stats['slack_success'], 2)
+        self.assertEqual(writer.add.call_count, 2)
+    
+    @patch('lambda_function.send_to_slack', return_value=True)
+    @patch('lambda_function.invoke_bedrock')
+    @patch('lambda_function.get_cached_summary', return_value=None)
+    @patch('lambda_function.save_cached_summary')
+    @patch('lambda_function.extract_main_text', return_value='Body')
+    def test_process_news_items_batch_summarization(self, mock_extract, mock_save_cache, mock_get_cache,
+                                                     mock_invoke, mock_slack):
+        """뉴스 파이프라인 처리 테스트 - 여러 뉴스를 한 번의 Bedrock 요청으로 요약"""
+        items = [
+            {'title': f'News {name}', 'link': f'https://example.com/{name}', 'date': '2024-01-01'}
+            for name in 'ABC'
+        ]
+        mock_invoke.return_value = ('[{"id": 1, "summary": "A"}, {"id": 2, "summary": "B"}, {"id": 3, "summary": "C"}]',
+                                    False)
+        
+        with patch.object(lambda_function, 'BEDROCK_BATCH_SIZE', 3):
+            stats = lambda_function.process_news_items(items, MagicMock())
+        
+        mock_invoke.assert_called_once()
+        self.assertEqual(stats['summary_success'], 3)
+        self.assertEqual([c.args[0] for c in mock_slack.call_args_list], ['A', 'B', 'C'])
+    
+    def test_summary_batch_planner_caps_batch_size(self):
+        """배치 요약 테스트 - BEDROCK_BATCH_SIZE가 출력 토큰 한도로 정한 최대값보다 크면 최대값으로 제한"""
+        submitted = []
+        main_texts = {index: 'Body' for index in range(6)}
+        items = [{'title': f'News {index}', 'link': f'https://example.com/{index}', 'date': '2024-01-01'}
+                 for index in range(6)]
+        
+        with patch.object(lambda_function, 'BEDROCK_BATCH_SIZE', 10):
+            planner = lambda_function.SummaryBatchPlanner(items, main_texts, {}, lambda_function.TimeBudget(),
+                                                          lambda indexes, articles: submitted.append(indexes))
+            for index in range(6):
+                planner.add(index)
+            planner.flush()
+        
+        self.assertEqual(planner.max_batch_size, lambda_function.BEDROCK_BATCH_SIZE_MAX)
+        self.assertEqual(submitted, [[0, 1, 2, 3], [4, 5]])
+    
+    @patch('lambda_function.get_http_session')
     @patch('feedparser.parse')
-    def test_get_rss_news_success(self, mock_parse):
+    def test_get_rss_news_success(self, mock_parse, mock_session):
         """RSS 뉴스 가져오기 테스트 - 성공"""
         mock_entry = MagicMock()
         mock_entry.title = 'Test News Title'
@@ -175,8 +914,9 @@ class TestLambdaFunction(unittest.TestCase):
         self.assertEqual(len(result), 1)
         self.assertEqual(result[0]['title'], 'Test News Title')
     
+    @patch('lambda_function.get_http_session')
     @patch('feedparser.parse')
-    def test_get_rss_news_empty(self, mock_parse):
+    def test_get_rss_news_empty(self, mock_parse, mock_session):
         """RSS 뉴스 가져오기 테스트 - 빈 결과"""
         mock_feed = MagicMock()
         mock_feed.entries = []
@@ -184,6 +924,418 @@ class TestLambdaFunction(unittest.TestCase):
         
         result = lambda_function.get_rss_news()
         self.assertEqual(len(result), 0)
+    
+    @patch('lambda_function.get_http_session')
+    @patch('feedparser.parse')
+    def test_get_rss_news_not_modified(self, mock_parse, mock_session):
+        """RSS 뉴스 가져오기 테스트 - 조건부 요청 304 응답 (feedparser 파싱 생략)"""
+        mock_session.return_value.get.return_value.status_code = 304
+        
+        result = lambda_function.get_rss_news({'etag': '"abc"', 'modified': 'Mon, 01 Jan 2024 00:00:00 GMT'})
+        
+        self.assertIsNone(result)
+        mock_session.return_value.get.assert_called_once_with(
+            lambda_function.RSS_FEED_URL,
+            headers={'If-None-Match': '"abc"', 'If-Modified-Since': 'Mon, 01 Jan 2024 00:00:00 GMT'},
+            timeout=lambda_function.REQUEST_TIMEOUT
+        )
+        mock_parse.assert_not_called()
+    
+    @patch('lambda_function.get_http_session')
+    @patch('feedparser.parse')
+    def test_get_rss_news_updates_feed_state(self, mock_parse, mock_session):
+        """RSS 뉴스 가져오기 테스트 - 응답 검증값으로 상태 갱신"""
+        mock_response = mock_session.return_value.get.return_value
+        mock_response.status_code = 200
+        mock_response.content = b'<rss></rss>'
+        mock_response.headers = {'ETag': '"new"'}
+        mock_feed = MagicMock()
+        mock_feed.entries = []
+        mock_parse.return_value = mock_feed
+        
+        feed_state = {}
+        lambda_function.get_rss_news(feed_state)
+        
+        self.assertEqual(feed_state, {'etag': '"new"', 'modified': None})
+        mock_session.return_value.get.assert_called_once_with(
+            lambda_function.RSS_FEED_URL, headers={}, timeout=lambda_function.REQUEST_TIMEOUT
+        )
+        mock_parse.assert_called_once_with(b'<rss></rss>')
+    
+    @patch('lambda_function.filter_new_news')
+    @patch('lambda_function.get_rss_news')
+    @patch('lambda_function.initialize_aws_clients')
+    @patch('lambda_function.table')
+    def test_lambda_handler_feed_not_modified(self, mock_table, mock_init, mock_get_rss, mock_filter):
+        """Lambda 핸들러 테스트 - 피드 변경이 없으면 즉시 종료"""
+        mock_table.get_item.return_value = {'Item': {'id': lambda_function.FEED_STATE_ID, 'etag': '"abc"'}}
+        mock_get_rss.return_value = None
+        
+        result = lambda_function.lambda_handler({}, None)
+        
+        self.assertEqual(result, {'statusCode': 200, 'body': 'Feed not modified'})
+        mock_get_rss.assert_called_once_with({'etag': '"abc"'}, lambda_function.RSS_FEED_URL)
+        mock_table.scan.assert_not_called()
+        mock_filter.assert_not_called()
+    
+    @patch('lambda_function.filter_new_news', side_effect=lambda items: items)
+    @patch('lambda_function.get_rss_news')
+    def test_collect_new_news_merges_feeds(self, mock_get_rss, mock_filter):
+        """다중 피드 테스트 - 피드별 상태로 조회, 피드 간 중복 제거, 새 피드는 기록만 수행"""
+        from datetime import datetime
+        blog_url, bulletin_url = 'https://example.com/blog/feed', 'https://example.com/bulletins/feed'
+        news = {'title': 'News', 'link': 'https://example.com/news/', 'date': '2024-01-02',
+                'datetime': datetime(2024, 1, 2)}
+        news_copy = dict(news, link='https://example.com/news?sc_channel=rss')
+        post = {'title': 'Post', 'link': 'https://example.com/post/', 'date': '2024-01-03',
+                'datetime': datetime(2024, 1, 3)}
+        bulletin = {'title': 'Bulletin', 'link': 'https://example.com/bulletin/', 'date': '2024-01-03',
+                    'datetime': datetime(2024, 1, 3)}
+        mock_get_rss.side_effect = lambda state, url: {
+            lambda_function.RSS_FEED_URL: [news], blog_url: [post, news_copy], bulletin_url: [bulletin]
+        }[url]
+        # 단일 피드 시절 최상위 상태와 이미 조회한 적 있는 블로그 피드 상태
+        feed_state = {
+            'etag': '"abc"', 'high_water_mark': '2024-01-01T00:00:00',
+            'feeds': {blog_url: {'high_water_mark': '2024-01-01T00:00:00'}},
+        }
+        writer = MagicMock()
+        
+        with patch.object(lambda_function, 'RSS_FEED_URLS', [lambda_function.RSS_FEED_URL, blog_url, bulletin_url]):
+            response, feed_news, new_items = lambda_function.collect_new_news(feed_state, writer)
+        
+        self.assertIsNone(response)
+        self.assertEqual([item['title'] for item in new_items], ['Post', 'News'])
+        self.assertEqual(feed_state['feeds'][lambda_function.RSS_FEED_URL]['etag'], '"abc"')
+        self.assertNotIn('etag', feed_state)
+        self.assertIn('initialized_at', feed_state)
+        writer.add.assert_called_once_with(lambda_function.generate_news_id(bulletin['link']), 'Bulletin',
+                                           bulletin['link'])
+        self.assertEqual(set(feed_news), {lambda_function.RSS_FEED_URL, blog_url, bulletin_url})
+    
+    @patch('lambda_function.filter_new_news')
+    @patch('lambda_function.is_initial_run', return_value=False)
+    @patch('lambda_function.save_feed_state')
+    @patch('lambda_function.get_rss_news')
+    @patch('lambda_function.load_feed_state', return_value={})
+    @patch('lambda_function.initialize_aws_clients')
+    @patch('lambda_function.dynamodb')
+    def test_poller_handler_enqueues_new_items(self, mock_dynamodb, mock_init, mock_load, mock_get_rss,
+                                               mock_save_state, mock_initial, mock_filter):
+        """fan-out poller 테스트 - 새 뉴스를 큐에 넣고 'queued' 상태로 기록"""
+        from datetime import datetime
+        item = {'title': 'News', 'link': 'https://example.com/a', 'date': '2024-01-01',
+                'datetime': datetime(2024, 1, 1)}
+        mock_get_rss.return_value = [item]
+        mock_filter.return_value = [item]
+        mock_dynamodb.batch_write_item.return_value = {'UnprocessedItems': {}}
+        queue = lambda_function.InMemoryQueue()
+        
+        with patch.object(lambda_function, 'news_queue', queue):
+            result = lambda_function.poller_handler({}, None)
+        
+        self.assertEqual(result['statusCode'], 200)
+        self.assertEqual(len(queue.messages), 1)
+        written = mock_dynamodb.batch_write_item.call_args[1]['RequestItems'][lambda_function.DYNAMODB_TABLE]
+        self.assertEqual(written[0]['PutRequest']['Item']['status'], 'queued')
+    
+    @patch('lambda_function.process_news_items')
+    @patch('lambda_function.is_news_queued')
+    @patch('lambda_function.initialize_aws_clients')
+    def test_worker_handler_processes_queue(self, mock_init, mock_queued, mock_process):
+        """fan-out worker 테스트 - 큐 메시지 처리 및 미룬 뉴스는 재전달 요청"""
+        from datetime import datetime
+        items = [
+            {'title': f'News {i}', 'link': f'https://example.com/{i}', 'date': '2024-01-01',
+             'datetime': datetime(2024, 1, 1)}
+            for i in range(3)
+        ]
+        queue = lambda_function.InMemoryQueue()
+        with patch.object(lambda_function, 'news_queue', queue):
+            lambda_function.enqueue_news_items(items)
+        # 두 번째 뉴스는 이미 처리됨
+        mock_queued.side_effect = lambda news_id: news_id != lambda_function.generate_news_id(items[1]['link'])
+        mock_process.side_effect = lambda news_items, writer, budget: {
+            'new': len(news_items), 'summary_success': 1, 'slack_success': 1, 'deferred': news_items[1:]
+        }
+        
+        result = lambda_function.worker_handler(queue.drain_worker_event(), None)
+        
+        processed = mock_process.call_args[0][0]
+        self.assertEqual([item['link'] for item in processed], [items[0]['link'], items[2]['link']])
+        self.assertEqual(result, {'batchItemFailures': [{'itemIdentifier': 'msg-2'}]})
+    
+    @patch('lambda_function.dynamodb')
+    @patch('lambda_function.save_feed_state')
+    @patch('lambda_function.send_to_slack', return_value=True)
+    @patch('lambda_function.extract_main_text')
+    def test_backfill_job_round_trip(self, mock_extract, mock_slack, mock_save_state, mock_dynamodb):
+        """백필 테스트 - 로컬 작업 서비스로 제출 후 다음 실행에서 결과 전송"""
+        import tempfile
+        mock_dynamodb.batch_get_item.return_value = {'Responses': {lambda_function.DYNAMODB_TABLE: [
+            {'id': lambda_function.generate_news_id('https://example.com/a'), 'status': 'backfill'}
+        ]}}
+        items = [
+            {'title': f'News {name.upper()}', 'link': f'https://example.com/{name}', 'date': '2024-01-01',
+             'datetime': lambda_function.datetime(2024, 1, 1)}
+            for name in 'ab'
+        ]
+        mock_extract.side_effect = lambda url: 'Body' if url.endswith('/a') else ''
+        
+        with tempfile.TemporaryDirectory() as directory:
+            service = lambda_function.LocalBatchJobService(directory)
+            feed_state, writer = {}, MagicMock()
+            with patch.object(lambda_function, 'batch_job_service', service):
+                remaining = lambda_function.start_backfill_job(items, feed_state, writer)
+                job_id = feed_state['backfill_job']['job_id']
+                
+                # 작업이 끝나기 전에는 결과를 기다림
+                self.assertIsNone(lambda_function.consume_backfill_job(feed_state, writer))
+                service.complete(job_id, lambda model_input: 'Summary A')
+                slack_success = lambda_function.consume_backfill_job(feed_state, writer)
+        
+        self.assertEqual(remaining, [items[1]])
+        writer.add.assert_any_call(lambda_function.generate_news_id('https://example.com/a'), 'News A',
+                                   'https://example.com/a', status='backfill')
+        writer.add.assert_called_with(lambda_function.generate_news_id('https://example.com/a'), 'News A',
+                                      'https://example.com/a', 'Summary A')
+        self.assertEqual(slack_success, 1)
+        mock_slack.assert_called_once_with('Summary A')
+        self.assertNotIn('backfill_job', feed_state)
+        mock_save_state.assert_called_once_with(feed_state)
+    
+    @patch('lambda_function.save_feed_state')
+    @patch('lambda_function.send_to_slack', return_value=True)
+    @patch('lambda_function.table')
+    def test_backfill_job_failure_requeues_items(self, mock_table, mock_slack, mock_save_state):
+        """백필 테스트 - 실패한 작업의 뉴스는 처리 기록을 지우고 미처리 목록으로 되돌림"""
+        from botocore.exceptions import ClientError
+        items = [
+            {'title': f'News {name.upper()}', 'link': f'https://example.com/{name}', 'date': '2024-01-01',
+             'datetime': lambda_function.datetime(2024, 1, 1)}
+            for name in 'ab'
+        ]
+        service = MagicMock()
+        service.get_status.return_value = 'Failed'
+        feed_state = {'backfill_job': {'job_id': 'job-1', 'items': lambda_function.serialize_pending_items(items)}}
+        # 두 번째 뉴스는 이미 실시간으로 처리되어 'backfill' 상태가 아님
+        mock_table.delete_item.side_effect = [
+            {}, ClientError({'Error': {'Code': 'ConditionalCheckFailedException'}}, 'DeleteItem')
+        ]
+        lambda_function.remember_processed_ids([lambda_function.generate_news_id(items[0]['link'])])
+        
+        with patch.object(lambda_function, 'batch_job_service', service):
+            slack_success = lambda_function.consume_backfill_job(feed_state, MagicMock())
+        
+        self.assertEqual(slack_success, 0)
+        mock_slack.assert_not_called()
+        service.read_outputs.assert_not_called()
+        self.assertNotIn('backfill_job', feed_state)
+        self.assertEqual(feed_state['pending_items'], lambda_function.serialize_pending_items(items[:1]))
+        self.assertEqual(len(lambda_function.recent_news_ids), 0)
+        mock_save_state.assert_called_once_with(feed_state)
+    
+    @patch('time.sleep')
+    @patch('lambda_function.save_feed_state')
+    @patch('lambda_function.send_to_slack', return_value=True)
+    @patch('lambda_function.dynamodb')
+    def test_backfill_job_skips_already_delivered(self, mock_dynamodb, mock_slack, mock_save_state, mock_sleep):
+        """백필 테스트 - 처리 기록이 'backfill' 상태가 아닌 뉴스는 오래된 작업 정보로 다시 전송하지 않음"""
+        items = [
+            {'title': f'News {name.upper()}', 'link': f'https://example.com/{name}', 'date': '2024-01-01',
+             'datetime': lambda_function.datetime(2024, 1, 1)}
+            for name in 'ab'
+        ]
+        ids = [lambda_function.generate_news_id(item['link']) for item in items]
+        service = MagicMock()
+        service.get_status.return_value = 'Completed'
+        service.read_outputs.return_value = [
+            {'recordId': news_id, 'modelOutput': {'content': [{'text': f'Summary {news_id}'}]}} for news_id in ids
+        ]
+        feed_state = {'backfill_job': {'job_id': 'job-1', 'items': lambda_function.serialize_pending_items(items)}}
+        # 첫 번째 뉴스는 다른 실행에서 이미 전송되어 요약과 함께 저장됨 (두 번째 뉴스는 UnprocessedKeys 재시도로 조회)
+        table_name = lambda_function.DYNAMODB_TABLE
+        mock_dynamodb.batch_get_item.side_effect = [
+            {'Responses': {table_name: [{'id': ids[0]}]}, 'UnprocessedKeys': {table_name: {'Keys': [{'id': ids[1]}]}}},
+            {'Responses': {table_name: [{'id': ids[1], 'status': 'backfill'}]}, 'UnprocessedKeys': {}},
+        ]
+        writer = MagicMock()
+        
+        with patch.object(lambda_function, 'batch_job_service', service):
+            slack_success = lambda_function.consume_backfill_job(feed_state, writer)
+        
+        self.assertEqual(slack_success, 1)
+        mock_slack.assert_called_once_with(f'Summary {ids[1]}')
+        writer.add.assert_called_once_with(ids[1], 'News B', 'https://example.com/b', f'Summary {ids[1]}')
+        first_request = mock_dynamodb.batch_get_item.call_args_list[0][1]['RequestItems'][table_name]
+        self.assertEqual(first_request['Keys'], [{'id': news_id} for news_id in ids])
+        self.assertTrue(first_request['ConsistentRead'])
+        self.assertEqual(mock_dynamodb.batch_get_item.call_count, 2)
+    
+    def test_get_batch_job_service_validates_config(self):
+        """백필 테스트 - s3:// 입출력 위치가 없거나 최소 레코드 수보다 작은 설정은 설정 오류"""
+        with patch.object(lambda_function, 'batch_job_service', None):
+            with patch.object(lambda_function, 'BACKFILL_JOB_URI', ''):
+                with self.assertRaises(ValueError):
+                    lambda_function.get_batch_job_service()
+            with patch.object(lambda_function, 'BACKFILL_JOB_URI', 's3://bucket/backfill'), \
+                    patch.object(lambda_function, 'BACKFILL_ROLE_ARN', 'arn:aws:iam::123456789012:role/backfill'), \
+                    patch.object(lambda_function, 'BACKFILL_MAX_ITEMS', 20), \
+                    patch.object(lambda_function, 'BACKFILL_MIN_RECORDS', 100):
+                with self.assertRaises(ValueError):
+                    lambda_function.get_batch_job_service()
+    
+    @patch('lambda_function.save_feed_state')
+    @patch('lambda_function.is_initial_run', return_value=True)
+    @patch('lambda_function.fetch_feeds')
+    def test_initial_run_backfill_not_submitted_records_only(self, mock_fetch, mock_initial, mock_save_state):
+        """백필 테스트 - 초기 실행에서 작업을 제출하지 못한 뉴스는 기록만 하고 알림 대상으로 반환하지 않음"""
+        items = [
+            {'title': f'News {name.upper()}', 'link': f'https://example.com/{name}', 'date': '2024-01-01',
+             'datetime': lambda_function.datetime(2024, 1, 1)}
+            for name in 'ab'
+        ]
+        mock_fetch.return_value = {lambda_function.RSS_FEED_URL: items}
+        service = MagicMock(min_records=100)
+        feed_state, writer = {}, MagicMock()
+        
+        with patch.object(lambda_function, 'BACKFILL_MODE', 'batch'), \
+                patch.object(lambda_function, 'batch_job_service', service):
+            response, _, new_items = lambda_function.collect_new_news(feed_state, writer)
+        
+        self.assertEqual(response['body'], 'Initial run completed - recorded 2 news items')
+        self.assertEqual(new_items, [])
+        service.submit.assert_not_called()
+        self.assertNotIn('backfill_job', feed_state)
+        self.assertEqual(writer.add.call_count, 2)
+        writer.add.assert_any_call(lambda_function.generate_news_id(items[0]['link']), 'News A', items[0]['link'])
+    
+    @patch('lambda_function.extract_main_text')
+    def test_start_backfill_job_below_min_records(self, mock_extract):
+        """백필 테스트 - 작업당 최소 레코드 수보다 적으면 제출하지 않고 실시간 처리로 반환"""
+        items = [{'title': 'News', 'link': 'https://example.com/a', 'date': '2024-01-01',
+                  'datetime': lambda_function.datetime(2024, 1, 1)}]
+        service = MagicMock(min_records=100)
+        feed_state = {}
+        
+        with patch.object(lambda_function, 'batch_job_service', service):
+            remaining = lambda_function.start_backfill_job(items, feed_state, MagicMock())
+        
+        self.assertEqual(remaining, items)
+        service.submit.assert_not_called()
+        mock_extract.assert_not_called()
+        self.assertNotIn('backfill_job', feed_state)
+    
+    def test_parse_batch_inference_outputs_skips_errors(self):
+        """백필 테스트 - 오류 레코드는 요약 결과에서 제외"""
+        records = [
+            {'recordId': 'a', 'modelOutput': {'content': [{'type': 'text', 'text': 'Summary'}]}},
+            {'recordId': 'b', 'error': {'errorMessage': 'ValidationException'}},
+        ]
+        self.assertEqual(lambda_function.parse_batch_inference_outputs(records), {'a': 'Summary'})
+    
+    @patch('asyncio.sleep')
+    def test_send_to_slack_async_retries_rate_limit(self, mock_sleep):
+        """asyncio Slack 전송 테스트 - aiohttp 세션으로 429 응답 후 재시도"""
+        import asyncio
+        limited = MagicMock(status=429, headers={'Retry-After': '2'})
+        ok = MagicMock(status=200)
+        contexts = [MagicMock(), MagicMock()]
+        for context, response in zip(contexts, (limited, ok)):
+            context.__aenter__.return_value = response
+        session = MagicMock()
+        session.post.side_effect = contexts
+        
+        result = asyncio.run(lambda_function.send_to_slack_async(session, 'Test message'))
+        
+        self.assertTrue(result)
+        self.assertEqual(session.post.call_count, 2)
+        mock_sleep.assert_called_once_with(2)
+        session.post.assert_called_with(lambda_function.SLACK_WEBHOOK, json={'text': 'Test message'})
+    
+    def fake_async_session(self, pages):
+        """aiohttp 세션 가짜 구현 (pages: URL → 응답 상태 목록과 본문, Slack 전송은 항상 성공)"""
+        def get(url):
+            status = pages[url]['statuses'].pop(0)
+            response = MagicMock(status=status)
+            response.read = AsyncMock(return_value=pages[url]['body'])
+            if status >= 400:
+                response.raise_for_status.side_effect = Exception(f'HTTP {status}')
+            context = MagicMock()
+            context.__aenter__.return_value = response
+            return context
+        
+        slack_context = MagicMock()
+        slack_context.__aenter__.return_value = MagicMock(status=200)
+        session = MagicMock()
+        session.get.side_effect = get
+        session.post.return_value = slack_context
+        return session
+    
+    @patch('asyncio.sleep')
+    @patch('lambda_function.parse_main_text', side_effect=lambda content, url: content.decode())
+    def test_extract_main_text_async_retries_server_error(self, mock_parse, mock_sleep):
+        """asyncio 본문 추출 테스트 - aiohttp 세션으로 5xx 응답 후 재시도, 실패하면 빈 본문"""
+        import asyncio
+        session = self.fake_async_session({
+            'https://example.com/a': {'statuses': [503, 200], 'body': b'Body'},
+            'https://example.com/b': {'statuses': [404], 'body': b''},
+        })
+        
+        self.assertEqual(asyncio.run(lambda_function.extract_main_text_async(session, 'https://example.com/a')), 'Body')
+        self.assertEqual(asyncio.run(lambda_function.extract_main_text_async(session, 'https://example.com/b')), '')
+        
+        self.assertEqual(session.get.call_count, 3)
+        mock_sleep.assert_called_once_with(0.5)
+        mock_parse.assert_called_once_with(b'Body', 'https://example.com/a')
+    
+    @patch('lambda_function.save_cached_summary')
+    @patch('lambda_function.get_cached_summary', return_value=None)
+    @patch('lambda_function.send_to_slack')
+    @patch('lambda_function.summarize_with_bedrock')
+    @patch('lambda_function.extract_main_text')
+    @patch('lambda_function.parse_main_text', side_effect=lambda content, url: content.decode())
+    def test_process_news_items_async_uses_session(self, mock_parse, mock_extract, mock_summarize, mock_slack,
+                                                   mock_get_cache, mock_save_cache):
+        """asyncio 파이프라인 테스트 - aiohttp 세션으로 페이지 수신과 Slack 전송"""
+        from contextlib import asynccontextmanager
+        items = [
+            {'title': f'News {name.upper()}', 'link': f'https://example.com/{name}', 'date': '2024-01-01'}
+            for name in 'ab'
+        ]
+        session = self.fake_async_session({
+            'https://example.com/a': {'statuses': [200], 'body': b'Body A'},
+            'https://example.com/b': {'statuses': [200], 'body': b''},
+        })
+        mock_summarize.return_value = {'success': True, 'summary': 'Summary A'}
+        
+        @asynccontextmanager
+        async def open_session():
+            yield session
+        
+        writer = MagicMock()
+        with patch.object(lambda_function, 'EXECUTION_MODE', 'async'), \
+                patch.object(lambda_function, 'open_async_session', open_session):
+            stats = lambda_function.process_news_items(items, writer)
+        
+        self.assertEqual(stats, {'new': 2, 'summary_success': 1, 'slack_success': 1, 'deferred': []})
+        mock_extract.assert_not_called()
+        mock_slack.assert_not_called()
+        session.post.assert_called_once_with(lambda_function.SLACK_WEBHOOK, json={'text': 'Summary A'})
+        writer.add.assert_any_call(lambda_function.generate_news_id(items[1]['link']), 'News B', items[1]['link'])
+        writer.add.assert_any_call(lambda_function.generate_news_id(items[0]['link']), 'News A', items[0]['link'],
+                                   'Summary A')
+
+
+class TestAsyncExecutionMode(TestLambdaFunction):
+    """EXECUTION_MODE=async에서 같은 테스트 실행 (aiohttp 없이 asyncio.to_thread 경로, aiohttp 세션 경로는 fake_async_session으로 따로 테스트)"""
+    
+    def setUp(self):
+        super().setUp()
+        for patcher in (patch.object(lambda_function, 'EXECUTION_MODE', 'async'),
+                        patch.dict(sys.modules, {'aiohttp': None})):
+            patcher.start()
+            self.addCleanup(patcher.stop)
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file